@@ -0,0 +1,30 @@
+from wild.program import CompiledProgram
+
+import contextlib
+import io
+import time
+
+SOURCE: str = """
+Int main() {
+    String report = "";
+    for (Int i = 0; i < %d; i++) {
+        report += "row;";
+    }
+    print(report.length());
+    return 0;
+}
+"""
+
+def main() -> None:
+    for iterations in (25_000, 50_000, 100_000):
+        program: CompiledProgram = CompiledProgram.from_source(SOURCE % iterations)
+
+        start: float = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            program.run()
+        elapsed: float = time.perf_counter() - start
+
+        print(f"{iterations:>7} concatenations: {elapsed:.3f}s ({elapsed / iterations * 1e6:.2f} us each)")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
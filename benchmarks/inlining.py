@@ -0,0 +1,46 @@
+from wild.optimizer import INLINE_THRESHOLD
+from wild.output import Output
+from wild.program import CompiledProgram
+
+import time
+
+SOURCE: str = """
+Int square(Int x) { return x * x; }
+Int clamp(Int value, Int limit) { return value %% limit; }
+Int mix(Int a, Int b) { return clamp(square(a) + square(b), 1000003); }
+Float scale(Float value) { return value * 0.5 + 1.0; }
+
+Int main() {
+    Int hash = 0;
+    Float level = 0.0;
+
+    for (Int i = 0; i < %d; i++) {
+        hash = mix(hash, i);
+        level = scale(level);
+    }
+
+    print(hash);
+    return 0;
+}
+"""
+
+def measure(source: str, threshold: int) -> tuple[float, str]:
+    program: CompiledProgram = CompiledProgram.from_source(source, threshold)
+    output: Output = Output()
+
+    start: float = time.perf_counter()
+    program.run(output=output)
+
+    return time.perf_counter() - start, output.getvalue().decode()
+
+def main() -> None:
+    for iterations in (10_000, 20_000, 40_000):
+        source: str = SOURCE % iterations
+        called, expected = measure(source, 0)
+        inlined, actual = measure(source, INLINE_THRESHOLD)
+
+        assert actual == expected
+        print(f"{iterations:>6} iterations: {called:.3f}s called, {inlined:.3f}s inlined ({called / inlined:.2f}x)")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
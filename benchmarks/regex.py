@@ -0,0 +1,67 @@
+from wild.program import CompiledProgram
+
+import contextlib
+import io
+import time
+
+# Counts the words starting with "w" followed by digits, once by hand and once with a pattern.
+MANUAL: str = """
+Int main() {
+    String rest = text;
+    String digitChars = "0123456789";
+    Int words = 0;
+    Int at = rest.find(" ");
+
+    while at >= 0 {
+        String word = rest.substring(0, at);
+        if word.startsWith("w") && word.length() > 1 {
+            String digits = word.substring(1, word.length());
+            Int index = 0;
+            Boolean numeric = true;
+
+            while index < digits.length() {
+                if digitChars.find(digits.substring(index, 1)) < 0 {
+                    numeric = false;
+                }
+                index++;
+            }
+
+            if numeric {
+                words++;
+            }
+        }
+
+        rest = rest.substring(at + 1, rest.length());
+        at = rest.find(" ");
+    }
+
+    print(words);
+    return 0;
+}
+"""
+
+PATTERN: str = """
+Int main() {
+    print(text.findAll("(?<!\\S)w\\d+(?= )").size());
+    return 0;
+}
+"""
+
+def measure(program: CompiledProgram, text: str) -> float:
+    start: float = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        program.run({"text": text})
+
+    return time.perf_counter() - start
+
+def main() -> None:
+    manual: CompiledProgram = CompiledProgram.from_source(MANUAL)
+    pattern: CompiledProgram = CompiledProgram.from_source(PATTERN)
+
+    for words in (2_000, 4_000, 8_000):
+        text: str = " ".join(f"w{index}" if index % 3 else f"x{index}" for index in range(words)) + " "
+
+        print(f"{words:>6} words: find/substring {measure(manual, text):.3f}s, findAll {measure(pattern, text):.3f}s")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
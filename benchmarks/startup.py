@@ -0,0 +1,79 @@
+from pathlib import Path
+
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Cold start of `python -m wild.executable` on a trivial script, minus bare interpreter startup.
+STARTUP_BUDGET_MS: float = 25.0
+RUNS: int = 15
+
+SCRIPT: str = """
+Int main() {
+    print("hello");
+    return 0;
+}
+"""
+
+def median_ms(command: list[str]) -> float:
+    samples: list[float] = []
+
+    for _ in range(RUNS):
+        start: float = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    return statistics.median(samples)
+
+def import_report(script: str, limit: int = 12) -> list[tuple[int, int, str]]:
+    """
+    Parse `-X importtime` output into (self us, cumulative us, module) rows, slowest first.
+
+    Only imports made after `site` finished are kept, since those are the ones
+    running a Wild script adds.
+    """
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "wild.executable", script],
+        check=True, capture_output=True, text=True,
+    )
+    rows: list[tuple[int, int, str]] = []
+
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        own, cumulative, module = line.removeprefix("import time:").split("|")
+        if module.strip() == "site":
+            rows.clear()
+            continue
+
+        rows.append((int(own), int(cumulative), module.rstrip()))
+
+    return sorted(rows, reverse=True)[:limit]
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        script: Path = Path(directory) / "hello.wild"
+        script.write_text(SCRIPT)
+
+        # Populates __pycache__ so every measured run is a warm-disk cold start.
+        subprocess.run([sys.executable, "-m", "wild.executable", str(script)], check=True, capture_output=True)
+
+        baseline: float = median_ms([sys.executable, "-c", "pass"])
+        wild: float = median_ms([sys.executable, "-m", "wild.executable", str(script)])
+        overhead: float = wild - baseline
+
+        print(f"python -c pass      {baseline:7.1f} ms")
+        print(f"wild.executable     {wild:7.1f} ms")
+        print(f"startup overhead    {overhead:7.1f} ms (budget {STARTUP_BUDGET_MS:.0f} ms: {'ok' if overhead <= STARTUP_BUDGET_MS else 'OVER'})")
+        print()
+        print(f"{'self us':>9} {'cumul us':>9}  module")
+
+        for own, cumulative, module in import_report(str(script)):
+            print(f"{own:>9} {cumulative:>9}  {module}")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
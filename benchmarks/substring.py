@@ -0,0 +1,46 @@
+from wild.program import CompiledProgram
+
+import contextlib
+import io
+import time
+import tracemalloc
+
+SOURCE: str = """
+Int main() {
+    String rest = text;
+    Int words = 0;
+    Int at = rest.find(" ");
+
+    while at >= 0 {
+        String word = rest.substring(0, at).trim();
+        if word.startsWith("w") {
+            words++;
+        }
+
+        rest = rest.substring(at + 1, rest.length());
+        at = rest.find(" ");
+    }
+
+    print(words);
+    return 0;
+}
+"""
+
+def main() -> None:
+    program: CompiledProgram = CompiledProgram.from_source(SOURCE)
+
+    for words in (10_000, 20_000, 40_000):
+        text: str = " ".join(f"w{index}" for index in range(words)) + " "
+
+        tracemalloc.start()
+        start: float = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            program.run({"text": text})
+        elapsed: float = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"{len(text):>9} chars: {elapsed:.3f}s, peak {peak / 1024:.0f} KiB above input")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
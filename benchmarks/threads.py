@@ -0,0 +1,48 @@
+from wild.output import Output
+from wild.program import CompiledProgram
+from concurrent.futures import ThreadPoolExecutor
+
+import sys
+import time
+
+SOURCE: str = """
+Int fib(Int n) {
+    if n < 2 {
+        return n;
+    }
+    return fib(n - 1) + fib(n - 2);
+}
+
+Int main() {
+    String label = "fib";
+    print(label + ": " + "done");
+    return fib(15);
+}
+"""
+
+RUNS: int = 64
+
+def run(program: CompiledProgram) -> int:
+    # Each run gets its own interpreter and captured output; only the compiled program is shared.
+    return program.run(output=Output())
+
+def main() -> None:
+    program: CompiledProgram = CompiledProgram.from_source(SOURCE)
+    gil: bool = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}, {RUNS} runs per row")
+
+    baseline: float | None = None
+    for threads in (1, 2, 4, 8):
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            start: float = time.perf_counter()
+            results: list[int] = list(executor.map(run, [program] * RUNS))
+            elapsed: float = time.perf_counter() - start
+
+        assert all(result == results[0] for result in results)
+
+        throughput: float = RUNS / elapsed
+        baseline = baseline or throughput
+        print(f"{threads} thread{'s' if threads != 1 else ' '}: {throughput:7.1f} runs/s ({throughput / baseline:.2f}x)")
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
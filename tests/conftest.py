@@ -0,0 +1,19 @@
+from wild.output import Output
+from wild.program import CompiledProgram
+from typing import Any, Callable
+
+import pytest
+
+Runner = Callable[..., tuple[int, str]]
+
+@pytest.fixture
+def run() -> Runner:
+    """Compile and run a Wild source, returning its exit code and everything it printed."""
+
+    def run(source: str, **kwargs: Any) -> tuple[int, str]:
+        output: Output = Output()
+        exit_code: int = CompiledProgram.from_source(source).run(output=output, **kwargs)
+
+        return exit_code, output.getvalue().decode()
+
+    return run
\ No newline at end of file
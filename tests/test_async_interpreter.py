@@ -0,0 +1,158 @@
+from wild.async_interpreter import AsyncInterpreter
+from wild.errors import CallError
+from wild.natives.base import NativeFunction
+from wild.nodes.base import ASTNode
+from wild.nodes.statement import For, If, While
+from wild.output import Output
+from wild.program import CompiledProgram
+from wild.type.base import RuntimeType
+from wild.type.empty import Void
+from wild.type.numeric import Integer
+
+import asyncio
+import pytest
+
+COUNTER: str = """
+Int main() {
+    Int i = 0;
+    while i < 5 {
+        tick(i);
+        i++;
+    }
+    return i;
+}
+"""
+
+def run_async(source: str, **kwargs: object) -> tuple[int, str]:
+    output: Output = Output()
+    interpreter: AsyncInterpreter = AsyncInterpreter(output=output, **kwargs)
+    exit_code: int = asyncio.run(interpreter.run(CompiledProgram.from_source(source).program))
+
+    return exit_code, output.getvalue().decode()
+
+def test_runs_program():
+    source: str = """
+    Int square(Int x) {
+        Int y = x * x;
+        return y;
+    }
+
+    Int main() {
+        for (Int i = 1; i < 4; i++) {
+            print(square(i));
+        }
+        return 7;
+    }
+    """
+
+    assert run_async(source) == (7, "1\n4\n9\n")
+
+def test_not_negates_booleans(run):
+    source: str = """
+    Int main() {
+        Boolean flag = false;
+        if !flag {
+            print("negated");
+        }
+        print(!(1 < 2));
+        return 0;
+    }
+    """
+
+    assert run_async(source) == (0, "negated\nFalse\n")
+    assert run(source) == (0, "negated\nFalse\n")
+
+def test_runs_interleave_on_one_loop():
+    ticks: list[tuple[str, int]] = []
+
+    def ticker(name: str) -> NativeFunction:
+        async def tick(_: AsyncInterpreter, arguments: list[RuntimeType]) -> Void:
+            ticks.append((name, arguments[0].value))
+            await asyncio.sleep(0)
+            return Void()
+
+        return NativeFunction(1, tick)
+
+    async def both() -> list[int]:
+        program = CompiledProgram.from_source(COUNTER).program
+        runs = [
+            AsyncInterpreter(natives={"tick": ticker(name)}, output=Output(), yield_interval=1).run(program)
+            for name in ("a", "b")
+        ]
+
+        return await asyncio.gather(*runs)
+
+    assert asyncio.run(both()) == [5, 5]
+    assert sorted(ticks) == [(name, index) for name in "ab" for index in range(5)]
+    assert [name for name, _ in ticks[:2]] == ["a", "b"]
+
+def test_async_native_needs_async_interpreter(run):
+    async def tick(_: AsyncInterpreter, arguments: list[RuntimeType]) -> Integer:
+        return Integer(0)
+
+    with pytest.raises(CallError, match="asynchronous"):
+        run(COUNTER, natives={"tick": NativeFunction(1, tick)})
+
+def test_suspension_cache_stays_off_the_tree():
+    program = CompiledProgram.from_source(COUNTER).program
+    interpreter: AsyncInterpreter = AsyncInterpreter(natives={"tick": NativeFunction(1, lambda _, __: Void())}, output=Output())
+    asyncio.run(interpreter.run(program))
+
+    pending: list[ASTNode] = [program]
+    while pending:
+        node: ASTNode = pending.pop()
+        assert "_suspends" not in vars(node)
+        pending.extend(node.children())
+
+    assert interpreter.suspending[program] is True
+
+def test_conditions_go_through_the_hook():
+    decided: list[tuple[str, bool]] = []
+
+    class Recorder(AsyncInterpreter):
+        def condition(self, node: If | For | While, value: RuntimeType) -> bool:
+            taken: bool = super().condition(node, value)
+            decided.append((type(node).__name__, taken))
+
+            return taken
+
+    source: str = """
+    Int main() {
+        Map seen = Map();
+        while seen.size() < 2 {
+            seen.put(seen.size(), true);
+        }
+        for (Int i = 0; i < 1; i++) {
+            if seen.contains(i) {
+                print(i);
+            }
+        }
+        return 0;
+    }
+    """
+    output: Output = Output()
+    asyncio.run(Recorder(output=output).run(CompiledProgram.from_source(source).program))
+
+    assert output.getvalue() == b"0\n"
+    assert decided == [("While", True), ("While", True), ("While", False), ("For", True), ("If", True), ("For", False)]
+
+def test_method_calls_are_checkpoints():
+    checkpoints: list[int] = []
+
+    class Counter(AsyncInterpreter):
+        async def checkpoint(self) -> None:
+            checkpoints.append(1)
+            await super().checkpoint()
+
+    source: str = """
+    Int main() {
+        Map seen = Map();
+        seen.put(1, 2);
+        seen.put(3, 4);
+        return seen.size();
+    }
+    """
+
+    assert asyncio.run(Counter(output=Output()).run(CompiledProgram.from_source(source).program)) == 2
+    # One for the call to `Map`, one for each method call.
+    assert len(checkpoints) == 4
\ No newline at end of file
@@ -0,0 +1,45 @@
+from wild.batch import BatchResult, expand_paths, main, run_batch, run_file
+from wild.budget import Budget
+
+import pathlib
+import pytest
+
+@pytest.fixture
+def scripts(tmp_path: pathlib.Path) -> pathlib.Path:
+    for index in range(3):
+        (tmp_path / f"ok{index}.wild").write_text(f"Int main() {{ print({index}); return {index}; }}")
+
+    (tmp_path / "broken.wild").write_text("Int main() { print(1); return undefined; }")
+    return tmp_path
+
+def test_run_file_captures_output_and_exit_code(scripts: pathlib.Path):
+    assert run_file(str(scripts / "ok2.wild")) == BatchResult(str(scripts / "ok2.wild"), 2, "2\n")
+
+def test_run_file_reports_errors_with_partial_output(scripts: pathlib.Path):
+    result: BatchResult = run_file(str(scripts / "broken.wild"))
+
+    assert result.exit_code is None
+    assert result.stdout == "1\n"
+    assert result.error.startswith("InterpreterError")
+
+def test_run_file_applies_budget(tmp_path: pathlib.Path):
+    (tmp_path / "spin.wild").write_text("Int main() { while true { } return 0; }")
+    result: BatchResult = run_file(str(tmp_path / "spin.wild"), Budget(steps=1000))
+
+    assert result.error.startswith("BudgetError")
+
+def test_expand_paths_keeps_order_and_unmatched_patterns(scripts: pathlib.Path):
+    paths: list[str] = expand_paths([str(scripts / "ok*.wild"), str(scripts / "missing.wild")])
+
+    assert paths == [str(scripts / f"ok{index}.wild") for index in range(3)] + [str(scripts / "missing.wild")]
+
+def test_run_batch_returns_results_in_input_order(scripts: pathlib.Path):
+    results: list[BatchResult] = run_batch([str(scripts / "*.wild")], workers=2)
+
+    assert [pathlib.Path(result.path).name for result in results] == ["broken.wild", "ok0.wild", "ok1.wild", "ok2.wild"]
+    assert [result.exit_code for result in results] == [None, 0, 1, 2]
+
+def test_main_exit_status(scripts: pathlib.Path, capsys: pytest.CaptureFixture[str]):
+    assert main(["batch", str(scripts / "ok*.wild")]) == 0
+    assert main(["batch", "-q", str(scripts / "broken.wild")]) == 1
+    assert "1 script, 1 failed" in capsys.readouterr().out
\ No newline at end of file
@@ -0,0 +1,56 @@
+from wild.budget import Budget
+from wild.errors import BudgetError
+
+import pytest
+
+LOOP: str = """
+Int main() {
+    Int i = 0;
+    while i < count {
+        i++;
+    }
+    return i;
+}
+"""
+
+RECURSION: str = """
+Int down(Int n) {
+    if n == 0 {
+        return 0;
+    }
+    return down(n - 1) + 1;
+}
+
+Int main() {
+    return down(depth);
+}
+"""
+
+def test_run_within_step_budget(run):
+    assert run(LOOP, inputs={"count": 50}, budget=Budget(steps=100)) == (50, "")
+
+def test_step_budget_stops_loop(run):
+    with pytest.raises(BudgetError, match="Step budget of 100"):
+        run(LOOP, inputs={"count": 1000}, budget=Budget(steps=100))
+
+def test_step_budget_is_exact_with_large_interval(run):
+    # Loop back-edges plus the call to main.
+    assert run(LOOP, inputs={"count": 99}, budget=Budget(steps=100, check_interval=4096))[0] == 99
+
+    with pytest.raises(BudgetError):
+        run(LOOP, inputs={"count": 100}, budget=Budget(steps=100, check_interval=4096))
+
+def test_time_budget_stops_infinite_loop(run):
+    source: str = "Int main() { while true { } return 0; }"
+
+    with pytest.raises(BudgetError, match="Time budget"):
+        run(source, budget=Budget(seconds=0.05, check_interval=64))
+
+def test_depth_budget_limits_recursion(run):
+    assert run(RECURSION, inputs={"depth": 20}, budget=Budget(depth=30))[0] == 20
+
+    with pytest.raises(BudgetError, match="Recursion budget of 30"):
+        run(RECURSION, inputs={"depth": 40}, budget=Budget(depth=30))
+
+def test_unlimited_by_default(run):
+    assert run(LOOP, inputs={"count": 5000})[0] == 5000
\ No newline at end of file
@@ -0,0 +1,57 @@
+from wild.async_interpreter import AsyncInterpreter
+from wild.output import Output
+from wild.program import CompiledProgram
+
+import asyncio
+import pytest
+
+SOURCE: str = """
+Boolean seen(String name, Boolean value) {
+    print(name);
+    return value;
+}
+
+Int main() {
+    print(seen("a", false) && seen("b", true));
+    print(seen("c", true) && seen("d", false));
+    print(seen("e", true) || seen("f", false));
+    print(seen("g", false) || seen("h", true));
+    print(false or false);
+    print(true and true);
+    return 0;
+}
+"""
+
+EXPECTED: str = "a\nFalse\nc\nd\nFalse\ne\nTrue\ng\nh\nTrue\nFalse\nTrue\n"
+
+def test_short_circuits(run):
+    assert run(SOURCE) == (0, EXPECTED)
+
+def test_async_short_circuits():
+    output: Output = Output()
+    interpreter: AsyncInterpreter = AsyncInterpreter(output=output)
+
+    assert asyncio.run(interpreter.run(CompiledProgram.from_source(SOURCE).program)) == 0
+    assert output.getvalue().decode() == EXPECTED
+
+@pytest.mark.parametrize(("condition", "expected"), [
+    ("i < 3 && values.get(i) > 0", "0\n1\n2\n"),
+    ("i >= 3 || values.get(i) > 0", "0\n1\n2\n3\n4\n"),
+])
+def test_guards_skip_the_right_operand(run, condition: str, expected: str):
+    source: str = f"""
+    Int main() {{
+        Map values = Map();
+        for (Int i = 0; i < 3; i++) {{
+            values.put(i, i + 1);
+        }}
+        for (Int i = 0; i < 5; i++) {{
+            if {condition} {{
+                print(i);
+            }}
+        }}
+        return 0;
+    }}
+    """
+
+    assert run(source) == (0, expected)
\ No newline at end of file
@@ -0,0 +1,114 @@
+from wild.errors import ArgumentTypeError, SubscriptError
+from wild.type.map import Map
+from wild.type.numeric import Integer
+from wild.type.strings import String
+
+import pytest
+
+def test_put_get_and_remove(run):
+    source: str = """
+    Int main() {
+        Map ages = Map();
+        ages.put("ada", 36);
+        ages.put("alan", 41);
+        print(ages.get("ada"));
+        print(ages.get("grace") == null);
+        print(ages.getOrDefault("grace", 0));
+        print(ages.contains("alan"));
+        print(ages.remove("alan"));
+        print(ages.remove("alan"));
+        print(ages.size());
+        ages.clear();
+        print(ages.isEmpty());
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "36\nTrue\n0\nTrue\nTrue\nFalse\n1\nTrue\n")
+
+def test_keys_keep_their_type(run):
+    source: str = """
+    Int main() {
+        Map keys = Map();
+        keys.put(1, "int");
+        keys.put(1.0, "float");
+        keys.put(true, "boolean");
+        keys.put("1", "string");
+        print(keys.size());
+        print(keys.get(1.0));
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "4\nfloat\n")
+
+def test_iterates_in_insertion_order(run):
+    source: str = """
+    Int main() {
+        Map counts = Map();
+        counts.put("b", 2);
+        counts.put("a", 1);
+        Map more = Map();
+        more.put("c", 3);
+        counts.putAll(more);
+        for (Int i = 0; i < counts.size(); i++) {
+            print(counts.keyAt(i));
+            print(counts.valueAt(i));
+        }
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "b\n2\na\n1\nc\n3\n")
+
+def test_overwrite_refreshes_positional_access(run):
+    source: str = """
+    Int main() {
+        Map values = Map();
+        values.put("a", 1);
+        print(values.valueAt(0));
+        values.put("a", 2);
+        print(values.valueAt(0));
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "1\n2\n")
+
+def test_maps_are_equal_only_to_themselves(run):
+    source: str = """
+    Int main() {
+        Map a = Map();
+        Map b = Map();
+        if a == a {
+            print("same");
+        }
+        print(a == b);
+        print(a != b);
+        print(a == 1);
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "same\nFalse\nTrue\nFalse\n")
+
+def test_rejects_unhashable_keys_and_bad_indexes():
+    values: Map = Map()
+
+    with pytest.raises(ArgumentTypeError, match="Map keys"):
+        Map._put(None, values, [Map(), Integer(1)])
+
+    Map._put(None, values, [String("a"), Integer(1)])
+
+    with pytest.raises(SubscriptError, match="out of range"):
+        Map._valueAt(None, values, [Integer(1)])
+
+def test_copy_is_deep_for_nested_maps():
+    inner: Map = Map()
+    outer: Map = Map()
+    Map._put(None, outer, [String("inner"), inner])
+
+    copied: Map = outer.copy()
+    Map._put(None, inner, [String("x"), Integer(1)])
+
+    assert Map._get(None, copied, [String("inner")]).value == {}
\ No newline at end of file
@@ -0,0 +1,81 @@
+from wild.async_interpreter import AsyncInterpreter
+from wild.errors import CallError
+from wild.natives.base import NativeFunction, is_coroutine_function
+from wild.output import Output
+from wild.program import CompiledProgram
+from wild.type.base import RuntimeType
+from wild.type.boolean import Boolean
+from wild.type.empty import Null, Void
+from wild.type.numeric import Float, Integer
+
+import asyncio
+import functools
+import pytest
+
+SOURCE: str = "Int main() { return offset(2); }"
+
+async def add(amount: int, _: object, arguments: list[RuntimeType]) -> Integer:
+    await asyncio.sleep(0)
+    return Integer(arguments[0].value + amount)
+
+class Adder:
+    async def __call__(self, _: object, arguments: list[RuntimeType]) -> Integer:
+        return Integer(arguments[0].value + 1)
+
+def plain(_: object, arguments: list[RuntimeType]) -> Integer:
+    return arguments[0]
+
+@pytest.mark.parametrize(("func", "expected"), [
+    (add, True),
+    (functools.partial(add, 40), True),
+    (functools.partial(functools.partial(add, 40)), True),
+    (Adder(), True),
+    (plain, False),
+    (functools.partial(plain), False),
+    (len, False),
+])
+def test_detects_coroutine_functions(func: object, expected: bool):
+    assert is_coroutine_function(func) is expected
+
+def test_async_partial_needs_an_async_interpreter():
+    with pytest.raises(CallError, match="asynchronous"):
+        CompiledProgram.from_source(SOURCE).run(natives={"offset": NativeFunction(1, functools.partial(add, 40))}, output=Output())
+
+@pytest.mark.parametrize(("func", "expected"), [(functools.partial(add, 40), 42), (Adder(), 3)])
+def test_async_interpreter_awaits_wrapped_coroutines(func: object, expected: int):
+    interpreter: AsyncInterpreter = AsyncInterpreter(natives={"offset": NativeFunction(1, func)}, output=Output())
+    exit_code: int = asyncio.run(interpreter.run(CompiledProgram.from_source(SOURCE).program))
+
+    assert exit_code == expected
+
+@pytest.mark.parametrize(("left", "right", "expected"), [
+    (Integer(1), Integer(1), True),
+    (Integer(1), Float(1.0), True),
+    (Boolean(True), Boolean(True), True),
+    (Boolean(True), Integer(1), False),
+    (Null(), Null(), True),
+    (Null(), Void(), False),
+    (Void(), Void(), True),
+])
+def test_equality_returns_boolean(left: RuntimeType, right: RuntimeType, expected: bool):
+    result: RuntimeType = left == right
+
+    assert isinstance(result, Boolean)
+    assert result.value is expected
+
+def test_equality_in_conditions(run):
+    source: str = """
+    Int main() {
+        Int a = 1;
+        Boolean flag = true;
+        if a == 1 && flag == true {
+            print("numbers and booleans");
+        }
+        if a != 2 {
+            print("not equal");
+        }
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "numbers and booleans\nnot equal\n")
\ No newline at end of file
@@ -0,0 +1,116 @@
+from wild.budget import Budget
+from wild.errors import BudgetError, InterpreterError
+from wild.lexer import Lexer
+from wild.nodes.base import ASTNode
+from wild.nodes.expression import FunctionCall, Inlined
+from wild.nodes.statement import Program
+from wild.optimizer import walk
+from wild.output import Output
+from wild.parser import Parser
+from wild.program import CompiledProgram
+
+import pytest
+
+HELPERS: str = """
+Int twice(Int x) {
+    return x * 2;
+}
+
+Int ignore(Int x) {
+    return 1;
+}
+
+Int sum(Int a, Int b) {
+    return a + twice(b);
+}
+"""
+
+def parse(source: str) -> Program:
+    return Parser(Lexer(source).tokenize()).parse()
+
+def nodes(compiled: CompiledProgram, kind: type[ASTNode]) -> list[ASTNode]:
+    return [node for node in walk(compiled.program) if isinstance(node, kind)]
+
+@pytest.mark.parametrize("threshold", [0, 16])
+def test_inlining_keeps_results(threshold: int):
+    source: str = HELPERS + """
+    Int main() {
+        Int total = 0;
+        for (Int i = 0; i < 5; i++) {
+            total = total + sum(i, i + 1);
+        }
+        print(total);
+        return total;
+    }
+    """
+    output: Output = Output()
+
+    assert CompiledProgram.from_source(source, threshold).run(output=output) == 40
+    assert output.getvalue() == b"40\n"
+
+def test_small_calls_are_inlined():
+    compiled: CompiledProgram = CompiledProgram.from_source(HELPERS + "Int main() { return sum(1, 2); }")
+    main: ASTNode = compiled.functions["main"].declaration
+
+    assert not [node for node in walk(main) if isinstance(node, FunctionCall)]
+    assert [node.name for node in walk(main) if isinstance(node, Inlined)] == ["sum", "twice"]
+
+@pytest.mark.parametrize("threshold", [0, 16])
+def test_inlined_calls_are_charged_steps(threshold: int):
+    source: str = HELPERS + """
+    Int main() {
+        Int total = 0;
+        for (Int i = 0; i < 100; i++) {
+            total = total + twice(i);
+        }
+        return total;
+    }
+    """
+    program: CompiledProgram = CompiledProgram.from_source(source, threshold)
+
+    assert program.run(budget=Budget(steps=250), output=Output()) == 9900
+
+    with pytest.raises(BudgetError, match="Step"):
+        program.run(budget=Budget(steps=150), output=Output())
+
+@pytest.mark.parametrize("threshold", [0, 16])
+def test_inlined_calls_are_charged_depth(threshold: int):
+    program: CompiledProgram = CompiledProgram.from_source(HELPERS + "Int main() { return twice(2); }", threshold)
+
+    assert program.run(budget=Budget(depth=2), output=Output()) == 4
+
+    with pytest.raises(BudgetError, match="Recursion"):
+        program.run(budget=Budget(depth=1), output=Output())
+
+@pytest.mark.parametrize("threshold", [0, 16])
+def test_unused_arguments_are_still_evaluated(threshold: int):
+    program: CompiledProgram = CompiledProgram.from_source(HELPERS + "Int main() { return ignore(1 / 0); }", threshold)
+
+    with pytest.raises(ZeroDivisionError):
+        program.run(output=Output())
+
+@pytest.mark.parametrize("threshold", [0, 16])
+@pytest.mark.parametrize("body", ["1", "true || x == 0", "false && x == 0"])
+def test_unread_variable_arguments_are_still_looked_up(threshold: int, body: str):
+    source: str = f"""
+    Int one(Int x) {{
+        return {body};
+    }}
+
+    Int main() {{
+        one(nope);
+        return 0;
+    }}
+    """
+
+    with pytest.raises(InterpreterError, match="Undefined variable"):
+        CompiledProgram.from_source(source, threshold).run(output=Output())
+
+def test_compiling_leaves_the_parsed_program_alone():
+    program: Program = parse(HELPERS + "Int main() {\n    return sum(1, 2);\n}")
+    compiled: CompiledProgram = CompiledProgram.from_program(program)
+
+    assert compiled.program is not program
+    assert not [node for node in walk(program) if isinstance(node, Inlined)]
+    assert nodes(compiled, Inlined)
+    assert [statement.line for statement in compiled.program.statements] == [statement.line for statement in program.statements]
\ No newline at end of file
@@ -0,0 +1,91 @@
+from wild.async_interpreter import AsyncInterpreter
+from wild.errors import InterpreterError
+from wild.interpreter import Interpreter
+from wild.output import FlushPolicy, Output
+from wild.program import CompiledProgram
+
+import asyncio
+import io
+import os
+import pytest
+
+FAILS_AT_TOP_LEVEL: str = """
+print("before");
+Int broken = missing;
+
+Int main() { return 0; }
+"""
+
+FAILS_IN_MAIN: str = """
+Int main() {
+    print("before");
+    return missing;
+}
+"""
+
+def test_capturing_output_keeps_bytes():
+    output: Output = Output()
+    output.write("héllo\n")
+
+    assert output.capturing
+    assert output.policy is FlushPolicy.EXIT
+    assert output.getvalue() == "héllo\n".encode()
+
+def test_size_policy_flushes_at_threshold():
+    stream: io.StringIO = io.StringIO()
+    output: Output = Output(stream=stream, policy=FlushPolicy.SIZE, threshold=8)
+
+    output.write("1234")
+    assert stream.getvalue() == ""
+
+    output.write("5678")
+    assert stream.getvalue() == "12345678"
+
+def test_line_policy_flushes_on_newline():
+    stream: io.StringIO = io.StringIO()
+    output: Output = Output(stream=stream, policy=FlushPolicy.LINE)
+
+    output.write("partial")
+    assert stream.getvalue() == ""
+
+    output.write(" line\n")
+    assert stream.getvalue() == "partial line\n"
+
+def test_writes_to_file_descriptor():
+    read, write = os.pipe()
+    output: Output = Output(write, policy=FlushPolicy.EXIT)
+
+    output.write("through the pipe\n")
+    output.flush()
+    os.close(write)
+
+    with os.fdopen(read) as pipe:
+        assert pipe.read() == "through the pipe\n"
+
+@pytest.mark.parametrize("source", [FAILS_AT_TOP_LEVEL, FAILS_IN_MAIN])
+def test_output_is_flushed_when_a_run_fails(source: str):
+    stream: io.StringIO = io.StringIO()
+
+    with pytest.raises(InterpreterError):
+        CompiledProgram.from_source(source).run(output=Output(stream=stream, policy=FlushPolicy.EXIT))
+
+    assert stream.getvalue() == "before\n"
+
+def test_output_is_flushed_when_initialize_fails():
+    stream: io.StringIO = io.StringIO()
+    program = CompiledProgram.from_source(FAILS_AT_TOP_LEVEL).program
+
+    with pytest.raises(InterpreterError):
+        Interpreter(output=Output(stream=stream, policy=FlushPolicy.EXIT)).visit(program)
+
+    assert stream.getvalue() == "before\n"
+
+@pytest.mark.parametrize("source", [FAILS_AT_TOP_LEVEL, FAILS_IN_MAIN])
+def test_async_output_is_flushed_when_a_run_fails(source: str):
+    stream: io.StringIO = io.StringIO()
+    interpreter: AsyncInterpreter = AsyncInterpreter(output=Output(stream=stream, policy=FlushPolicy.EXIT))
+
+    with pytest.raises(InterpreterError):
+        asyncio.run(interpreter.run(CompiledProgram.from_source(source).program))
+
+    assert stream.getvalue() == "before\n"
\ No newline at end of file
@@ -0,0 +1,177 @@
+from wild import parallel
+from wild.budget import Budget
+from wild.errors import BudgetError, InterpreterError
+from wild.lexer import Lexer
+from wild.parser import Parser
+
+import pathlib
+import pytest
+
+def parse(source: str) -> None:
+    Parser(Lexer(source).tokenize()).parse()
+
+def test_output_keeps_iteration_order(run):
+    source: str = """
+    Int main() {
+        Map words = Map();
+        words.put(0, "zero");
+        words.put(1, "one");
+        parallel for (Int i = 0; i < 40; i++) {
+            Int square = i * i;
+            if i < 2 {
+                print(words.get(i));
+            }
+            print(square);
+        }
+        return 0;
+    }
+    """
+
+    lines: list[str] = ["zero", "0", "one", "1", *[str(i * i) for i in range(2, 40)]]
+    assert run(source) == (0, "\n".join(lines) + "\n")
+
+def test_parallel_map_returns_results_by_index(run):
+    source: str = """
+    Int cube(Int n) {
+        return n * n * n;
+    }
+
+    Int main() {
+        Map cubes = parallelMap(cube, 0, 30);
+        print(cubes.size());
+        print(cubes.get(29));
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "30\n24389\n")
+
+def test_workers_are_reused(run):
+    source: str = """
+    Int main() {
+        parallel for (Int i = 0; i < 16; i++) {
+            print(i);
+        }
+        return 0;
+    }
+    """
+
+    assert run(source)[0] == 0
+    first = parallel.pool()
+
+    assert run(source) == (0, "".join(f"{i}\n" for i in range(16)))
+    assert parallel.pool() is first
+
+@pytest.mark.parametrize("loop", ["parallel for", "for"])
+def test_iterations_share_the_step_budget(run, loop: str):
+    source: str = f"""
+    Int main() {{
+        {loop} (Int i = 0; i < 8; i++) {{
+            for (Int j = 0; j < 500; j++) {{}}
+        }}
+        return 0;
+    }}
+    """
+
+    assert run(source, budget=Budget(steps=5000))[0] == 0
+
+    with pytest.raises(BudgetError, match="Step"):
+        run(source, budget=Budget(steps=1000))
+
+def test_parallel_map_shares_the_step_budget(run):
+    source: str = """
+    Int spin(Int n) {
+        for (Int j = 0; j < 500; j++) {}
+        return n;
+    }
+
+    Int main() {
+        return parallelMap(spin, 0, 8).size();
+    }
+    """
+
+    with pytest.raises(BudgetError, match="Step"):
+        run(source, budget=Budget(steps=1000))
+
+def test_ships_only_what_the_body_reads(run, tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "data.txt"
+    path.write_text("data")
+    source: str = f"""
+    Int offset = 10;
+
+    Int shift(Int n) {{
+        return n + offset;
+    }}
+
+    Int main() {{
+        Stream s = openFile("{path}");
+        parallel for (Int i = 0; i < 16; i++) {{
+            print(shift(i));
+        }}
+        return 0;
+    }}
+    """
+
+    assert run(source) == (0, "".join(f"{i + 10}\n" for i in range(16)))
+
+def test_values_that_cannot_be_shipped(run, tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "data.txt"
+    path.write_text("data")
+    source: str = f"""
+    Int main() {{
+        Stream s = openFile("{path}");
+        parallel for (Int i = 0; i < 16; i++) {{
+            print(s);
+        }}
+        return 0;
+    }}
+    """
+
+    with pytest.raises(InterpreterError, match="Cannot send `s` \\(Stream\\)"):
+        run(source)
+
+@pytest.mark.parametrize(("body", "message"), [
+    ("total = total + i;", "assign outer variable `total`"),
+    ("total++;", "assign outer variable `total`"),
+    ("seen.put(i, true);", "call `put` on outer variable `seen`"),
+    ("seen.get(0).clear();", "call `clear` on outer variable `seen`"),
+    ("if i > 2 { Int total = 0; } total = i;", "assign outer variable `total`"),
+    ("for (Int j = 0; j < 2; j++) { Int total = 0; } total = i;", "assign outer variable `total`"),
+    ("return;", "cannot return"),
+    ("break;", "cannot break"),
+])
+def test_rejects_bodies_that_lose_writes(body: str, message: str):
+    source: str = f"""
+    Int main() {{
+        Int total = 0;
+        Map seen = Map();
+        parallel for (Int i = 0; i < 4; i++) {{
+            {body}
+        }}
+        return total;
+    }}
+    """
+
+    with pytest.raises(SyntaxError, match=message):
+        parse(source)
+
+@pytest.mark.parametrize("body", [
+    "Int total = i; total = total + 1;",
+    "Map local = Map(); local.put(i, seen.get(i));",
+    "for (Int j = 0; j < 2; j++) { if j == 1 { break; } }",
+    "if seen.contains(i) { print(seen.size()); }",
+])
+def test_accepts_local_writes_and_outer_reads(body: str):
+    source: str = f"""
+    Int main() {{
+        Map seen = Map();
+        parallel for (Int i = 0; i < 4; i++) {{
+            {body}
+        }}
+        return 0;
+    }}
+    """
+
+    parse(source)
+def test_workers_ask_for_a_task_they_have_not_seen():
+    assert parallel._run_chunk(-1, None, []) is None
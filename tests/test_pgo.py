@@ -0,0 +1,111 @@
+from wild.nodes.expression import FunctionCall
+from wild.nodes.statement import For, If, While
+from wild.output import Output
+from wild.pgo import NATIVE_TARGET, Profile, apply, main, number, profile_path, record, report, shape
+from wild.program import CompiledProgram
+
+import pathlib
+import pytest
+
+SOURCE: str = """
+Int classify(Int n) {
+    if n % 3 == 0 {
+        return 1;
+    }
+    return 0;
+}
+
+Int main() {
+    Int hits = 0;
+    for (Int round = 0; round < 2; round++) {
+        Int i = 0;
+        while i < 6 {
+            hits = hits + classify(i);
+            i++;
+        }
+    }
+    print(hits);
+    return hits;
+}
+"""
+
+def sites(program: CompiledProgram, kind: type) -> list[int]:
+    return [index for index, (node, _) in enumerate(number(program.program)) if isinstance(node, kind)]
+
+@pytest.fixture
+def program() -> CompiledProgram:
+    return CompiledProgram.from_source(SOURCE)
+
+def test_records_loops_branches_and_calls(program: CompiledProgram):
+    exit_code, profile = record(program, output=Output())
+    [loop] = sites(program, For)
+    [inner] = sites(program, While)
+    [branch] = sites(program, If)
+
+    assert exit_code == 4
+    assert profile.loops == {loop: [1, 2], inner: [2, 12]}
+    assert profile.branches == {branch: [4, 8]}
+    nodes = number(program.program)
+    assert {nodes[index][0].name: targets for index, targets in profile.calls.items()} == {
+        "classify": {"classify": 12},
+        "print": {NATIVE_TARGET: 1},
+    }
+
+def test_loops_count_trips_through_continue_and_break():
+    source: str = """
+    Int main() {
+        Int i = 0;
+        while i < 10 {
+            i++;
+            if i < 3 {
+                continue;
+            }
+            if i == 5 {
+                break;
+            }
+        }
+        return i;
+    }
+    """
+    program: CompiledProgram = CompiledProgram.from_source(source)
+    _, profile = record(program, output=Output())
+
+    assert profile.loops == {sites(program, While)[0]: [1, 5]}
+
+def test_records_operand_types(program: CompiledProgram):
+    _, profile = record(program, output=Output())
+
+    assert {pair for pairs in profile.operations.values() for pair in pairs} == {("Integer", "Integer")}
+
+def test_apply_pins_calls_and_keeps_results(program: CompiledProgram):
+    _, profile = record(program, output=Output())
+    fresh: CompiledProgram = CompiledProgram.from_source(SOURCE)
+
+    assert apply(fresh, profile) > 0
+    calls: list[FunctionCall] = [node for node, _ in number(fresh.program) if isinstance(node, FunctionCall)]
+
+    assert len(calls) == 2
+    assert all(call.target is not None for call in calls)
+    assert fresh.run(output=Output()) == 4
+
+def test_profile_round_trip(program: CompiledProgram, tmp_path: pathlib.Path):
+    _, profile = record(program, output=Output())
+    path: str = str(tmp_path / "script.profile")
+    profile.save(path)
+
+    loaded: Profile | None = Profile.load(path, profile.shape)
+
+    assert (loaded.operations, loaded.calls, loaded.branches, loaded.loops) == (profile.operations, profile.calls, profile.branches, profile.loops)
+    assert Profile.load(path, shape([])) is None
+
+def test_report_and_cli(program: CompiledProgram, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]):
+    _, profile = record(program, output=Output())
+    assert "6.0 trips x 2" in report(program, profile)
+
+    script: pathlib.Path = tmp_path / "script.wild"
+    script.write_text(SOURCE)
+
+    assert main(["pgo", "--record", str(script)]) == 4
+    assert pathlib.Path(profile_path(str(script))).exists()
+    assert main(["pgo", "--report", str(script)]) == 4
+    assert "branch" in capsys.readouterr().err
\ No newline at end of file
@@ -0,0 +1,76 @@
+from wild.natives.base import NativeFunction
+from wild.output import Output
+from wild.profiler import GLOBAL_SCOPE, MemoryProfiler, MemoryReport, profile
+from wild.program import CompiledProgram
+from wild.type.base import RuntimeType
+from wild.type.empty import Void
+from wild.type.numeric import Integer
+from wild.type.strings import String
+
+SOURCE: str = """
+Int build(Int n) {
+    String text = "";
+    for (Int i = 0; i < n; i++) {
+        text = text + "x";
+    }
+    return text.length();
+}
+
+Int main() {
+    print(build(limit));
+    return 0;
+}
+"""
+
+def test_attributes_allocations_to_lines():
+    output: Output = Output()
+    exit_code, report = profile(CompiledProgram.from_source(SOURCE), {"limit": 50}, output=output)
+    strings: int = sum(site.types.get("String", 0) for site in report.sites.values() if site.function == "build")
+
+    assert (exit_code, output.getvalue()) == (0, b"50\n")
+    assert strings == 50
+    assert report.sites[(GLOBAL_SCOPE, None)].types == {"Integer": 1}
+    assert report.peak_bytes >= report.live_bytes > 0
+
+def test_counts_stored_values_where_they_are_made():
+    source: str = """
+    Int main() {
+        Int i = 0;
+        while i < 1000 {
+            i++;
+        }
+        return 0;
+    }
+    """
+    _, report = profile(CompiledProgram.from_source(source), output=Output())
+    integers: dict[int, int] = {line: site.types.get("Integer", 0) for (_, line), site in report.sites.items()}
+
+    assert integers[5] == 1000
+    assert integers[4] == 0
+
+def test_counts_call_frames():
+    _, report = profile(CompiledProgram.from_source(SOURCE), {"limit": 1}, output=Output())
+
+    # Calls to main and build, plus the scope of the loop in build.
+    assert sum(site.frames for site in report.sites.values()) == 3
+
+def test_other_interpreters_are_not_patched():
+    constructors: dict[type, object] = {cls: cls.__init__ for cls in (Integer, String, RuntimeType)}
+    checks: list[bool] = []
+
+    def check(_: object, arguments: list[RuntimeType]) -> Void:
+        checks.append(all(cls.__init__ is init for cls, init in constructors.items()))
+        return Void()
+
+    source: str = "Int main() { check(1); return 0; }"
+    profiler: MemoryProfiler = MemoryProfiler(natives={"check": NativeFunction(1, check)}, output=Output())
+    profiler.visit(CompiledProgram.from_source(source).program)
+
+    assert checks == [True]
+
+def test_report_format_lists_top_sites():
+    _, report = profile(CompiledProgram.from_source(SOURCE), {"limit": 10}, output=Output())
+    text: str = MemoryReport(report.sites, report.live_bytes, report.peak_bytes).format(limit=2)
+
+    assert text.startswith(f"{report.allocations} allocations")
+    assert len(text.splitlines()) == 4
\ No newline at end of file
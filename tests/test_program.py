@@ -0,0 +1,83 @@
+from wild.errors import ConversionError, InterpreterError
+from wild.natives.base import NativeFunction
+from wild.output import Output
+from wild.program import CompiledProgram, to_runtime
+from wild.type.base import RuntimeType
+from wild.type.boolean import Boolean
+from wild.type.empty import Null
+from wild.type.numeric import Float, Integer
+from wild.type.strings import String
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+COUNTER: str = """
+Int total = 0;
+
+Int main() {
+    for (Int i = 0; i < limit; i++) {
+        total = total + double(i);
+    }
+    print(total);
+    return total;
+}
+"""
+
+def double(_: object, arguments: list[RuntimeType]) -> Integer:
+    return Integer(arguments[0].value * 2)
+
+NATIVES: dict[str, NativeFunction] = {"double": NativeFunction(1, double)}
+
+def test_runs_do_not_share_state():
+    program: CompiledProgram = CompiledProgram.from_source(COUNTER)
+
+    for _ in range(3):
+        assert program.run({"limit": 4}, NATIVES, output=Output()) == 12
+
+def test_inputs_and_natives_are_per_run():
+    program: CompiledProgram = CompiledProgram.from_source(COUNTER)
+
+    assert program.run({"limit": 3}, NATIVES, output=Output()) == 6
+    assert program.run({"limit": 5}, NATIVES, output=Output()) == 20
+
+    with pytest.raises(InterpreterError, match="double"):
+        program.run({"limit": 1}, output=Output())
+
+def test_concurrent_runs_share_one_program():
+    program: CompiledProgram = CompiledProgram.from_source(COUNTER)
+
+    def run(limit: int) -> int:
+        return program.run({"limit": limit}, NATIVES, output=Output())
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        assert list(executor.map(run, range(40))) == [limit * (limit - 1) for limit in range(40)]
+
+def test_interpreter_is_ready_to_call_main():
+    output: Output = Output()
+    interpreter = CompiledProgram.from_source(COUNTER).interpreter({"limit": 2}, NATIVES, output=output)
+
+    assert interpreter.globals["total"].value == 0
+    assert interpreter.call_main() == 2
+    assert output.getvalue() == b"2\n"
+
+def test_main_is_required():
+    with pytest.raises(InterpreterError, match="main"):
+        CompiledProgram.from_source("Int helper() { return 0; }")
+
+@pytest.mark.parametrize(("value", "expected"), [
+    (True, Boolean(True)),
+    (3, Integer(3)),
+    (2.5, Float(2.5)),
+    ("text", String("text")),
+])
+def test_to_runtime(value: object, expected: RuntimeType):
+    converted: RuntimeType = to_runtime(value)
+
+    assert type(converted) is type(expected)
+    assert converted.value == expected.value
+
+def test_to_runtime_none_and_unsupported():
+    assert isinstance(to_runtime(None), Null)
+
+    with pytest.raises(ConversionError):
+        to_runtime([1, 2])
\ No newline at end of file
@@ -0,0 +1,103 @@
+from wild.interpreter import Interpreter
+from wild.nodes.expression import BinaryOperation
+from wild.output import Output
+from wild.program import CompiledProgram
+from wild.quickening import DEOPT_LIMIT, SPECIALIZATIONS
+from wild.snapshot import Snapshot
+from wild.tokens import TokenType
+from wild.type.boolean import Boolean
+from wild.type.numeric import Float, Integer
+from wild.type.strings import String
+
+import pathlib
+import pickle
+import pytest
+
+LOOP: str = """
+Int main() {
+    Int total = 0;
+    for (Int i = 0; i < 100; i++) {
+        total = total + i;
+    }
+    return total;
+}
+"""
+
+def operation(symbol: str) -> BinaryOperation:
+    return CompiledProgram.from_source(f"Int main() {{ return a {symbol} b; }}").functions["main"].declaration.body.statements[0].value
+
+def test_hot_loop_runs_specialized_handlers():
+    interpreter: Interpreter = CompiledProgram.from_source(LOOP).interpreter(output=Output())
+
+    assert interpreter.call_main() == 4950
+    assert (interpreter.quickening.hits, interpreter.quickening.misses) == (199, 2)
+    assert interpreter.quickening.specializations == 2
+    assert interpreter.quickening.deopts == 0
+
+def test_type_change_deoptimizes_and_stops_at_the_limit():
+    node: BinaryOperation = operation("+")
+    interpreter: Interpreter = Interpreter(output=Output())
+    operands: list = [(Integer(1), Integer(2)), (Float(1.5), Integer(2))] * DEOPT_LIMIT
+
+    results: list = [interpreter.operate(node, *pair).value for pair in operands]
+
+    assert results == [3, 3.5] * DEOPT_LIMIT
+    assert node.deopts == DEOPT_LIMIT
+    assert node.quick is None
+    assert interpreter.quickening.deopts == DEOPT_LIMIT
+
+def test_not_equal_returns_boolean(run):
+    node: BinaryOperation = operation("!=")
+    interpreter: Interpreter = Interpreter(output=Output())
+
+    for _ in range(2):
+        result = interpreter.operate(node, String("a"), String("b"))
+        assert isinstance(result, Boolean) and result.value is True
+
+    source: str = """
+    Int main() {
+        for (Int i = 0; i < 3; i++) {
+            if i != 1 {
+                print(i);
+            }
+        }
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "0\n2\n")
+
+@pytest.mark.parametrize(("key", "left", "right"), [
+    ((TokenType.PLUS, Integer, Integer), Integer(2), Integer(3)),
+    ((TokenType.DIV, Integer, Integer), Integer(3), Integer(2)),
+    ((TokenType.MOD, Float, Integer), Float(7.5), Integer(2)),
+    ((TokenType.LESS, Integer, Float), Integer(1), Float(1.5)),
+    ((TokenType.PLUS, String, String), String("a"), String("b")),
+    ((TokenType.EQUAL, Boolean, Boolean), Boolean(True), Boolean(False)),
+])
+def test_specializations_match_the_generic_operators(key: tuple, left, right):
+    interpreter: Interpreter = Interpreter(output=Output())
+    specialized = SPECIALIZATIONS[key](left, right)
+    generic = interpreter.binary_operation(key[0], left, right)
+
+    assert type(specialized) is type(generic)
+    assert specialized.value == generic.value
+
+def test_quickened_tree_can_be_saved(tmp_path: pathlib.Path):
+    program = CompiledProgram.from_source("Int base = 1 + 1;\n" + LOOP).program
+    snapshot: Snapshot = Snapshot.initialize(program, output=Output())
+    snapshot.run(output=Output())
+
+    path: pathlib.Path = tmp_path / "quickened.snapshot"
+    snapshot.save(str(path))
+    restored: Snapshot = Snapshot.load(str(path))
+
+    assert restored.run(output=Output()) == 4950
+
+def test_pickled_nodes_keep_their_specialization():
+    node: BinaryOperation = operation("+")
+    Interpreter(output=Output()).operate(node, Integer(1), Integer(2))
+
+    copied: BinaryOperation = pickle.loads(pickle.dumps(node))
+
+    assert copied.quick == node.quick
\ No newline at end of file
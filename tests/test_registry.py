@@ -0,0 +1,72 @@
+from wild.errors import InterpreterError
+from wild.interpreter import Interpreter
+from wild.natives.base import NativeFunction
+from wild.natives.registry import NativeRegistry, NativeSpec, REGISTRY
+from wild.output import Output
+from wild.program import CompiledProgram
+from wild.type.base import RuntimeType
+from wild.type.numeric import Integer
+
+import pytest
+import sys
+
+class EntryPoint:
+    def __init__(self, value: object) -> None:
+        self.value: object = value
+
+    def load(self) -> object:
+        return self.value
+
+def triple(_: Interpreter, arguments: list[RuntimeType]) -> Integer:
+    return Integer(arguments[0].value * 3)
+
+@pytest.fixture
+def registry() -> NativeRegistry:
+    registry: NativeRegistry = NativeRegistry([NativeSpec("dumps", 1, "json", "dumps")])
+    registry.plugins = {}
+
+    return registry
+
+def test_specs_load_on_first_resolve(registry: NativeRegistry):
+    assert registry.loaded == {}
+    assert "dumps" in registry
+
+    function = registry.resolve("dumps")
+
+    assert isinstance(function, NativeFunction)
+    assert registry.resolve("dumps") is function
+    assert registry.loaded == {"dumps": function}
+
+def test_builtins_are_imported_lazily():
+    assert "wild.natives.streams" in {spec.module for spec in REGISTRY.specs.values()}
+    assert "openFile" in REGISTRY
+
+def test_unknown_names_resolve_to_none(registry: NativeRegistry):
+    assert registry.resolve("missing") is None
+    assert "missing" not in registry
+
+def test_register_and_declare(registry: NativeRegistry):
+    registry.register("triple", 1, triple)
+    registry.resolve("dumps")
+    registry.declare(NativeSpec("dumps", 1, "json", "loads"))
+
+    assert registry.resolve("triple")._func is triple
+    assert registry.resolve("dumps")._func is sys.modules["json"].loads
+
+def test_plugins_must_provide_runtime_functions(registry: NativeRegistry):
+    registry.plugins = {"good": EntryPoint(NativeFunction(1, triple)), "bad": EntryPoint(triple)}
+
+    assert registry.resolve("good")._func is triple
+
+    with pytest.raises(InterpreterError, match="RuntimeFunction"):
+        registry.resolve("bad")
+
+def test_interpreter_resolves_through_its_registry(registry: NativeRegistry):
+    registry.register("triple", 1, triple)
+    registry.declare(NativeSpec("print", 1, "wild.natives.print", "native_print"))
+    program = CompiledProgram.from_source("Int main() { print(triple(14)); return 0; }").program
+    output: Output = Output()
+
+    Interpreter(output=output, registry=registry).visit(program)
+
+    assert output.getvalue() == b"42\n"
\ No newline at end of file
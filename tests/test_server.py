@@ -0,0 +1,87 @@
+from wild import client, server
+from wild.server import ProgramCache, WildServer, private_directory
+
+import os
+import pathlib
+import pytest
+import stat
+import threading
+
+@pytest.fixture
+def socket_path(tmp_path: pathlib.Path) -> str:
+    path: str = str(tmp_path / "wild.sock")
+
+    with WildServer(path) as running:
+        thread: threading.Thread = threading.Thread(target=running.serve_forever, daemon=True)
+        thread.start()
+
+        yield path
+
+        running.shutdown()
+
+    thread.join()
+
+def test_runs_sources_and_files(socket_path: str, tmp_path: pathlib.Path, capsys: pytest.CaptureFixture[str]):
+    script: pathlib.Path = tmp_path / "args.wild"
+    script.write_text("Int main() { print(argument(0)); return argumentCount(); }")
+
+    assert client.run({"source": "Int main() { print(7); return 3; }"}, socket_path) == 3
+    assert client.run({"path": str(script), "arguments": ["one", "two"]}, socket_path) == 2
+    assert capsys.readouterr().out == "7\none\n"
+
+def test_reports_errors(socket_path: str, capsys: pytest.CaptureFixture[str]):
+    assert client.run({"source": "Int main() { print(1); return missing; }"}, socket_path) == 1
+
+    captured = capsys.readouterr()
+    assert captured.out == "1\n"
+    assert captured.err.startswith("InterpreterError")
+
+def test_socket_is_private(socket_path: str):
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+def test_closing_removes_the_socket(tmp_path: pathlib.Path):
+    path: str = str(tmp_path / "wild.sock")
+    WildServer(path).server_close()
+
+    assert not os.path.exists(path)
+
+def test_does_not_remove_other_files(tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "notes.txt"
+    path.write_text("keep me")
+
+    with pytest.raises(OSError):
+        WildServer(str(path))
+
+    assert path.read_text() == "keep me"
+
+def test_private_directory(tmp_path: pathlib.Path):
+    created: pathlib.Path = tmp_path / "runtime"
+    private_directory(str(created))
+
+    assert stat.S_IMODE(created.stat().st_mode) == 0o700
+
+    created.chmod(0o755)
+    with pytest.raises(PermissionError, match="only its owner"):
+        private_directory(str(created))
+
+def test_client_and_server_agree_on_the_default():
+    assert server.DEFAULT_SOCKET is client.DEFAULT_SOCKET
+
+def test_runtime_directory_is_created_private(tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch):
+    runtime: pathlib.Path = tmp_path / "runtime"
+    monkeypatch.setattr(server, "RUNTIME_DIRECTORY", str(runtime))
+
+    WildServer(str(runtime / "wild.sock")).server_close()
+
+    assert stat.S_IMODE(runtime.stat().st_mode) == 0o700
+
+def test_cache_revalidates_files(tmp_path: pathlib.Path):
+    script: pathlib.Path = tmp_path / "main.wild"
+    script.write_text("Int main() { return 1; }")
+    cache: ProgramCache = ProgramCache(capacity=1)
+
+    first = cache.from_file(str(script))
+    assert cache.from_file(str(script)) is first
+
+    script.write_text("Int main() { return 22; }")
+    assert cache.from_file(str(script)).run() == 22
\ No newline at end of file
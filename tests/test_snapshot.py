@@ -0,0 +1,61 @@
+from wild.errors import InterpreterError
+from wild.nodes.statement import Program
+from wild.output import Output
+from wild.program import CompiledProgram
+from wild.snapshot import SNAPSHOT_VERSION, Snapshot
+
+import pathlib
+import pickle
+import pytest
+
+SOURCE: str = """
+Int base = 40;
+Map seen = Map();
+print("setup");
+
+Int main() {
+    seen.put(base, true);
+    base = base + 2;
+    print(seen.size());
+    return base;
+}
+"""
+
+def snapshot() -> Snapshot:
+    return Snapshot.initialize(CompiledProgram.from_source(SOURCE).program, output=Output())
+
+def run(snapshot: Snapshot) -> tuple[int, str]:
+    output: Output = Output()
+    return snapshot.run(output=output), output.getvalue().decode()
+
+def test_top_level_code_runs_once():
+    output: Output = Output()
+    captured: Snapshot = Snapshot.initialize(CompiledProgram.from_source(SOURCE).program, output=output)
+
+    assert output.getvalue() == b"setup\n"
+    assert run(captured) == (42, "1\n")
+
+def test_restored_runs_do_not_share_state():
+    captured: Snapshot = snapshot()
+
+    assert run(captured) == (42, "1\n")
+    assert run(captured) == (42, "1\n")
+    assert captured.globals["base"].value == 40
+    assert captured.globals["seen"].value == {}
+
+def test_save_and_load(tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "state.snapshot"
+    snapshot().save(str(path))
+
+    assert run(Snapshot.load(str(path))) == (42, "1\n")
+
+def test_load_rejects_other_versions(tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "old.snapshot"
+    path.write_bytes(pickle.dumps((SNAPSHOT_VERSION + 1, {})))
+
+    with pytest.raises(InterpreterError, match="version"):
+        Snapshot.load(str(path))
+
+def test_initialize_requires_main():
+    with pytest.raises(InterpreterError, match="main"):
+        Snapshot.initialize(Program([]), output=Output())
\ No newline at end of file
@@ -0,0 +1,117 @@
+from wild.errors import CallError
+from wild.lexer import Lexer
+from wild.natives import streams
+from wild.tokens import TokenType
+from wild.type.empty import Null
+from wild.type.numeric import Integer
+from wild.type.stream import Stream
+
+import io
+import pathlib
+import pytest
+import sys
+
+def read(stream: Stream, size: int) -> str:
+    return Stream._read(None, stream, [Integer(size)]).value
+
+def read_line(stream: Stream) -> str | None:
+    line = Stream._readLine(None, stream, [])
+    return None if isinstance(line, Null) else line.value
+
+def test_reads_file_lines(run, tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "lines.txt"
+    path.write_bytes(b"first\r\nsecond\nthird")
+    source: str = f"""
+    Int main() {{
+        Stream file = openFile("{path}");
+        while file.hasLine() {{
+            print("[" + file.readLine() + "]");
+        }}
+        print(file.readLine() == null);
+        file.close();
+        return 0;
+    }}
+    """
+
+    assert run(source) == (0, "[first]\n[second]\n[third]\nTrue\n")
+
+def test_reads_empty_file(run, tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    source: str = f"""
+    Int main() {{
+        Stream file = openFile("{path}");
+        print(file.hasLine());
+        print(file.readAll().length());
+        return 0;
+    }}
+    """
+
+    assert run(source) == (0, "False\n0\n")
+
+def test_stdin_is_shared(run, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(io.BytesIO(b"one\ntwo\n")))
+    monkeypatch.setattr(streams, "_stdin", None)
+    source: str = """
+    Int main() {
+        print(stdin().readLine());
+        print(stdin().readLine());
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "one\ntwo\n")
+
+def test_chunks_keep_characters_split_across_reads():
+    stream: Stream = Stream(io.BytesIO("aé€".encode()), "<test>")
+
+    assert [read(stream, 2) for _ in range(4)] == ["a", "é", "€", ""]
+
+def test_empty_chunk_does_not_reset_the_decoder():
+    stream: Stream = Stream(io.BytesIO("é".encode()), "<test>")
+
+    assert read(stream, 1) == ""
+    assert read(stream, 0) == ""
+    assert read(stream, 1) == "é"
+
+def test_read_line_continues_a_split_character():
+    stream: Stream = Stream(io.BytesIO("€uro\nrest".encode()), "<test>")
+
+    assert read(stream, 1) == ""
+    assert read_line(stream) == "€uro"
+    assert Stream._readAll(None, stream, []).value == "rest"
+    assert read_line(stream) is None
+
+def test_read_after_has_line_uses_the_pending_line():
+    stream: Stream = Stream(io.BytesIO(b"abc\ndef\n"), "<test>")
+
+    assert Stream._hasLine(None, stream, []).value
+    assert read(stream, 2) == "ab"
+    assert read_line(stream) == "c"
+    assert read_line(stream) == "def"
+
+def test_closed_stream_rejects_reads():
+    stream: Stream = Stream(io.BytesIO(b"data"), "<test>")
+    Stream._close(None, stream, [])
+
+    with pytest.raises(CallError, match="closed"):
+        read(stream, 1)
+
+@pytest.mark.parametrize("word", ["Interval", "Streamer", "Mapping", "format", "iffy", "order", "android", "nothing"])
+def test_keywords_do_not_split_identifiers(word: str):
+    assert [(token.type, token.value) for token in Lexer(word).tokenize()] == [(TokenType.IDENTIFIER, word)]
+
+def test_streams_are_equal_only_to_themselves(run, tmp_path: pathlib.Path):
+    path: pathlib.Path = tmp_path / "data.txt"
+    path.write_text("data")
+    source: str = f"""
+    Int main() {{
+        Stream a = openFile("{path}");
+        Stream b = openFile("{path}");
+        print(a == a);
+        print(a == b);
+        return 0;
+    }}
+    """
+
+    assert run(source) == (0, "True\nFalse\n")
\ No newline at end of file
@@ -0,0 +1,143 @@
+from wild.errors import ConversionError
+from wild.type.numeric import Integer
+from wild.type.strings import String, compile_pattern
+
+import pytest
+
+def test_concatenation_in_loop(run):
+    source: str = """
+    Int main() {
+        String s = "";
+        for (Int i = 0; i < 2000; i++) {
+            s = s + "ab";
+        }
+        print(s.length());
+        print(s.substring(3997, 5));
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "4000\nbab\n")
+
+def test_rope_is_joined_only_when_read():
+    rope: String = String("a") + String("b") + String("c")
+
+    assert rope._flat is None
+    assert rope._length == 3
+    assert rope.value == "abc"
+    assert rope._flat == "abc"
+
+def test_appending_to_a_shared_prefix_forks():
+    prefix: String = String("x") + String("y")
+    left: String = prefix + String("1")
+    right: String = prefix + String("2")
+    longer: String = left + String("3")
+
+    assert (prefix.value, left.value, right.value, longer.value) == ("xy", "xy1", "xy2", "xy13")
+
+def test_ropes_compare_by_value(run):
+    source: str = """
+    Int main() {
+        String a = "wi" + "ld";
+        if a == "wild" {
+            print("equal");
+        }
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "equal\n")
+
+def test_substring_and_trim_share_the_buffer():
+    text: String = String("  hello world  ")
+    trimmed: String = String._trim(None, text, [])
+    word: String = String._substring(None, trimmed, [String._find(None, trimmed, [String(" ")]), Integer(6)])
+
+    assert trimmed._source is text.value
+    assert word._source is text.value
+    assert (trimmed.value, word.value) == ("hello world", " world")
+
+def test_view_searches_stay_inside_the_view(run):
+    source: str = """
+    Int main() {
+        String text = "abc-needle-xyz";
+        String middle = text.substring(4, 6);
+        print(middle.find("e"));
+        print(middle.find("xyz"));
+        print(middle.contains("abc"));
+        print(middle.startsWith("nee"));
+        print(middle.endsWith("dle"));
+        print(middle.trim().length());
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "1\n-1\nFalse\nTrue\nTrue\n6\n")
+
+def test_substring_clamps_to_the_string(run):
+    source: str = """
+    Int main() {
+        String text = "short";
+        print(text.substring(2, 100));
+        print(text.substring(10, 2).isEmpty());
+        String blank = "   ";
+        print("[" + blank.trim() + "]");
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "ort\nTrue\n[]\n")
+
+def test_regex_methods(run):
+    source: str = r"""
+    Int main() {
+        String line = "id=42, name=wild, size=7";
+        print(line.matches("id=\d+.*"));
+        print(line.matches("\d+"));
+        print(line.search("\d"));
+        print(line.search("missing"));
+        Map numbers = line.findAll("\d+");
+        print(numbers.size());
+        print(numbers.get(1));
+        Map fields = line.splitRegex(",\s*");
+        print(fields.get(1));
+        print(line.replaceRegex("(\w+)=(\w+)", "\2"));
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "True\nFalse\n3\n-1\n2\n7\nname=wild\n42, wild, 7\n")
+
+def test_regex_on_views_only_sees_the_view(run):
+    source: str = """
+    Int main() {
+        String text = "abc-needle-xyz";
+        String middle = text.substring(4, 6);
+        print(middle.matches("^needle$"));
+        print(middle.search("e"));
+        print(middle.findAll("[a-z]").size());
+        String head = text.substring(0, 3);
+        print(head.matches("abc"));
+        print(head.splitRegex("b").get(1));
+        return 0;
+    }
+    """
+
+    assert run(source) == (0, "True\n1\n6\nTrue\nc\n")
+
+def test_regex_errors():
+    text: String = String("abc")
+
+    with pytest.raises(ConversionError, match="Invalid pattern"):
+        String._matches(None, text, [String("(")])
+
+    with pytest.raises(ConversionError, match="Invalid replacement"):
+        String._replaceRegex(None, text, [String("b"), String("\\9")])
+
+def test_patterns_are_compiled_once():
+    compile_pattern.cache_clear()
+
+    for _ in range(3):
+        String._search(None, String("a1"), [String("[0-9]")])
+
+    assert compile_pattern.cache_info().misses == 1
\ No newline at end of file
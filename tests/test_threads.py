@@ -0,0 +1,93 @@
+from wild.natives.registry import NativeRegistry, NativeSpec
+from wild.output import Output
+from wild.program import CompiledProgram, to_runtime
+from wild.snapshot import Snapshot
+from wild.type.strings import String
+from concurrent.futures import ThreadPoolExecutor
+
+import threading
+
+THREADS: int = 8
+
+def test_mixed_operand_types_on_a_shared_tree():
+    # Every run re-specializes the same nodes for other operand types, so the guards are raced constantly.
+    program: CompiledProgram = CompiledProgram.from_source("""
+    Int main() {
+        for (Int i = 0; i < 20; i++) {
+            print(x + x);
+        }
+        return 0;
+    }
+    """)
+
+    def run(index: int) -> str:
+        output: Output = Output()
+        value: object = (index, f"s{index}", index + 0.5)[index % 3]
+        program.run({"x": value}, output=output)
+
+        return output.getvalue().decode()
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results: list[str] = list(executor.map(run, range(120)))
+
+    expected: list[str] = [f"{(index * 2, f's{index}s{index}', index * 2 + 1.0)[index % 3]}\n" * 20 for index in range(120)]
+    assert results == expected
+
+def test_snapshot_restores_on_many_threads():
+    snapshot: Snapshot = Snapshot.initialize(CompiledProgram.from_source("""
+    String greeting = "hello" + ", " + "world";
+    Map seen = Map();
+
+    Int main() {
+        greeting = greeting + "!";
+        seen.put(greeting, true);
+        print(greeting);
+        return seen.size();
+    }
+    """).program, output=Output())
+
+    def run(_: int) -> tuple[int, bytes]:
+        output: Output = Output()
+        return snapshot.run(output=output), output.getvalue()
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results: list[tuple[int, bytes]] = list(executor.map(run, range(64)))
+
+    assert results == [(1, b"hello, world!\n")] * 64
+    assert snapshot.globals["greeting"]._parts is None
+
+def test_inputs_are_flattened():
+    rope: String = String("a") + String("b")
+    shared: String = to_runtime(rope)
+
+    assert shared is rope
+    assert (shared._parts, shared._flat) == (None, "ab")
+
+def test_registry_loads_each_native_once():
+    registry: NativeRegistry = NativeRegistry([NativeSpec("dumps", 1, "json", "dumps")])
+    barrier: threading.Barrier = threading.Barrier(THREADS)
+
+    def resolve(_: int) -> object:
+        barrier.wait()
+        return registry.resolve("dumps")
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        functions: set[int] = {id(function) for function in executor.map(resolve, range(THREADS))}
+
+    assert len(functions) == 1
+
+def test_concurrent_reads_of_one_rope():
+    rope: String = String("")
+    for index in range(500):
+        rope = rope + String(str(index % 10))
+
+    barrier: threading.Barrier = threading.Barrier(THREADS)
+
+    def read(_: int) -> str:
+        barrier.wait()
+        return rope.value
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        values: set[str] = set(executor.map(read, range(THREADS)))
+
+    assert values == {"0123456789" * 50}
\ No newline at end of file
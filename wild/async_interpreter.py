@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from wild.budget import Budget
+from wild.errors import *
+from wild.interpreter import Interpreter
+from wild.natives.base import RuntimeFunction, UserFunction
+from wild.natives.registry import NativeRegistry
+from wild.nodes.base import *
+from wild.nodes.expression import *
+from wild.nodes.statement import *
+from wild.output import Output
+from wild.signals import *
+from wild.tokens import *
+from wild.type.base import RuntimeType
+from wild.type.empty import Void
+
+import asyncio
+
+__all__ = ("AsyncInterpreter",)
+
+SUSPENDING: tuple[type[ASTNode], ...] = (For, FunctionCall, MethodCall, Program, While)
+
+class AsyncInterpreter(Interpreter):
+    """
+    Cooperative interpreter whose runs are awaitable.
+
+    Control returns to the event loop every `yield_interval` loop back-edges
+    or native calls, and native functions may be coroutine functions.
+
+    Only nodes that can suspend have asynchronous visitors. Every other
+    subtree, and the semantics both kinds of visitor have in common, are
+    handled by the synchronous `Interpreter`.
+    """
+
+    def __init__(
+        self,
+        budget: Budget | None = None,
+        natives: dict[str, RuntimeFunction] | None = None,
+        output: Output | None = None,
+        registry: NativeRegistry | None = None,
+        yield_interval: int = 64,
+    ) -> None:
+        super().__init__(budget, natives, output, registry)
+
+        self.yield_interval: int = yield_interval
+        self.countdown: int = yield_interval
+
+        # Kept here rather than on the nodes, which concurrent runs share.
+        self.suspending: dict[ASTNode, bool] = {}
+
+    async def checkpoint(self) -> None:
+        self.countdown -= 1
+        if self.countdown <= 0:
+            self.countdown = self.yield_interval
+            await asyncio.sleep(0)
+
+    async def run(self, node: Program) -> int: return await self.visit_async(node)
+
+    def suspends(self, node: ASTNode) -> bool:
+        """
+        Whether evaluating `node` can reach a loop back-edge or a call.
+
+        Subtrees that cannot are handed to the synchronous visitors, so only
+        the statements that may actually yield pay for a coroutine.
+        """
+
+        result: bool | None = self.suspending.get(node)
+        if result is not None:
+            return result
+
+        if isinstance(node, FunctionDefinition):
+            result = False
+        else:
+            result = isinstance(node, SUSPENDING) or any([self.suspends(child) for child in node.children()])
+
+        self.suspending[node] = result
+        return result
+
+    async def visit_async(self, node: ASTNode) -> RuntimeType | None:
+        if not self.suspends(node):
+            return self.visit(node)
+
+        method: str = f"visit_async_{type(node).__name__}"
+        visitor = getattr(self, method, None)
+
+        if visitor is None:
+            return self.generic_visit(node)
+
+        return await visitor(node)
+
+    async def visit_async_Assignment(self, node: Assignment) -> None:
+        self.assign(node.target.name, await self.visit_async(node.value))
+
+    async def visit_async_BinaryOperation(self, node: BinaryOperation) -> RuntimeType:
+        left: RuntimeType = await self.visit_async(node.left)
+        right: RuntimeType = await self.visit_async(node.right)
+
+        return self.operate(node, left, right)
+
+    async def visit_async_Block(self, node: Block) -> None:
+        for statement in node.statements:
+            await self.visit_async(statement)
+
+    async def visit_async_For(self, node: For) -> RuntimeType:
+        self.env_stack.append({})
+
+        try:
+            if node.initializer:
+                await self.visit_async(node.initializer)
+
+            while self.condition(node, await self.visit_async(node.condition)):
+                try:
+                    await self.visit_async(node.body)
+                except BreakSignal: break
+                except ContinueSignal: ...
+
+                if node.increment:
+                    await self.visit_async(node.increment)
+
+                self.charge()
+                await self.checkpoint()
+        finally:
+            self.env_stack.pop()
+
+        return Void()
+
+    async def visit_async_FunctionCall(self, node: FunctionCall) -> RuntimeType:
+        callee: RuntimeFunction = self.resolve_call(node)
+        arguments: list[RuntimeType] = [await self.visit_async(argument) for argument in node.arguments]
+
+        self.enter_call()
+        try:
+            result: RuntimeType = await callee.call_async(self, arguments)
+        finally:
+            self.depth -= 1
+
+        if not isinstance(callee, UserFunction):
+            await self.checkpoint()
+
+        return result
+
+    async def visit_async_If(self, node: If) -> None:
+        if self.condition(node, await self.visit_async(node.condition)):
+            await self.visit_async(node.branch_true)
+        elif node.branch_false:
+            await self.visit_async(node.branch_false)
+
+    async def visit_async_Inlined(self, node: Inlined) -> RuntimeType:
+        for binding in node.bindings:
+            await self.visit_async(binding)
+
+        self.enter_call()
+        try:
+            return await self.visit_async(node.body)
+        finally:
+            self.depth -= 1
+
+    async def visit_async_LogicalAnd(self, node: LogicalAnd) -> RuntimeType:
+        left: RuntimeType = await self.visit_async(node.left)
+        return await self.visit_async(node.right) if left.value else left
+
+    async def visit_async_LogicalOr(self, node: LogicalOr) -> RuntimeType:
+        left: RuntimeType = await self.visit_async(node.left)
+        return left if left.value else await self.visit_async(node.right)
+
+    async def visit_async_MethodCall(self, node: MethodCall) -> RuntimeType:
+        method: RuntimeFunction = self.bind_method(await self.visit_async(node.obj), node.name)
+        arguments: list[RuntimeType] = [await self.visit_async(argument) for argument in node.arguments]
+
+        result: RuntimeType = await method.call_async(self, arguments)
+
+        # Methods of runtime values are natives, so they yield like native function calls.
+        await self.checkpoint()
+        return result
+
+    async def visit_async_ParallelFor(self, node: ParallelFor) -> RuntimeType:
+        # The pool blocks until every chunk is done, so it waits on a thread instead of the event loop.
+        return await asyncio.to_thread(self.visit_ParallelFor, node)
+
+    async def visit_async_Program(self, node: Program) -> int:
+        self.reset_budget()
+        self.define_functions(node)
+
+        try:
+            for statement in node.statements:
+                if not isinstance(statement, FunctionDefinition):
+                    await self.visit_async(statement)
+
+            self.require_main()
+            return self.exit_code(await self.visit_async(FunctionCall("main", [])))
+        finally:
+            self.output.flush()
+
+    async def visit_async_Return(self, node: Return) -> RuntimeType:
+        value: RuntimeType = await self.visit_async(node.value) if node.value else Void()
+        raise ReturnSignal(value)
+
+    async def visit_async_UnaryOperation(self, node: UnaryOperation) -> RuntimeType:
+        return self.unary_operation(node.operator, await self.visit_async(node.operand))
+
+    async def visit_async_VariableDeclaration(self, node: VariableDeclaration) -> None:
+        value: RuntimeType = await self.visit_async(node.value)
+        self.env[node.name] = value
+
+    async def visit_async_While(self, node: While) -> None:
+        while self.condition(node, await self.visit_async(node.condition)):
+            try:
+                await self.visit_async(node.body)
+            except BreakSignal: break
+            except ContinueSignal: ...
+
+            self.charge()
+            await self.checkpoint()
\ No newline at end of file
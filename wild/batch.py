@@ -0,0 +1,98 @@
+from wild.budget import Budget
+from wild.output import Output
+from wild.program import CompiledProgram
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+
+import argparse
+import glob
+import os
+import sys
+
+__all__ = (
+    "BatchResult",
+    "run_batch",
+    "run_file",
+)
+
+@dataclass
+class BatchResult:
+    """Outcome of one script in a batch."""
+
+    path: str
+    exit_code: int | None
+    stdout: str
+    error: str | None = None
+
+def _warm_worker() -> None:
+    # Imports and lexer tables are loaded with this module; one throwaway
+    # compile also warms the parser before the first real script arrives.
+    CompiledProgram.from_source("Int main() { return 0; }")
+
+def expand_paths(patterns: list[str]) -> list[str]:
+    paths: list[str] = []
+
+    for pattern in patterns:
+        matches: list[str] = sorted(glob.glob(pattern, recursive=True))
+        paths.extend(matches if matches else [pattern])
+
+    return paths
+
+def run_file(path: str, budget: Budget | None = None) -> BatchResult:
+    output: Output = Output()
+
+    try:
+        with open(path) as file:
+            source: str = file.read()
+
+        exit_code: int = CompiledProgram.from_source(source).run(budget=budget, output=output)
+    except Exception as exception:
+        return BatchResult(path, None, output.getvalue().decode(), f"{type(exception).__name__}: {exception}")
+
+    return BatchResult(path, exit_code, output.getvalue().decode())
+
+def run_batch(patterns: list[str], workers: int | None = None, budget: Budget | None = None) -> list[BatchResult]:
+    """
+    Run every script matched by `patterns` on a pool of warm worker processes.
+
+    Results are returned in input order. Scripts are handed out in chunks so
+    that per-task IPC stays small next to the work itself.
+    """
+
+    paths: list[str] = expand_paths(patterns)
+    if not paths:
+        return []
+
+    workers = workers or os.cpu_count() or 1
+    chunksize: int = max(1, len(paths) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_worker) as executor:
+        return list(executor.map(partial(run_file, budget=budget), paths, chunksize=chunksize))
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog=args[0], description="Run many Wild scripts in parallel.")
+    parser.add_argument("patterns", nargs="+", help="script paths or glob patterns")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="omit captured stdout")
+
+    return parser.parse_args(args[1:])
+
+def main(args: list[str]) -> int:
+    options: argparse.Namespace = parse_args(args)
+    results: list[BatchResult] = run_batch(options.patterns, options.workers)
+
+    for result in results:
+        status: str = f"exit {result.exit_code}" if result.error is None else result.error
+        print(f"==> {result.path} ({status})")
+
+        if result.stdout and not options.quiet:
+            print(result.stdout, end="" if result.stdout.endswith("\n") else "\n")
+
+    failed: int = sum(1 for result in results if result.error is not None)
+    print(f"{len(results)} script{'s' if len(results) != 1 else ''}, {failed} failed")
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
\ No newline at end of file
@@ -0,0 +1,18 @@
+from typing import NamedTuple
+
+__all__ = ("Budget",)
+
+class Budget(NamedTuple):
+    """
+    Execution limits for a single run.
+
+    Fuel is charged at loop back-edges and function calls. It is handed out
+    in grants of `check_interval` units, so the step and wall-time limits are
+    only re-checked once per grant instead of at every charge. A limit of
+    `None` disables it.
+    """
+
+    steps: int | None = None
+    seconds: float | None = None
+    depth: int | None = None
+    check_interval: int = 1024
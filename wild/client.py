@@ -0,0 +1,43 @@
+import json
+import os
+import socket
+import sys
+
+# Deliberately imports nothing from the interpreter: the client only forwards a request.
+# The server imports these too, so both ends agree on where the socket lives.
+RUNTIME_DIRECTORY: str = os.environ.get("XDG_RUNTIME_DIR") or os.path.join(os.environ.get("TMPDIR", "/tmp"), f"wild-{os.getuid()}")
+DEFAULT_SOCKET: str = os.environ.get("WILD_SOCKET") or os.path.join(RUNTIME_DIRECTORY, "wild.sock")
+
+def run(request: dict, path: str = DEFAULT_SOCKET) -> int:
+    """Send `request` to a running `wild.server`, copy its output to stdout and return the exit code."""
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(path)
+        connection.sendall(json.dumps(request).encode() + b"\n")
+
+        with connection.makefile("rb") as frames:
+            for line in frames:
+                frame: dict = json.loads(line)
+
+                if "stdout" in frame:
+                    sys.stdout.write(frame["stdout"])
+                elif "exit" in frame:
+                    sys.stdout.flush()
+                    return frame["exit"]
+                elif "error" in frame:
+                    sys.stdout.flush()
+                    print(frame["error"], file=sys.stderr)
+                    return 1
+
+    error: str = "Server closed the connection without an exit code"
+    raise ConnectionError(error)
+
+def main(args: list[str]) -> int:
+    if len(args) < 2:
+        print(f"Proper usage: `\"{args[0]}\" \"<file_to_run>\" [arguments...]`")
+        return 0
+
+    return run({"path": os.path.abspath(args[1]), "arguments": args[2:]})
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
\ No newline at end of file
@@ -1,5 +1,6 @@
 class ArgumentCountError(Exception):...
 class ArgumentTypeError(Exception):...
+class BudgetError(Exception):...
 class CallError(Exception):...
 class ConversionError(Exception):...
 class ExistenceError(Exception):...
@@ -1,12 +1,10 @@
-from wild.lexer import Lexer
-from wild.parser import Parser
-from wild.interpreter import Interpreter
+from wild.program import CompiledProgram
 
 import sys
 
 def parse_args(args: list[str]) -> list[str]:
     if len(args) < 2:
-        print(f"Proper usage: `\"{args[0]}\" \"<file_to_run>\"`")
+        print(f"Proper usage: `\"{args[0]}\" \"<file_to_run>\" [arguments...]`")
         sys.exit(0)
     
     return args
@@ -14,14 +12,8 @@ def parse_args(args: list[str]) -> list[str]:
 def main(args: list[str]) -> None:
     args = parse_args(args)
 
-    with open(args[1]) as file:
-        source: str = file.read()
-
-    lexer: Lexer = Lexer(source)
-    parser: Parser = Parser(lexer.tokenize())
-
-    interpreter: Interpreter = Interpreter()
-    interpreter.visit(parser.parse())
+    program: CompiledProgram = CompiledProgram.from_file(args[1])
+    program.run(arguments=args[2:])
 
 if __name__ == "__main__":
     main(sys.argv)
\ No newline at end of file
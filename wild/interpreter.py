@@ -1,42 +1,238 @@
 from __future__ import annotations
 
+from wild.budget import Budget
 from wild.errors import *
 from wild.nodes.base import *
 from wild.nodes.expression import *
 from wild.nodes.statement import *
-from wild.natives.base import NativeFunction, NativeMethod, UserFunction, RuntimeFunction
-from wild.natives.print import native_print
+from wild.natives.base import NativeMethod, UserFunction, RuntimeFunction
+from wild.natives.registry import NativeRegistry, REGISTRY
+from wild.output import Output
+from wild.quickening import DEOPT_LIMIT, QuickeningStats, SPECIALIZATIONS
 from wild.signals import *
 from wild.tokens import *
 from wild.type.base import RuntimeType
+from wild.type.boolean import Boolean
 from wild.type.empty import Void
 from wild.type.numeric import Integer
-from typing import Callable
+from typing import Callable, Iterable
+
+import operator
+import sys
+import time
 
 __all__ = ("Interpreter",)
 
+BINARY_OPERATORS: dict[TokenType, Callable[[RuntimeType, RuntimeType], RuntimeType]] = {
+    TokenType.PLUS: operator.add,
+    TokenType.MINUS: operator.sub,
+    TokenType.MULT: operator.mul,
+    TokenType.DIV: operator.truediv,
+    TokenType.MOD: operator.mod,
+    TokenType.EQUAL: operator.eq,
+    TokenType.NOT_EQ: lambda left, right: Boolean(not (left == right)),
+    TokenType.LESS: operator.lt,
+    TokenType.GREATER: operator.gt,
+    TokenType.LESS_EQ: operator.le,
+    TokenType.GREATER_EQ: operator.ge,
+}
+
 class Interpreter:
-    def __init__(self) -> None:
-        self.globals: dict[str, RuntimeType | FunctionDefinition] = {
-            "print": NativeFunction(1, native_print)
-        }
+    def __init__(
+        self,
+        budget: Budget | None = None,
+        natives: dict[str, RuntimeFunction] | None = None,
+        output: Output | None = None,
+        registry: NativeRegistry | None = None,
+    ) -> None:
+        self.globals: dict[str, RuntimeType | FunctionDefinition] = dict(natives) if natives else {}
+        self.registry: NativeRegistry = registry or REGISTRY
         self.env_stack: list[dict[str, RuntimeType | FunctionDefinition]] = [self.globals]
+        self.arguments: tuple[str, ...] = ()
+
+        self.output: Output = output or Output.stdout()
+        self.quickening: QuickeningStats = QuickeningStats()
+
+        self.budget: Budget = budget or Budget()
+        self.reset_budget()
 
     @property
     def env(self) -> dict[str, RuntimeType]: return self.env_stack[-1]
 
+    def assign(self, name: str, value: RuntimeType) -> None:
+        for env in reversed(self.env_stack):
+            if name in env:
+                env[name] = value
+                return
+
+        error: str = f"Cannot assign to undefined variable `{name}`"
+        raise InterpreterError(error)
+
+    def bind_method(self, instance: RuntimeType, name: str) -> RuntimeFunction:
+        if hasattr(instance, "get_method"):
+            method: NativeMethod = instance.get_method(name)
+        else:
+            error: str = f"{instance.__class__.__name__} has no method \"{name}\""
+            raise ExistenceError(error)
+
+        if not isinstance(method, RuntimeFunction):
+            error: str = f"Property \"{name}\" is not callable"
+            raise CallError(error)
+
+        return method
+
+    def call_main(self) -> int:
+        call_main: FunctionCall = FunctionCall("main", [])
+
+        try:
+            return self.exit_code(self.visit(call_main))
+        finally:
+            self.output.flush()
+
+    def charge(self) -> None:
+        self.fuel -= 1
+        if self.fuel <= 0:
+            self.refuel()
+
+    def condition(self, node: If | For | While, value: RuntimeType) -> bool:
+        """
+        Decide a branch or loop statement from the value of its condition.
+
+        Both interpreters evaluate the condition themselves and pass it here,
+        so subclasses hook in once to observe every outcome.
+        """
+
+        return bool(value.value)
+
+    def define_functions(self, node: Program) -> None:
+        for statement in node.statements:
+            if isinstance(statement, FunctionDefinition):
+                self.visit(statement)
+
+    def enter_call(self) -> None:
+        """Charge for a call and take one level of the recursion budget, which the caller gives back with `depth -= 1`."""
+
+        self.charge()
+
+        if self.depth >= self.max_depth:
+            error: str = f"Recursion budget of {self.max_depth} calls exhausted"
+            raise BudgetError(error)
+
+        self.depth += 1
+
+    def execute(self, statements: Iterable[ASTNode]) -> None:
+        """Run top-level statements, flushing what they printed even when one of them fails."""
+
+        try:
+            for statement in statements:
+                self.visit(statement)
+        finally:
+            self.output.flush()
+
+    def exit_code(self, main_result: RuntimeType) -> int:
+        if isinstance(main_result, Integer):
+            return main_result.value
+        
+        error: str = "Entry function \"main\" must return Int"
+        raise ReturnTypeError(error)
+
     def generic_visit(self, node: ASTNode) -> RuntimeType:
         error: str = f"No visit method for {type(node).__name__}"
         raise InterpreterError(error)
 
+    def initialize(self, node: Program) -> None:
+        self.define_functions(node)
+        self.execute(statement for statement in node.statements if not isinstance(statement, FunctionDefinition))
+        self.require_main()
+
     def lookup_variable(self, name: str) -> RuntimeType:
         for env in reversed(self.env_stack):
             if name in env:
                 return env[name]
         
+        native: RuntimeFunction | None = self.resolve_native(name)
+        if native is not None:
+            return native
+        
         error: str = f"Undefined variable or function `{name}`"
         raise InterpreterError(error)
 
+    def refuel(self) -> None:
+        # Fuel only drops below zero when `spend` charged several steps at once.
+        self.steps += self.grant - self.fuel
+
+        if self.budget.steps is not None and self.steps > self.budget.steps:
+            error: str = f"Step budget of {self.budget.steps} exhausted"
+            raise BudgetError(error)
+
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            error: str = f"Time budget of {self.budget.seconds}s exhausted"
+            raise BudgetError(error)
+
+        self.grant = self.budget.check_interval
+        if self.budget.steps is not None:
+            self.grant = min(self.grant, self.budget.steps - self.steps + 1)
+
+        self.fuel = self.grant
+
+    def resolve_call(self, node: FunctionCall) -> RuntimeFunction:
+        # A pinned name is never bound below the globals, so finding it there unchanged makes the scope walk redundant.
+        target: RuntimeFunction | None = node.target
+        if target is not None and self.globals.get(node.name) is target:
+            return target
+
+        callee: ASTNode | RuntimeType = self.lookup_variable(node.name)
+
+        if not isinstance(callee, RuntimeFunction):
+            error: str = f"Can only call functions, got {callee}."
+            raise InterpreterError(error)
+        
+        if len(node.arguments) != callee.arity():
+            error: str = f"Expected {callee.arity()} argument{'s' if callee.arity() > 1 else ''}, got {len(node.arguments)}"
+            raise ArgumentCountError(error)
+        
+        return callee
+
+    def resolve_native(self, name: str) -> RuntimeFunction | None:
+        native: RuntimeFunction | None = self.registry.resolve(name)
+
+        if native is not None:
+            self.globals[name] = native
+        
+        return native
+
+    def require_main(self) -> None:
+        if "main" not in self.globals:
+            error: str = "Entry function \"main\" must be defined"
+            raise InterpreterError(error)
+
+    def reset_budget(self) -> None:
+        self.steps: int = 0
+        self.depth: int = 0
+        self.max_depth: int = self.budget.depth if self.budget.depth is not None else sys.maxsize
+        self.deadline: float | None = None
+
+        if self.budget.seconds is not None:
+            self.deadline = time.monotonic() + self.budget.seconds
+
+        self.grant: int = self.budget.check_interval
+        if self.budget.steps is not None:
+            self.grant = min(self.grant, self.budget.steps + 1)
+
+        self.fuel: int = self.grant
+
+    def spend(self, steps: int) -> None:
+        """Charge `steps` at once, for work another interpreter did on behalf of this run."""
+
+        self.fuel -= steps
+        if self.fuel <= 0:
+            self.refuel()
+
+    def spent(self) -> int:
+        """Steps charged so far, including the part of the current grant already used."""
+
+        return self.steps + self.grant - self.fuel
+
     def visit(self, node: ASTNode) -> Callable[[ASTNode], RuntimeType | None]:
         method: str = f"visit_{type(node).__name__}"
         visitor = getattr(self, method, self.generic_visit)
@@ -44,38 +240,52 @@ class Interpreter:
         return visitor(node)
     
     def visit_Assignment(self, node: Assignment) -> None:
-        value: RuntimeType = self.visit(node.value)
+        self.assign(node.target.name, self.visit(node.value))
 
-        for env in reversed(self.env_stack):
-            if node.target.name in env:
-                env[node.target.name] = value
-                return
+    def binary_operation(self, operator: TokenType, left: RuntimeType, right: RuntimeType) -> RuntimeType:
+        function: Callable[[RuntimeType, RuntimeType], RuntimeType] | None = BINARY_OPERATORS.get(operator)
+
+        if function is None:
+            error: str = f"Unknown operator {operator}"
+            raise InterpreterError(error)
         
-        error: str = f"Cannot assign to undefined variable `{node.target.name}`"
-        raise InterpreterError(error)
+        return function(left, right)
+
+    def operate(self, node: BinaryOperation, left: RuntimeType, right: RuntimeType) -> RuntimeType:
+        """Evaluate `node` with its specialized handler while the operand types still match it."""
+
+        quick: tuple[type, type, Callable] | None = node.quick
+        if quick is not None and quick[0] is type(left) and quick[1] is type(right):
+            self.quickening.hits += 1
+            return quick[2](left, right)
+
+        return self.quicken(node, left, right)
+
+    def quicken(self, node: BinaryOperation, left: RuntimeType, right: RuntimeType) -> RuntimeType:
+        """Evaluate `node` generically, then specialize it for the operand types it just saw."""
+
+        self.quickening.misses += 1
+
+        if node.deopts < DEOPT_LIMIT:
+            handler: Callable | None = SPECIALIZATIONS.get((node.operator, type(left), type(right)))
+
+            if node.quick is not None:
+                node.deopts += 1
+                self.quickening.deopts += 1
+
+            if handler is not None and node.deopts < DEOPT_LIMIT:
+                node.quick = (type(left), type(right), handler)
+                self.quickening.specializations += 1
+            else:
+                node.quick = None
+
+        return self.binary_operation(node.operator, left, right)
 
     def visit_BinaryOperation(self, node: BinaryOperation) -> RuntimeType:
         left: RuntimeType = self.visit(node.left)
         right: RuntimeType = self.visit(node.right)
-        operator: TokenType = node.operator
 
-        match operator:
-            case TokenType.PLUS: return left + right
-            case TokenType.MINUS: return left - right
-            case TokenType.MULT: return left * right
-            case TokenType.DIV: return left / right
-            case TokenType.MOD: return left % right
-            case TokenType.EQUAL: return left == right
-            case TokenType.NOT_EQ: return not (left == right)
-            case TokenType.LESS: return left < right
-            case TokenType.GREATER: return left > right
-            case TokenType.LESS_EQ: return left <= right
-            case TokenType.GREATER_EQ: return left >= right
-            case TokenType.AND: return left & right
-            case TokenType.OR: return left | right
-            case _:
-                error: str = f"Unknown operator {operator}"
-                raise InterpreterError(error)
+        return self.operate(node, left, right)
 
     def visit_Block(self, node: Block) -> None:
         for statement in node.statements:
@@ -91,11 +301,7 @@ class Interpreter:
             if node.initializer:
                 self.visit(node.initializer)
             
-            while True:
-                condition_value: RuntimeType = self.visit(node.condition)
-                if not condition_value.value:
-                    break
-
+            while self.condition(node, self.visit(node.condition)):
                 try:
                     self.visit(node.body)
                 except BreakSignal: break
@@ -103,55 +309,67 @@ class Interpreter:
 
                 if node.increment:
                     self.visit(node.increment)
+
+                self.charge()
         finally:
             self.env_stack.pop()
         
         return Void()
 
     def visit_FunctionCall(self, node: FunctionCall) -> RuntimeType:
-        callee: ASTNode | RuntimeType = self.lookup_variable(node.name)
+        callee: RuntimeFunction = self.resolve_call(node)
+        arguments: list[RuntimeType] = [self.visit(argument) for argument in node.arguments]
 
-        if not isinstance(callee, RuntimeFunction):
-            error: str = f"Can only call functions, got {callee}."
-            raise InterpreterError(error)
-        
-        if len(node.arguments) != callee.arity():
-            error: str = f"Expected {callee.arity()} argument{'s' if callee.arity() > 1 else ''}, got {len(node.arguments)}"
-            raise ArgumentCountError(error)
-        
-        arguments: list[ASTNode] = [self.visit(argument) for argument in node.arguments]
-        return callee.call(self, arguments)
+        self.enter_call()
+        try:
+            return callee.call(self, arguments)
+        finally:
+            self.depth -= 1
 
     def visit_FunctionDefinition(self, node: FunctionDefinition) -> None:
         function_object: UserFunction = UserFunction(node)
         self.globals[node.name] = function_object
 
     def visit_If(self, node: If) -> None:
-        condition: RuntimeType = self.visit(node.condition)
-
-        if condition.value:
+        if self.condition(node, self.visit(node.condition)):
             self.visit(node.branch_true)
         elif node.branch_false:
             self.visit(node.branch_false)
 
+    def visit_Inlined(self, node: Inlined) -> RuntimeType:
+        for binding in node.bindings:
+            self.visit(binding)
+
+        # Charged like the call it replaced, once its arguments are bound, so inlining never stretches a budget.
+        self.enter_call()
+        try:
+            return self.visit(node.body)
+        finally:
+            self.depth -= 1
+
     def visit_Literal(self, node: Literal) -> RuntimeType:
         return node.value
 
+    def visit_LogicalAnd(self, node: LogicalAnd) -> RuntimeType:
+        left: RuntimeType = self.visit(node.left)
+        return self.visit(node.right) if left.value else left
+
+    def visit_LogicalOr(self, node: LogicalOr) -> RuntimeType:
+        left: RuntimeType = self.visit(node.left)
+        return left if left.value else self.visit(node.right)
+
     def visit_MethodCall(self, node: MethodCall) -> RuntimeType:
-        obj_instance: RuntimeType = self.visit(node.obj)
+        method: RuntimeFunction = self.bind_method(self.visit(node.obj), node.name)
+        arguments: list[RuntimeType] = [self.visit(argument) for argument in node.arguments]
 
-        if hasattr(obj_instance, "get_method"):
-            method_obj: NativeMethod = obj_instance.get_method(node.name)
-        else:
-            error: str = f"{obj_instance.__class__.__name__} has no method \"{node.name}\""
-            raise ExistenceError(error)
-        
-        if not isinstance(method_obj, RuntimeFunction):
-            error: str = f"Property \"{node.name}\" is not callable"
-            raise CallError(error)
-        
-        args: list[RuntimeType] = [self.visit(arg) for arg in node.arguments]
-        return method_obj.call(self, args)
+        return method.call(self, arguments)
+
+    def visit_ParallelFor(self, node: ParallelFor) -> RuntimeType:
+        # Imported on first use, so scripts without parallel loops never load the process pool machinery.
+        from wild.parallel import run_parallel_for
+
+        run_parallel_for(self, node)
+        return Void()
 
     def visit_Postfix(self, node: Postfix) -> RuntimeType:
         if not isinstance(node.target, Variable):
@@ -177,45 +395,34 @@ class Interpreter:
         return old_value
 
     def visit_Program(self, node: Program) -> RuntimeType:
-        for statement in node.statements:
-            if isinstance(statement, FunctionDefinition):
-                self.visit(statement)
-        
-        for statement in node.statements:
-            if not isinstance(statement, FunctionDefinition):
-                self.visit(statement)
-        
-        if "main" not in self.globals:
-            error: str = "Entry function \"main\" must be defined"
-            raise InterpreterError(error)
+        self.reset_budget()
+        self.initialize(node)
 
-        call_main: FunctionCall = FunctionCall("main", [])
-        main_result: RuntimeType = self.visit(call_main)
-    
-        if isinstance(main_result, Integer):
-            return main_result.value
-        else:
-            error: str = "Entry function \"main\" must return Int"
-            raise ReturnTypeError(error)
+        return self.call_main()
 
     def visit_Return(self, node: Return) -> RuntimeType:
         value: RuntimeType = self.visit(node.value) if node.value else Void()
         raise ReturnSignal(value)
 
-    def visit_UnaryOperation(self, node: UnaryOperation) -> RuntimeType:
-        value: RuntimeType = self.visit(node.operand)
-
-        match node.operator:
+    def unary_operation(self, operator: TokenType, value: RuntimeType) -> RuntimeType:
+        match operator:
             case TokenType.MINUS: return value * Integer(-1)
-            case TokenType.NOT: return not value
-        
+            case TokenType.NOT: return Boolean(not value.value)
+
         return value
 
+    def visit_UnaryOperation(self, node: UnaryOperation) -> RuntimeType:
+        return self.unary_operation(node.operator, self.visit(node.operand))
+
     def visit_Variable(self, node: Variable) -> RuntimeType:
         for env in reversed(self.env_stack):
             if node.name in env:
                 return env[node.name]
         
+        native: RuntimeFunction | None = self.resolve_native(node.name)
+        if native is not None:
+            return native
+        
         error: str = f"Undefined variable `{node.name}`"
         raise InterpreterError(error)
     
@@ -224,8 +431,10 @@ class Interpreter:
         self.env[node.name] = value
     
     def visit_While(self, node: While) -> None:
-        while self.visit(node.condition).value:
+        while self.condition(node, self.visit(node.condition)):
             try:
                 self.visit(node.body)
             except BreakSignal: break
-            except ContinueSignal: continue
\ No newline at end of file
+            except ContinueSignal: ...
+
+            self.charge()
\ No newline at end of file
@@ -4,12 +4,14 @@ import re
 
 __all__ = ("Lexer",)
 
+# Built once per process, so creating a Lexer costs nothing beyond storing the source.
+TOKEN_PATTERN: re.Pattern[str] = re.compile('|'.join(f"(?P<{token.name}>{token.value})" for token in TokenType))
+TOKEN_KINDS: dict[str, TokenType] = {token.name: token for token in TokenType}
+
 class Lexer:
     def __init__(self, source: str) -> None:
         self.source: str = source
-
-        regex_parts = [f"(?P<{token.name}>{token.value})" for token in TokenType]
-        self.regex: re.Pattern[str] = re.compile('|'.join(regex_parts))
+        self.regex: re.Pattern[str] = TOKEN_PATTERN
     
     def tokenize(self) -> list[Token]:
         tokens: list[Token] = []
@@ -28,7 +30,7 @@ class Lexer:
                 column += 1
                 continue
 
-            token: Token = Token(TokenType[kind_name], value, line, column)
+            token: Token = Token(TOKEN_KINDS[kind_name], value, line, column)
             tokens.append(token)
             column += len(value)
         
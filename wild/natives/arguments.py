@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from wild.errors import SubscriptError
+from wild.type.base import validate_arguments, RuntimeType
+from wild.type.numeric import Integer
+from wild.type.strings import String
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wild.interpreter import Interpreter
+
+def native_argument(interpreter: Interpreter, arguments: list[RuntimeType]) -> String:
+    """
+    ;;p:index:Int
+    Get a command-line argument passed to the script.
+
+    Parameters
+    ----------
+    index : Int
+        Position of the argument, starting at 0.
+    """
+
+    validate_arguments(1, [Integer], arguments)
+    index: int = arguments[0].value
+
+    if not 0 <= index < len(interpreter.arguments):
+        error: str = f"Argument index {index} out of range for {len(interpreter.arguments)} arguments"
+        raise SubscriptError(error)
+
+    return String(interpreter.arguments[index])
+
+def native_argument_count(interpreter: Interpreter, arguments: list[RuntimeType]) -> Integer:
+    """
+    ;;p:
+    Get the number of command-line arguments passed to the script.
+    """
+
+    validate_arguments(0, [], arguments)
+    return Integer(len(interpreter.arguments))
\ No newline at end of file
@@ -1,3 +1,4 @@
+from wild.errors import CallError
 from wild.nodes.statement import FunctionDefinition
 from wild.signals import ReturnSignal
 from wild.type.base import RuntimeType
@@ -5,8 +6,28 @@ from wild.type.empty import Void
 from abc import ABC, abstractmethod
 from typing import Callable, TYPE_CHECKING
 
+import functools
+
 if TYPE_CHECKING:
     from interpreter import Interpreter
+    from async_interpreter import AsyncInterpreter
+
+# Same flag as `inspect.CO_COROUTINE`, without importing inspect at startup.
+CO_COROUTINE: int = 0x80
+
+def is_coroutine_function(func: Callable) -> bool:
+    """Check whether calling `func` returns a coroutine, looking through partials and callable objects."""
+
+    while isinstance(func, functools.partial):
+        func = func.func
+
+    code = getattr(func, "__code__", None) or getattr(getattr(type(func), "__call__", None), "__code__", None)
+    if code is not None:
+        return bool(code.co_flags & CO_COROUTINE)
+
+    # Builtins and other callables without bytecode are rare enough to pay for inspect.
+    import inspect
+    return inspect.iscoroutinefunction(func)
 
 class RuntimeFunction(ABC):
     @abstractmethod
@@ -14,19 +35,21 @@ class RuntimeFunction(ABC):
     @abstractmethod
     def call(self, interpreter: Interpreter, arguments: list):...
 
+    async def call_async(self, interpreter: AsyncInterpreter, arguments: list) -> RuntimeType:
+        return self.call(interpreter, arguments)
+
 class UserFunction(RuntimeFunction):
     def __init__(self, declaration: FunctionDefinition) -> None:
         self.declaration: FunctionDefinition = declaration
     
     def __repr__(self) -> str: return f"<fn {self.declaration.name}>"
     def arity(self) -> int: return len(self.declaration.parameters)
-    def call(self, interpreter: Interpreter, arguments: list) -> RuntimeType:
-        environment: dict[str, RuntimeType] = {}
 
-        for (_, parameter_name), argument in zip(self.declaration.parameters, arguments):
-            environment[parameter_name] = argument
-        
-        interpreter.env_stack.append(environment)
+    def frame(self, arguments: list) -> dict[str, RuntimeType]:
+        return {parameter: argument for (_, parameter), argument in zip(self.declaration.parameters, arguments)}
+
+    def call(self, interpreter: Interpreter, arguments: list) -> RuntimeType:
+        interpreter.env_stack.append(self.frame(arguments))
         try:
             interpreter.visit(self.declaration.body)
         except ReturnSignal as signal:
@@ -36,14 +59,38 @@ class UserFunction(RuntimeFunction):
         
         return Void()
 
+    async def call_async(self, interpreter: AsyncInterpreter, arguments: list) -> RuntimeType:
+        interpreter.env_stack.append(self.frame(arguments))
+        try:
+            await interpreter.visit_async(self.declaration.body)
+        except ReturnSignal as signal:
+            return signal.value
+        finally:
+            interpreter.env_stack.pop()
+        
+        return Void()
+
 class NativeFunction(RuntimeFunction):
     def __init__(self, arity: int, func: Callable[[Interpreter, list], RuntimeType]) -> None:
         self._arity: int = arity
         self._func: Callable[[Interpreter, list], RuntimeType] = func
+        self.is_async: bool = is_coroutine_function(func)
     
     def __repr__(self) -> str: return "<builtin>"
     def arity(self) -> int: return self._arity
-    def call(self, interpreter: Interpreter, arguments: list) -> RuntimeType: return self._func(interpreter, arguments)
+    def call(self, interpreter: Interpreter, arguments: list) -> RuntimeType:
+        if self.is_async:
+            name: str = getattr(self._func, "__name__", repr(self._func))
+            error: str = f"Native `{name}` is asynchronous and needs an AsyncInterpreter"
+            raise CallError(error)
+        
+        return self._func(interpreter, arguments)
+
+    async def call_async(self, interpreter: AsyncInterpreter, arguments: list) -> RuntimeType:
+        if self.is_async:
+            return await self._func(interpreter, arguments)
+        
+        return self._func(interpreter, arguments)
 
 class NativeMethod(RuntimeFunction):
     def __init__(self, instance: RuntimeType, arity: int, func: Callable[[Interpreter, RuntimeType, list], RuntimeType]) -> None:
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from wild.type.base import validate_arguments, RuntimeType
+from wild.type.map import Map
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wild.interpreter import Interpreter
+
+def native_map(_: Interpreter, arguments: list[RuntimeType]) -> Map:
+    """
+    ;;p:
+    Create an empty hash map.
+
+    Keys may be Int, Float, String or Boolean values; `get`, `put`,
+    `contains` and `remove` run in constant time.
+    """
+
+    validate_arguments(0, [], arguments)
+    return Map()
\ No newline at end of file
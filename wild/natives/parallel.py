@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from wild.errors import ArgumentCountError
+from wild.natives.base import RuntimeFunction
+from wild.parallel import parallel_map
+from wild.type.base import validate_arguments, RuntimeType
+from wild.type.map import Map
+from wild.type.numeric import Integer
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wild.interpreter import Interpreter
+
+def native_parallel_map(interpreter: Interpreter, arguments: list[RuntimeType]) -> Map:
+    """
+    ;;p:function:Function,start:Int,end:Int
+    Call a function for every index in a range, spread over a pool of processes.
+
+    Calls must not depend on each other: each process works on its own copy
+    of the script's variables, so assignments made by `function` are lost.
+
+    Parameters
+    ----------
+    function : Function
+        Function taking one Int, the index.
+    start : Int
+        First index.
+    end : Int
+        Index to stop before.
+    """
+
+    validate_arguments(3, [RuntimeFunction, Integer, Integer], arguments)
+    function, start, end = arguments
+
+    if function.arity() != 1:
+        error: str = f"Function passed to parallelMap must take 1 argument, not {function.arity()}"
+        raise ArgumentCountError(error)
+
+    return parallel_map(interpreter, function, start.value, end.value)
\ No newline at end of file
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from wild.interpreter import Interpreter
 
-def native_print(_: Interpreter, arguments: list[RuntimeType]) -> Void:
+def native_print(interpreter: Interpreter, arguments: list[RuntimeType]) -> Void:
     """
     ;;p:message:Object | Object[]
     Output a message to the terminal.
@@ -24,7 +24,7 @@ def native_print(_: Interpreter, arguments: list[RuntimeType]) -> Void:
         if isinstance(argument, String):
             raw_values.append(argument.value)
         else:
-            raw_values.append(str(argument.value))
+            raw_values.append(str(argument))
     
-    print(' '.join(raw_values))
+    interpreter.output.write(' '.join(raw_values) + "\n")
     return Void()
\ No newline at end of file
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from wild.errors import InterpreterError
+from wild.natives.base import NativeFunction, RuntimeFunction
+from typing import Callable, Iterable, NamedTuple, TYPE_CHECKING
+
+import importlib
+import threading
+
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoint
+    from wild.interpreter import Interpreter
+    from wild.type.base import RuntimeType
+
+__all__ = (
+    "NativeRegistry",
+    "NativeSpec",
+    "REGISTRY",
+)
+
+ENTRY_POINT_GROUP: str = "wild.natives"
+
+class NativeSpec(NamedTuple):
+    """Declaration of a native function whose module is imported on first use."""
+
+    name: str
+    arity: int
+    module: str
+    attribute: str
+
+class NativeRegistry:
+    """
+    Name to native function table that only imports what scripts reference.
+
+    Built-in natives are declared with `NativeSpec`s, and hosts can
+    `register` callables directly. Third-party packages can publish
+    `RuntimeFunction` objects under the `wild.natives` entry point group.
+    Package metadata is only scanned the first time a name is missing from
+    both.
+
+    Loaded natives are published under a lock and never replaced by a
+    lookup, so one registry can serve interpreters on many threads.
+    """
+
+    def __init__(self, specs: Iterable[NativeSpec] = ()) -> None:
+        self.specs: dict[str, NativeSpec] = {spec.name: spec for spec in specs}
+        self.loaded: dict[str, RuntimeFunction] = {}
+        self.plugins: dict[str, EntryPoint] | None = None
+        self.lock: threading.RLock = threading.RLock()
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.loaded or name in self.specs or name in self._plugins()
+
+    def _load(self, name: str) -> RuntimeFunction | None:
+        # Another thread may have loaded the name while this one waited for the lock.
+        function: RuntimeFunction | None = self.loaded.get(name)
+        if function is not None:
+            return function
+
+        spec: NativeSpec | None = self.specs.get(name)
+        if spec is not None:
+            module = importlib.import_module(spec.module)
+            function = NativeFunction(spec.arity, getattr(module, spec.attribute))
+        elif name in self._plugins():
+            function = self.plugins[name].load()
+
+            if not isinstance(function, RuntimeFunction):
+                error: str = f"Entry point `{name}` must provide a RuntimeFunction, got {type(function).__name__}"
+                raise InterpreterError(error)
+        else:
+            return None
+
+        self.loaded[name] = function
+        return function
+
+    def _plugins(self) -> dict[str, EntryPoint]:
+        with self.lock:
+            if self.plugins is None:
+                from importlib.metadata import entry_points
+                self.plugins = {entry_point.name: entry_point for entry_point in entry_points(group=ENTRY_POINT_GROUP)}
+
+        return self.plugins
+
+    def declare(self, spec: NativeSpec) -> None:
+        with self.lock:
+            self.specs[spec.name] = spec
+            self.loaded.pop(spec.name, None)
+
+    def register(self, name: str, arity: int, func: Callable[[Interpreter, list], RuntimeType]) -> None:
+        with self.lock:
+            self.loaded[name] = NativeFunction(arity, func)
+
+    def resolve(self, name: str) -> RuntimeFunction | None:
+        function: RuntimeFunction | None = self.loaded.get(name)
+        if function is not None:
+            return function
+
+        with self.lock:
+            return self._load(name)
+
+REGISTRY: NativeRegistry = NativeRegistry([
+    NativeSpec("Map", 0, "wild.natives.maps", "native_map"),
+    NativeSpec("argument", 1, "wild.natives.arguments", "native_argument"),
+    NativeSpec("argumentCount", 0, "wild.natives.arguments", "native_argument_count"),
+    NativeSpec("openFile", 1, "wild.natives.streams", "native_open_file"),
+    NativeSpec("parallelMap", 3, "wild.natives.parallel", "native_parallel_map"),
+    NativeSpec("print", 1, "wild.natives.print", "native_print"),
+    NativeSpec("stdin", 0, "wild.natives.streams", "native_stdin"),
+])
\ No newline at end of file
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from wild.errors import ExistenceError
+from wild.type.base import validate_arguments, RuntimeType
+from wild.type.stream import Stream
+from wild.type.strings import String
+from typing import TYPE_CHECKING
+
+import mmap
+import sys
+import threading
+
+if TYPE_CHECKING:
+    from wild.interpreter import Interpreter
+
+_stdin: Stream | None = None
+_stdin_lock: threading.Lock = threading.Lock()
+
+def native_open_file(_: Interpreter, arguments: list[RuntimeType]) -> Stream:
+    """
+    ;;p:path:String
+    Open a file for streaming reads.
+
+    The file is memory-mapped, so lines and chunks are read straight from the
+    page cache and even very large files are processed in constant memory.
+
+    Parameters
+    ----------
+    path : String
+        Path of the file to read.
+    """
+
+    validate_arguments(1, [String], arguments)
+    path: str = arguments[0].value
+
+    try:
+        file = open(path, "rb")
+    except OSError as exception:
+        error: str = f"Cannot open \"{path}\": {exception.strerror}"
+        raise ExistenceError(error)
+
+    try:
+        mapping: mmap.mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        # Empty files and pipes cannot be mapped; a buffered reader streams them just as well.
+        return Stream(file, path)
+
+    return Stream(mapping, path, (file,))
+
+def native_stdin(_: Interpreter, arguments: list[RuntimeType]) -> Stream:
+    """
+    ;;p:
+    Get the standard input stream.
+
+    Every call returns the same stream, so lines are never lost between
+    readers.
+    """
+
+    global _stdin
+
+    validate_arguments(0, [], arguments)
+
+    with _stdin_lock:
+        if _stdin is None:
+            _stdin = Stream(sys.stdin.buffer, "<stdin>")
+
+    return _stdin
\ No newline at end of file
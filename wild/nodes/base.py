@@ -1,3 +1,49 @@
+from collections.abc import Iterator
+
 __all__ = ("ASTNode",)
 
-class ASTNode:...
\ No newline at end of file
+class ASTNode:
+    """
+    Base of every syntax tree node.
+
+    Nodes list their constructor arguments in `fields` rather than being
+    dataclasses. Generating dataclass methods for each node class was the
+    largest single cost of importing the interpreter. Optional fields take
+    their default from a class attribute of the same name.
+    """
+
+    fields: tuple[str, ...] = ()
+    # Source line of the first token, set by the parser on statements only.
+    line: int | None = None
+
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        if len(args) > len(self.fields):
+            error: str = f"{type(self).__name__} takes {len(self.fields)} arguments, got {len(args)}"
+            raise TypeError(error)
+
+        for name, value in zip(self.fields, args):
+            setattr(self, name, value)
+
+        for name in self.fields[len(args):]:
+            if name in kwargs:
+                setattr(self, name, kwargs.pop(name))
+            elif not hasattr(type(self), name):
+                error: str = f"{type(self).__name__} is missing argument `{name}`"
+                raise TypeError(error)
+
+        if kwargs:
+            error: str = f"{type(self).__name__} got unexpected argument `{next(iter(kwargs))}`"
+            raise TypeError(error)
+
+    def __repr__(self) -> str:
+        arguments: str = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.fields)
+        return f"{type(self).__name__}({arguments})"
+
+    def children(self) -> Iterator[ASTNode]:
+        for name in self.fields:
+            value: object = getattr(self, name)
+
+            if isinstance(value, ASTNode):
+                yield value
+            elif isinstance(value, list):
+                yield from (item for item in value if isinstance(item, ASTNode))
\ No newline at end of file
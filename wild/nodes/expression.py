@@ -1,55 +1,128 @@
 from wild.nodes.base import ASTNode
 from wild.tokens import *
 from wild.type.base import RuntimeType
-from dataclasses import dataclass
+from typing import Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from wild.natives.base import RuntimeFunction
 
 __all__ = (
     "BinaryOperation",
     "FunctionCall",
     "Get",
+    "Inlined",
     "Literal",
+    "LogicalAnd",
+    "LogicalOr",
     "MethodCall",
     "Postfix",
     "UnaryOperation",
     "Variable",
 )
 
-@dataclass
 class BinaryOperation(ASTNode):
+    fields = ("left", "operator", "right")
+
     left: ASTNode
     operator: TokenType
     right: ASTNode
 
-@dataclass
+    # Specialized handler as `(left type, right type, handler)`, replaced as a whole so threads never see half of it.
+    quick: tuple[type, type, Callable] | None = None
+    deopts: int = 0
+
+    def __getstate__(self) -> dict[str, object]:
+        # Handlers are lambdas, which cannot be pickled, so only the operand types they were specialized for are kept.
+        state: dict[str, object] = dict(self.__dict__)
+        quick: tuple[type, type, Callable] | None = state.pop("quick", None)
+
+        if quick is not None:
+            state["quick"] = quick[:2]
+
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        # Imported here because the handler table depends on the runtime types, which depend on the nodes.
+        from wild.quickening import SPECIALIZATIONS
+
+        types: tuple[type, type] | None = state.pop("quick", None)
+        self.__dict__.update(state)
+
+        if types is not None:
+            self.quick = (*types, SPECIALIZATIONS[self.operator, *types])
+
 class FunctionCall(ASTNode):
+    fields = ("name", "arguments")
+
     name: str
     arguments: list[ASTNode]
 
-@dataclass
+    # Callee pinned by a loaded profile, used while the global of the same name is still this function.
+    target: RuntimeFunction | None = None
+
+    def __getstate__(self) -> dict[str, object]:
+        # The pinned callee belongs to the program that loaded the profile, not to wherever the node is unpickled.
+        state: dict[str, object] = dict(self.__dict__)
+        state.pop("target", None)
+
+        return state
+
 class Get(ASTNode):
+    fields = ("obj", "name")
+
     obj: ASTNode
     name: str
 
-@dataclass
+class Inlined(ASTNode):
+    """Body of an inlined call to `name`, evaluated after binding its arguments to temporaries."""
+
+    fields = ("name", "bindings", "body")
+
+    name: str
+    bindings: list[ASTNode]
+    body: ASTNode
+
 class Literal(ASTNode):
+    fields = ("value",)
+
     value: RuntimeType
 
-@dataclass
+class LogicalAnd(ASTNode):
+    """`left && right`; `right` is only evaluated when `left` is true."""
+
+    fields = ("left", "right")
+
+    left: ASTNode
+    right: ASTNode
+
+class LogicalOr(ASTNode):
+    """`left || right`; `right` is only evaluated when `left` is false."""
+
+    fields = ("left", "right")
+
+    left: ASTNode
+    right: ASTNode
+
 class MethodCall(ASTNode):
+    fields = ("obj", "name", "arguments")
+
     obj: ASTNode
     name: str
     arguments: list[ASTNode]
 
-@dataclass
 class Postfix(ASTNode):
+    fields = ("target", "operator")
+
     target: Variable
     operator: TokenType
 
-@dataclass
 class UnaryOperation(ASTNode):
+    fields = ("operator", "operand")
+
     operator: TokenType
     operand: ASTNode
 
-@dataclass
 class Variable(ASTNode):
+    fields = ("name",)
+
     name: str
\ No newline at end of file
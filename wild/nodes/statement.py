@@ -1,6 +1,5 @@
 from wild.nodes.base import ASTNode
 from wild.nodes.expression import Variable
-from dataclasses import dataclass
 
 __all__ = (
     "Assignment",
@@ -10,59 +9,72 @@ __all__ = (
     "For",
     "FunctionDefinition",
     "If",
+    "ParallelFor",
     "Program",
     "Return",
     "VariableDeclaration",
     "While",
 )
 
-@dataclass
 class Assignment(ASTNode):
+    fields = ("target", "value")
+
     target: Variable
     value: ASTNode
 
-@dataclass
 class Block(ASTNode):
+    fields = ("statements",)
+
     statements: list[ASTNode]
 
 class Break(ASTNode):...
 class Continue(ASTNode):...
 
-@dataclass
 class For(ASTNode):
+    fields = ("initializer", "condition", "increment", "body")
+
     initializer: ASTNode
     condition: ASTNode
     increment: ASTNode
     body: ASTNode
 
-@dataclass
 class FunctionDefinition(ASTNode):
+    fields = ("name", "parameters", "body", "return_type")
+
     name: str
     parameters: list[tuple[str, str]]
     body: Block
     return_type: str
 
-@dataclass
 class If(ASTNode):
+    fields = ("condition", "branch_true", "branch_false")
+
     condition: ASTNode
     branch_true: Block
     branch_false: Block | None = None
 
-@dataclass
+class ParallelFor(For):
+    """`parallel for` loop whose iterations run independently on a process pool."""
+
 class Program(ASTNode):
+    fields = ("statements",)
+
     statements: list[ASTNode]
 
-@dataclass
 class Return(ASTNode):
+    fields = ("value",)
+
     value: ASTNode | None
 
-@dataclass
 class VariableDeclaration(ASTNode):
+    fields = ("name", "type_name", "value")
+
     name: str
     type_name: str
     value: ASTNode
 
-@dataclass
 class While(ASTNode):
+    fields = ("condition", "body")
+
     condition: ASTNode
     body: Block
\ No newline at end of file
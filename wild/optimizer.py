@@ -0,0 +1,187 @@
+from wild.nodes.base import ASTNode
+from wild.nodes.expression import FunctionCall, Inlined, Literal, LogicalAnd, LogicalOr, Postfix, Variable
+from wild.nodes.statement import FunctionDefinition, Program, Return, VariableDeclaration
+from typing import Any, NamedTuple
+
+import itertools
+
+__all__ = (
+    "INLINE_THRESHOLD",
+    "Inliner",
+    "inline_functions",
+)
+
+INLINE_THRESHOLD: int = 16
+
+# Cannot appear in an identifier, so temporaries never collide with names in the script.
+TEMPORARY_SEPARATOR: str = "#"
+
+class Expansion(NamedTuple):
+    """
+    Inlinable function: its parameters, the expression it returns, whether
+    that expression calls no function, and the names it always reads.
+    """
+
+    parameters: list[tuple[str, str]]
+    body: ASTNode
+    pure: bool
+    reads: frozenset[str]
+
+def always_read(node: ASTNode) -> set[str]:
+    """Names of the variables evaluating `node` reads on every path, skipping the short-circuited side of `&&` and `||`."""
+
+    if isinstance(node, Variable):
+        return {node.name}
+
+    if isinstance(node, (LogicalAnd, LogicalOr)):
+        return always_read(node.left)
+
+    return set().union(*[always_read(child) for child in node.children()])
+
+def walk(node: ASTNode) -> list[ASTNode]:
+    nodes: list[ASTNode] = [node]
+    for child in node.children():
+        nodes.extend(walk(child))
+
+    return nodes
+
+class Inliner:
+    """
+    Replaces calls to small, non-recursive functions with their bodies.
+
+    A function qualifies when its body is a single `return expression;` of at
+    most `threshold` nodes, after its own calls have been inlined. Callees
+    see their callers' variables, so a body that still calls a function of
+    the script is left alone: inlining it would hide the callee's parameters
+    from that call. Arguments are bound to uniquely renamed temporaries in
+    the caller's frame, or substituted directly when that cannot change the
+    result. Every inlined call is still charged to the step and depth
+    budgets like the call it replaced.
+
+    The inliner rewrites its own copy of `program`, so the caller's tree is
+    left as it was.
+    """
+
+    def __init__(self, program: Program, threshold: int = INLINE_THRESHOLD) -> None:
+        self.threshold: int = threshold
+        self.expansions: dict[str, Expansion | None] = {}
+        self.expanding: set[str] = set()
+        self.sites: itertools.count = itertools.count()
+
+        self.program: Program = self._copy(program, {})
+        self.functions: dict[str, FunctionDefinition] = {
+            statement.name: statement for statement in self.program.statements
+            if isinstance(statement, FunctionDefinition)
+        }
+
+    def _copy(self, node: ASTNode, names: dict[str, ASTNode]) -> ASTNode:
+        if isinstance(node, Variable) and node.name in names:
+            return self._copy(names[node.name], {})
+
+        if isinstance(node, Inlined):
+            bindings: list[ASTNode] = []
+            for binding in node.bindings:
+                temporary: str = self._temporary(binding.name.split(TEMPORARY_SEPARATOR)[:2])
+                bindings.append(VariableDeclaration(temporary, binding.type_name, self._copy(binding.value, names)))
+                names = {**names, binding.name: Variable(temporary)}
+
+            return Inlined(node.name, bindings, self._copy(node.body, names))
+
+        copy: ASTNode = type(node)(*[self._copy_value(getattr(node, name), names) for name in node.fields])
+        if node.line is not None:
+            copy.line = node.line
+
+        return copy
+
+    def _copy_value(self, value: Any, names: dict[str, ASTNode]) -> Any:
+        if isinstance(value, ASTNode): return self._copy(value, names)
+        if isinstance(value, list): return [self._copy_value(item, names) for item in value]
+
+        return value
+
+    def _temporary(self, parts: list[str]) -> str:
+        return TEMPORARY_SEPARATOR.join([*parts, str(next(self.sites))])
+
+    def expand(self, name: str) -> Expansion | None:
+        if name in self.expansions:
+            return self.expansions[name]
+
+        # A call back into a function that is being expanded is recursion.
+        if name in self.expanding:
+            return None
+
+        declaration: FunctionDefinition | None = self.functions.get(name)
+        statements: list[ASTNode] = declaration.body.statements if declaration is not None else []
+
+        if len(statements) != 1 or not isinstance(statements[0], Return) or statements[0].value is None:
+            self.expansions[name] = None
+            return None
+
+        self.expanding.add(name)
+        try:
+            body: ASTNode = self.rewrite(self._copy(statements[0].value, {}))
+        finally:
+            self.expanding.discard(name)
+
+        parameters: set[str] = {parameter for _, parameter in declaration.parameters}
+        nodes: list[ASTNode] = walk(body)
+        calls: list[FunctionCall] = [node for node in nodes if isinstance(node, FunctionCall)]
+
+        expansion: Expansion | None = None
+        if (
+            len(nodes) <= self.threshold
+            and not any(isinstance(node, Postfix) for node in nodes)
+            and not any(call.name in self.functions or call.name in parameters for call in calls)
+        ):
+            expansion = Expansion(declaration.parameters, body, not calls, frozenset(always_read(body)))
+
+        self.expansions[name] = expansion
+        return expansion
+
+    def inline(self, call: FunctionCall) -> ASTNode:
+        expansion: Expansion | None = self.expand(call.name)
+        if expansion is None or len(call.arguments) != len(expansion.parameters):
+            return call
+
+        bindings: list[ASTNode] = []
+        names: dict[str, ASTNode] = {}
+
+        for (type_name, parameter), argument in zip(expansion.parameters, call.arguments):
+            # Only constants, and variables that nothing in the body can assign and that it reads on every path, are
+            # moved into the body. Any other argument is evaluated up front, exactly once, so its errors surface even
+            # where the body never reads it.
+            substitute: bool = expansion.pure and isinstance(argument, Variable) and parameter in expansion.reads
+            if isinstance(argument, Literal) or substitute:
+                names[parameter] = argument
+                continue
+
+            temporary: str = self._temporary([call.name, parameter])
+            bindings.append(VariableDeclaration(temporary, type_name, argument))
+            names[parameter] = Variable(temporary)
+
+        return Inlined(call.name, bindings, self._copy(expansion.body, names))
+
+    def rewrite(self, node: ASTNode) -> ASTNode:
+        """Inline the calls in `node` and below, in place, and return its replacement."""
+
+        for name in node.fields:
+            value: Any = getattr(node, name)
+
+            if isinstance(value, ASTNode):
+                setattr(node, name, self.rewrite(value))
+            elif isinstance(value, list):
+                value[:] = [self.rewrite(item) if isinstance(item, ASTNode) else item for item in value]
+
+        return self.inline(node) if isinstance(node, FunctionCall) else node
+
+    def run(self) -> Program:
+        self.rewrite(self.program)
+        return self.program
+
+def inline_functions(program: Program, threshold: int = INLINE_THRESHOLD) -> Program:
+    """Return a copy of `program` with small functions inlined into their call sites."""
+
+    if threshold <= 0:
+        return program
+
+    return Inliner(program, threshold).run()
\ No newline at end of file
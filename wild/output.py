@@ -0,0 +1,92 @@
+from enum import StrEnum
+from typing import TextIO
+
+import io
+import os
+import sys
+
+__all__ = (
+    "FlushPolicy",
+    "Output",
+)
+
+DEFAULT_THRESHOLD: int = 1 << 16
+
+class FlushPolicy(StrEnum):
+    EXIT = "exit"
+    LINE = "line"
+    SIZE = "size"
+
+class Output:
+    """
+    Interpreter-owned output buffer.
+
+    Text is encoded into a single `bytearray` and written out in large chunks
+    with `os.write` on the raw file descriptor. When there is neither a file
+    descriptor nor a stream, output is captured, and `getvalue` returns it as
+    bytes.
+    """
+
+    def __init__(
+        self,
+        fd: int | None = None,
+        stream: TextIO | None = None,
+        policy: FlushPolicy | None = None,
+        threshold: int = DEFAULT_THRESHOLD,
+    ) -> None:
+        self.fd: int | None = fd
+        self.stream: TextIO | None = stream
+        self.threshold: int = threshold
+        self.buffer: bytearray = bytearray()
+
+        if fd is None and stream is None:
+            policy = FlushPolicy.EXIT
+        elif policy is None:
+            policy = FlushPolicy.LINE if fd is not None and os.isatty(fd) else FlushPolicy.SIZE
+
+        self.policy: FlushPolicy = policy
+
+    @classmethod
+    def stdout(cls, policy: FlushPolicy | None = None, threshold: int = DEFAULT_THRESHOLD) -> Output:
+        """Target the process' standard output, falling back to `sys.stdout` when it has no descriptor."""
+
+        try:
+            fd: int = sys.stdout.fileno()
+        except (AttributeError, ValueError, io.UnsupportedOperation):
+            return cls(stream=sys.stdout, policy=policy, threshold=threshold)
+
+        # Anything the host already printed must come out before our first chunk.
+        sys.stdout.flush()
+        return cls(fd, policy=policy, threshold=threshold)
+
+    @property
+    def capturing(self) -> bool: return self.fd is None and self.stream is None
+
+    def flush(self) -> None:
+        if self.capturing or not self.buffer:
+            return
+
+        if self.fd is not None:
+            with memoryview(self.buffer) as view:
+                written: int = 0
+                while written < len(view):
+                    written += os.write(self.fd, view[written:])
+        else:
+            self.stream.write(self.buffer.decode())
+            self.stream.flush()
+
+        self.buffer.clear()
+
+    def getvalue(self) -> bytes: return bytes(self.buffer)
+
+    def write(self, text: str) -> None:
+        data: bytes = text.encode()
+        self.buffer += data
+
+        match self.policy:
+            case FlushPolicy.LINE:
+                if b"\n" in data:
+                    self.flush()
+            case FlushPolicy.SIZE:
+                if len(self.buffer) >= self.threshold:
+                    self.flush()
\ No newline at end of file
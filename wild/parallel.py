@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from wild.budget import Budget
+from wild.errors import InterpreterError
+from wild.interpreter import Interpreter
+from wild.natives.base import NativeFunction, RuntimeFunction, UserFunction
+from wild.nodes.base import ASTNode
+from wild.nodes.expression import FunctionCall, Variable
+from wild.nodes.statement import ParallelFor
+from wild.optimizer import walk
+from wild.output import Output
+from wild.signals import ContinueSignal
+from wild.type.base import RuntimeType
+from wild.type.map import Map, map_key
+from wild.type.numeric import Integer
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Iterator, NamedTuple
+
+import itertools
+import os
+import pickle
+import threading
+
+__all__ = (
+    "ParallelTask",
+    "parallel_map",
+    "run_parallel_for",
+)
+
+# Each worker gets about this many chunks, so uneven iterations still balance out.
+CHUNKS_PER_WORKER: int = 4
+
+class ParallelTask(NamedTuple):
+    """
+    Everything a worker needs to run iterations: the variables the loop reads,
+    what is left of the run's budget, and either the loop body with its
+    variable or a function to call.
+    """
+
+    globals: dict[str, RuntimeType]
+    budget: Budget
+    steps: int
+    depth: int
+    deadline: float | None
+    arguments: tuple[str, ...] = ()
+    body: ParallelFor | None = None
+    function: RuntimeFunction | None = None
+
+# Started by the first parallel loop and kept for the life of the process, so later loops find warm workers.
+_pool: ProcessPoolExecutor | None = None
+_pool_lock: threading.Lock = threading.Lock()
+_task_ids: Iterator[int] = itertools.count()
+
+# Set in worker processes: `_initialize` marks the process as a worker, and `_task` keeps the last task unpickled.
+_worker: bool = False
+_task: tuple[int, ParallelTask] | None = None
+
+def _initialize() -> None:
+    global _worker
+    _worker = True
+
+def _run_chunk(key: int, payload: bytes | None, values: list[RuntimeType]) -> tuple[bytes, list[RuntimeType], int] | None:
+    global _task
+
+    # Only the first chunks of a loop carry the pickled task; a worker that has not seen it yet asks for it by returning None.
+    if _task is None or _task[0] != key:
+        if payload is None:
+            return None
+
+        _task = (key, pickle.loads(payload))
+
+    return execute(_task[1], values)
+
+def chunked(values: list[RuntimeType], workers: int) -> Iterator[list[RuntimeType]]:
+    size: int = max(1, -(-len(values) // (workers * CHUNKS_PER_WORKER)))
+
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+def execute(task: ParallelTask, values: list[RuntimeType]) -> tuple[bytes, list[RuntimeType], int]:
+    """Run the iterations for `values` on a fresh interpreter, returning their output, results and the steps they took."""
+
+    output: Output = Output()
+    interpreter: Interpreter = Interpreter(task.budget, output=output)
+    interpreter.globals.update(task.globals)
+    interpreter.arguments = task.arguments
+
+    # Picks up the run's budget where the loop started; the monotonic clock is shared by every process on the host.
+    interpreter.spend(task.steps)
+    interpreter.depth = task.depth
+    interpreter.deadline = task.deadline
+    results: list[RuntimeType] = []
+
+    for value in values:
+        if task.function is not None:
+            results.append(task.function.call(interpreter, [value]))
+            continue
+
+        interpreter.env_stack.append({task.body.initializer.name: value})
+        try:
+            interpreter.visit(task.body.body)
+        except ContinueSignal: ...
+        finally:
+            interpreter.env_stack.pop()
+
+    return output.getvalue(), results, interpreter.spent() - task.steps
+
+def pool() -> ProcessPoolExecutor:
+    """Process pool shared by every parallel loop, started on first use."""
+
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1, initializer=_initialize)
+
+        return _pool
+
+def prepare(interpreter: Interpreter, nodes: list[ASTNode], **kwargs: object) -> ParallelTask:
+    """Task carrying the variables `nodes` read and the budget the run has left."""
+
+    return ParallelTask(
+        visible(interpreter, nodes),
+        interpreter.budget,
+        interpreter.spent(),
+        interpreter.depth,
+        interpreter.deadline,
+        interpreter.arguments,
+        **kwargs,
+    )
+
+def reads(nodes: list[ASTNode], scope: dict[str, RuntimeType]) -> set[str]:
+    """Names in `scope` that `nodes` read, following the script functions they call, since callees see their callers' variables."""
+
+    names: set[str] = set()
+    pending: list[ASTNode] = list(nodes)
+
+    while pending:
+        for child in walk(pending.pop()):
+            if not isinstance(child, (FunctionCall, Variable)) or child.name in names or child.name not in scope:
+                continue
+
+            names.add(child.name)
+            value: RuntimeType = scope[child.name]
+
+            if isinstance(value, UserFunction):
+                pending.append(value.declaration.body)
+
+    return names
+
+def received(
+    executor: ProcessPoolExecutor,
+    key: int,
+    payload: bytes,
+    futures: list[Future],
+    chunks: list[list[RuntimeType]],
+) -> Iterator[tuple[bytes, list[RuntimeType], int]]:
+    for future, chunk in zip(futures, chunks):
+        result: tuple[bytes, list[RuntimeType], int] | None = future.result()
+
+        if result is None:
+            # The worker only ever got chunks without the task, so this one goes out again with it.
+            result = executor.submit(_run_chunk, key, payload, chunk).result()
+
+        yield result
+
+def run(interpreter: Interpreter, task: ParallelTask, values: list[RuntimeType]) -> list[RuntimeType]:
+    """
+    Spread `values` over the shared process pool and return the results in order.
+
+    Output of each chunk is written to the interpreter's output in iteration
+    order, so it reads exactly as a sequential loop would have printed it,
+    and the steps each chunk took are charged to the interpreter's budget.
+    A single chunk, or a loop inside a worker, runs in this process instead.
+    """
+
+    global _pool
+
+    workers: int = os.cpu_count() or 1
+    chunks: list[list[RuntimeType]] = list(chunked(values, workers))
+    results: list[RuntimeType] = []
+    executor: ProcessPoolExecutor | None = None
+    futures: list[Future] = []
+
+    if len(chunks) <= 1 or _worker:
+        chunk_results: Iterator[tuple[bytes, list[RuntimeType], int]] = (execute(task, chunk) for chunk in chunks)
+    else:
+        executor = pool()
+        key: int = next(_task_ids)
+        payload: bytes = ship(task)
+
+        # One chunk per worker carries the task, which is about once per worker; the rest send only its key.
+        futures = [executor.submit(_run_chunk, key, payload if index < workers else None, chunk) for index, chunk in enumerate(chunks)]
+        chunk_results = received(executor, key, payload, futures, chunks)
+
+    try:
+        for output, chunk, steps in chunk_results:
+            interpreter.output.write(output.decode())
+            results.extend(chunk)
+            interpreter.spend(steps)
+    except BrokenProcessPool:
+        # A worker died; drop the pool so the next loop starts a fresh one.
+        with _pool_lock:
+            if _pool is executor:
+                _pool = None
+
+        raise
+    finally:
+        # Chunks still queued after a failure would only be thrown away.
+        for future in futures:
+            future.cancel()
+
+    return results
+
+def ship(task: ParallelTask) -> bytes:
+    try:
+        return pickle.dumps(task)
+    except (AttributeError, TypeError, pickle.PicklingError):
+        for name, value in task.globals.items():
+            try:
+                pickle.dumps(value)
+            except (AttributeError, TypeError, pickle.PicklingError):
+                error: str = f"Cannot send `{name}` ({type(value).__name__}) to another process for a parallel loop"
+                raise InterpreterError(error) from None
+
+        raise
+
+def visible(interpreter: Interpreter, nodes: list[ASTNode]) -> dict[str, RuntimeType]:
+    # Natives are resolved again by the worker's own registry.
+    scope: dict[str, RuntimeType] = {
+        name: value
+        for frame in interpreter.env_stack for name, value in frame.items()
+        if not isinstance(value, NativeFunction)
+    }
+
+    return {name: scope[name] for name in reads(nodes, scope)}
+
+def parallel_map(interpreter: Interpreter, function: RuntimeFunction, start: int, end: int) -> Map:
+    nodes: list[ASTNode] = [function.declaration.body] if isinstance(function, UserFunction) else []
+    task: ParallelTask = prepare(interpreter, nodes, function=function)
+    values: list[RuntimeType] = [Integer(index) for index in range(start, end)]
+
+    results: list[RuntimeType] = run(interpreter, task, values)
+    return Map({map_key(value): (value, result) for value, result in zip(values, results)})
+
+def run_parallel_for(interpreter: Interpreter, node: ParallelFor) -> None:
+    # The header runs here, so the iteration values are known before any work is handed out.
+    values: list[RuntimeType] = []
+    interpreter.env_stack.append({})
+
+    try:
+        interpreter.visit(node.initializer)
+
+        while interpreter.visit(node.condition).value:
+            values.append(interpreter.env[node.initializer.name])
+
+            if node.increment:
+                interpreter.visit(node.increment)
+
+            interpreter.charge()
+    finally:
+        interpreter.env_stack.pop()
+
+    run(interpreter, prepare(interpreter, [node.body], body=node), values)
\ No newline at end of file
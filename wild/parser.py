@@ -10,11 +10,55 @@ from wild.type.strings import String
 
 __all__ = ("Parser",)
 
+TYPE_TOKENS: tuple[TokenType, ...] = (
+    TokenType.TYPE_INT,
+    TokenType.TYPE_FLOAT,
+    TokenType.TYPE_STRING,
+    TokenType.TYPE_BOOLEAN,
+    TokenType.TYPE_STREAM,
+    TokenType.TYPE_MAP,
+)
+
+# Methods that change the Map or Stream they are called on. A parallel for worker only ever changes its own copy.
+MUTATING_METHODS: frozenset[str] = frozenset({"clear", "put", "putAll", "remove", "close", "hasLine", "read", "readAll", "readLine"})
+
 class Parser:
     def __init__(self, tokens: list[Token]) -> None:
         self.tokens: list[Token] = tokens
         self.position: int = 0
     
+    def _check_parallel_body(self, node: ASTNode, declared: set[str], line: int, loops: int = 0) -> None:
+        line = node.line or line
+
+        if isinstance(node, (Assignment, Postfix)) and isinstance(node.target, Variable) and node.target.name not in declared:
+            error: str = f"Parallel for body cannot assign outer variable `{node.target.name}` at line {line}"
+            raise SyntaxError(error)
+
+        if isinstance(node, MethodCall) and node.name in MUTATING_METHODS:
+            receiver: ASTNode = node.obj
+            while isinstance(receiver, MethodCall):
+                receiver = receiver.obj
+
+            if isinstance(receiver, Variable) and receiver.name not in declared:
+                error: str = f"Parallel for body cannot call `{node.name}` on outer variable `{receiver.name}` at line {line}"
+                raise SyntaxError(error)
+
+        if isinstance(node, Return) or (isinstance(node, Break) and not loops):
+            error: str = f"Parallel for body cannot {'return' if isinstance(node, Return) else 'break'} at line {line}"
+            raise SyntaxError(error)
+
+        # A declaration only covers what follows it in its own block, so it never hides a write to an outer name
+        # that runs when the declaration did not.
+        if isinstance(node, (Block, For)):
+            declared = set(declared)
+
+        loops += isinstance(node, (For, While))
+        for child in node.children():
+            self._check_parallel_body(child, declared, line, loops)
+
+        if isinstance(node, VariableDeclaration):
+            declared.add(node.name)
+
     def _finish_call(self, callee: ASTNode) -> ASTNode:
         arguments: list[ASTNode] = self._parse_arguments()
         self.consume(TokenType.RPAREN)
@@ -34,6 +78,72 @@ class Parser:
         
         return arguments
 
+    def _parse_statement(self, token: Token) -> ASTNode:
+        if token.type in TYPE_TOKENS or token.type == TokenType.VOID:
+            next: Token = self.peek(1)
+            after: Token = self.peek(2)
+
+            if next and next.type == TokenType.IDENTIFIER:
+                if after and after.type == TokenType.LPAREN:
+                    return self.parse_function_definition()
+        
+            return self.parse_variable_declaration()
+        
+        match token.type:
+            case TokenType.BREAK:
+                self.consume(TokenType.BREAK)
+                self.consume(TokenType.SEMICOLON)
+                return Break()
+            case TokenType.CONTINUE:
+                self.consume(TokenType.CONTINUE)
+                self.consume(TokenType.SEMICOLON)
+                return Continue()
+            case TokenType.FOR: return self.parse_for()
+            case TokenType.IF: return self.parse_if()
+            case TokenType.LBRACE: return self.parse_block()
+            case TokenType.PARALLEL: return self.parse_parallel_for()
+            case TokenType.RETURN: return self.parse_return()
+            case TokenType.WHILE: return self.parse_while()
+        
+        expression: ASTNode = self.parse_expression()
+
+        if self.match(TokenType.ASSIGN):
+            if not isinstance(expression, Variable):
+                error: str = "Invalid assignment target"
+                raise SyntaxError(error)
+            
+            value: RuntimeType = self.parse_expression()
+            self.consume(TokenType.SEMICOLON)
+            return Assignment(expression, value)
+        
+        if self.match(TokenType.PLUS_EQ):
+            value: RuntimeType = self.parse_expression()
+            self.consume(TokenType.SEMICOLON)
+            return Assignment(expression, BinaryOperation(expression, TokenType.PLUS, value))
+        
+        if self.match(TokenType.MINUS_EQ):
+            value: RuntimeType = self.parse_expression()
+            self.consume(TokenType.SEMICOLON)
+            return Assignment(expression, BinaryOperation(expression, TokenType.MINUS, value))
+        
+        if self.match(TokenType.MULT_EQ):
+            value: RuntimeType = self.parse_expression()
+            self.consume(TokenType.SEMICOLON)
+            return Assignment(expression, BinaryOperation(expression, TokenType.MULT, value))
+        
+        if self.match(TokenType.DIV_EQ):
+            value: RuntimeType = self.parse_expression()
+            self.consume(TokenType.SEMICOLON)
+            return Assignment(expression, BinaryOperation(expression, TokenType.DIV, value))
+
+        if self.match(TokenType.MOD_EQ):
+            value: RuntimeType = self.parse_expression()
+            self.consume(TokenType.SEMICOLON)
+            return Assignment(expression, BinaryOperation(expression, TokenType.MOD, value))
+        
+        self.consume(TokenType.SEMICOLON)
+        return expression
+
     def consume(self, *types: TokenType) -> Token:
         token: Token = self.peek()
         if token and (not types or token.type in types):
@@ -143,7 +253,7 @@ class Parser:
 
         if self.match(TokenType.SEMICOLON):
             initializer: ASTNode = None
-        elif self.peek().type in (TokenType.TYPE_INT, TokenType.TYPE_FLOAT, TokenType.TYPE_STRING):
+        elif self.peek().type in TYPE_TOKENS:
             initializer: ASTNode = self.parse_variable_declaration()
         else:
             initializer: ASTNode = self.parse_expression()
@@ -199,7 +309,7 @@ class Parser:
 
         while self.match(TokenType.AND):
             right: ASTNode = self.parse_equality()
-            left: BinaryOperation = BinaryOperation(left, TokenType.AND, right)
+            left: LogicalAnd = LogicalAnd(left, right)
         
         return left
 
@@ -208,10 +318,22 @@ class Parser:
 
         while self.match(TokenType.OR):
             right: ASTNode = self.parse_logic_and()
-            left: BinaryOperation = BinaryOperation(left, TokenType.OR, right)
+            left: LogicalOr = LogicalOr(left, right)
         
         return left
 
+    def parse_parallel_for(self) -> ParallelFor:
+        token: Token = self.consume(TokenType.PARALLEL)
+        loop: For = self.parse_for()
+
+        if not isinstance(loop.initializer, VariableDeclaration):
+            error: str = f"Parallel for must declare its loop variable at line {token.line}"
+            raise SyntaxError(error)
+
+        # Iterations run in other processes, so the body may only write variables it declares itself.
+        self._check_parallel_body(loop.body, set(), token.line)
+        return ParallelFor(loop.initializer, loop.condition, loop.increment, loop.body)
+
     def parse_postfix(self) -> ASTNode:
         expression: ASTNode = self.parse_primary()
 
@@ -239,7 +361,8 @@ class Parser:
         if self.match(TokenType.FALSE): return Literal(Boolean(False))
         if self.match(TokenType.NULL): return Literal(Null())
         
-        if self.match(TokenType.IDENTIFIER):
+        # `Map` doubles as the name of its constructor native.
+        if self.match(TokenType.IDENTIFIER, TokenType.TYPE_MAP):
             name: str = self.tokens[self.position - 1].value
             expression: Variable = Variable(name)
         elif self.match(TokenType.LPAREN):
@@ -267,69 +390,10 @@ class Parser:
         if not token:
             return None
 
-        if token.type in (TokenType.TYPE_INT, TokenType.TYPE_FLOAT, TokenType.TYPE_STRING, TokenType.TYPE_BOOLEAN, TokenType.VOID):
-            next: Token = self.peek(1)
-            after: Token = self.peek(2)
-
-            if next and next.type == TokenType.IDENTIFIER:
-                if after and after.type == TokenType.LPAREN:
-                    return self.parse_function_definition()
-        
-            return self.parse_variable_declaration()
-        
-        match token.type:
-            case TokenType.BREAK:
-                self.consume(TokenType.BREAK)
-                self.consume(TokenType.SEMICOLON)
-                return Break()
-            case TokenType.CONTINUE:
-                self.consume(TokenType.CONTINUE)
-                self.consume(TokenType.SEMICOLON)
-                return Continue()
-            case TokenType.FOR: return self.parse_for()
-            case TokenType.IF: return self.parse_if()
-            case TokenType.LBRACE: return self.parse_block()
-            case TokenType.RETURN: return self.parse_return()
-            case TokenType.WHILE: return self.parse_while()
-        
-        expression: ASTNode = self.parse_expression()
-
-        if self.match(TokenType.ASSIGN):
-            if not isinstance(expression, Variable):
-                error: str = "Invalid assignment target"
-                raise SyntaxError(error)
-            
-            value: RuntimeType = self.parse_expression()
-            self.consume(TokenType.SEMICOLON)
-            return Assignment(expression, value)
-        
-        if self.match(TokenType.PLUS_EQ):
-            value: RuntimeType = self.parse_expression()
-            self.consume(TokenType.SEMICOLON)
-            return Assignment(expression, BinaryOperation(expression, TokenType.PLUS, value))
-        
-        if self.match(TokenType.MINUS_EQ):
-            value: RuntimeType = self.parse_expression()
-            self.consume(TokenType.SEMICOLON)
-            return Assignment(expression, BinaryOperation(expression, TokenType.MINUS, value))
-        
-        if self.match(TokenType.MULT_EQ):
-            value: RuntimeType = self.parse_expression()
-            self.consume(TokenType.SEMICOLON)
-            return Assignment(expression, BinaryOperation(expression, TokenType.MULT, value))
-        
-        if self.match(TokenType.DIV_EQ):
-            value: RuntimeType = self.parse_expression()
-            self.consume(TokenType.SEMICOLON)
-            return Assignment(expression, BinaryOperation(expression, TokenType.DIV, value))
+        statement: ASTNode = self._parse_statement(token)
+        statement.line = token.line
 
-        if self.match(TokenType.MOD_EQ):
-            value: RuntimeType = self.parse_expression()
-            self.consume(TokenType.SEMICOLON)
-            return Assignment(expression, BinaryOperation(expression, TokenType.MOD, value))
-        
-        self.consume(TokenType.SEMICOLON)
-        return expression
+        return statement
 
     def parse_term(self) -> ASTNode:
         left: ASTNode = self.parse_factor()
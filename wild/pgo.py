@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+from wild.budget import Budget
+from wild.interpreter import Interpreter
+from wild.natives.base import RuntimeFunction, UserFunction
+from wild.natives.registry import NativeRegistry, REGISTRY
+from wild.nodes.base import ASTNode
+from wild.nodes.expression import BinaryOperation, FunctionCall
+from wild.nodes.statement import For, FunctionDefinition, If, Program, VariableDeclaration, While
+from wild.output import Output
+from wild.program import CompiledProgram
+from wild.quickening import DEOPT_LIMIT, SPECIALIZATIONS
+from wild.type.base import RuntimeType
+from typing import Any, Callable, Mapping, Sequence
+
+import argparse
+import functools
+import hashlib
+import json
+import os
+import sys
+
+__all__ = (
+    "Profile",
+    "ProfileRecorder",
+    "apply",
+    "profile_path",
+    "record",
+    "report",
+)
+
+PROFILE_VERSION: int = 1
+
+# Recorded in place of a function name for call sites that reached a native.
+NATIVE_TARGET: str = "<native>"
+
+OPERAND_TYPES: dict[str, type[RuntimeType]] = {
+    cls.__name__: cls for _, left, right in SPECIALIZATIONS for cls in (left, right)
+}
+
+Site = tuple[ASTNode, int | None]
+
+def number(program: Program) -> list[Site]:
+    """
+    Every node of `program` in a stable pre-order, with the line of the
+    statement it belongs to. A node's position is its index in the profile.
+    """
+
+    sites: list[Site] = []
+    pending: list[Site] = [(program, None)]
+
+    while pending:
+        node, line = pending.pop()
+        line = node.line if node.line is not None else line
+        sites.append((node, line))
+
+        pending.extend((child, line) for child in reversed(list(node.children())))
+
+    return sites
+
+def shape(sites: list[Site]) -> str:
+    # Profiles follow node positions, so any change to the tree's structure or names makes an old one unusable.
+    digest: Any = hashlib.sha256()
+    for node, _ in sites:
+        digest.update(f"{type(node).__name__}:{getattr(node, 'name', '')};".encode())
+
+    return digest.hexdigest()
+
+def bound_names(program: Program) -> set[str]:
+    """Names that some frame above the globals may hold: every declared variable and parameter."""
+
+    names: set[str] = set()
+    for node, _ in number(program):
+        if isinstance(node, VariableDeclaration):
+            names.add(node.name)
+        elif isinstance(node, FunctionDefinition):
+            names.update(parameter for _, parameter in node.parameters)
+
+    return names
+
+def profile_path(path: str) -> str:
+    return f"{path}.profile"
+
+class Profile:
+    """
+    Runtime observations of one program, keyed by node index.
+
+    `operations` counts operand type pairs per `BinaryOperation`, `calls`
+    counts the functions each `FunctionCall` reached, `branches` holds the
+    taken and skipped counts of each `If`, and `loops` the entries and
+    iterations of each `While` and `For`.
+    """
+
+    def __init__(self, shape: str) -> None:
+        self.shape: str = shape
+        self.operations: dict[int, dict[tuple[str, str], int]] = {}
+        self.calls: dict[int, dict[str, int]] = {}
+        self.branches: dict[int, list[int]] = {}
+        self.loops: dict[int, list[int]] = {}
+
+    def __repr__(self) -> str:
+        return f"<profile {len(self.operations)} operations, {len(self.calls)} calls, {len(self.branches)} branches, {len(self.loops)} loops>"
+
+    @classmethod
+    def load(cls, path: str, shape: str) -> Profile | None:
+        """Read the profile at `path`, or None if there is none for a program of this `shape`."""
+
+        try:
+            with open(path) as file:
+                data: dict[str, Any] = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if data.get("version") != PROFILE_VERSION or data.get("shape") != shape:
+            return None
+
+        profile: Profile = cls(shape)
+        profile.operations = {
+            int(index): {(left, right): count for left, right, count in pairs}
+            for index, pairs in data["operations"].items()
+        }
+        profile.calls = {int(index): targets for index, targets in data["calls"].items()}
+        profile.branches = {int(index): counts for index, counts in data["branches"].items()}
+        profile.loops = {int(index): counts for index, counts in data["loops"].items()}
+
+        return profile
+
+    def save(self, path: str) -> None:
+        data: dict[str, Any] = {
+            "version": PROFILE_VERSION,
+            "shape": self.shape,
+            "operations": {
+                index: [[left, right, count] for (left, right), count in pairs.items()]
+                for index, pairs in self.operations.items()
+            },
+            "calls": self.calls,
+            "branches": self.branches,
+            "loops": self.loops,
+        }
+
+        # Written aside and moved into place, so a concurrent run never reads half a profile.
+        temporary: str = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as file:
+            json.dump(data, file)
+
+        os.replace(temporary, path)
+
+class ProfileRecorder(Interpreter):
+    """Interpreter that fills a `Profile` while it runs a compiled program."""
+
+    def __init__(
+        self,
+        program: CompiledProgram,
+        budget: Budget | None = None,
+        natives: dict[str, RuntimeFunction] | None = None,
+        output: Output | None = None,
+        registry: NativeRegistry | None = None,
+    ) -> None:
+        super().__init__(budget, natives, output, registry)
+
+        sites: list[Site] = number(program.program)
+        self.profile: Profile = Profile(shape(sites))
+        self.indices: dict[ASTNode, int] = {node: index for index, (node, _) in enumerate(sites)}
+
+    def condition(self, node: If | For | While, value: RuntimeType) -> bool:
+        taken: bool = super().condition(node, value)
+        index: int = self.indices[node]
+
+        # A true loop condition starts one more trip through the body.
+        if isinstance(node, If):
+            self.profile.branches.setdefault(index, [0, 0])[0 if taken else 1] += 1
+        elif taken:
+            self.profile.loops[index][1] += 1
+
+        return taken
+
+    def resolve_call(self, node: FunctionCall) -> RuntimeFunction:
+        callee: RuntimeFunction = super().resolve_call(node)
+
+        index: int | None = self.indices.get(node)
+        if index is not None:
+            target: str = callee.declaration.name if isinstance(callee, UserFunction) else NATIVE_TARGET
+            targets: dict[str, int] = self.profile.calls.setdefault(index, {})
+            targets[target] = targets.get(target, 0) + 1
+
+        return callee
+
+    def visit_BinaryOperation(self, node: BinaryOperation) -> RuntimeType:
+        left: RuntimeType = self.visit(node.left)
+        right: RuntimeType = self.visit(node.right)
+
+        pairs: dict[tuple[str, str], int] = self.profile.operations.setdefault(self.indices[node], {})
+        pair: tuple[str, str] = (type(left).__name__, type(right).__name__)
+        pairs[pair] = pairs.get(pair, 0) + 1
+
+        return self.operate(node, left, right)
+
+    def visit_For(self, node: For) -> RuntimeType:
+        self.profile.loops.setdefault(self.indices[node], [0, 0])[0] += 1
+        return super().visit_For(node)
+
+    def visit_While(self, node: While) -> None:
+        self.profile.loops.setdefault(self.indices[node], [0, 0])[0] += 1
+        super().visit_While(node)
+
+def record(
+    program: CompiledProgram,
+    inputs: Mapping[str, Any] | None = None,
+    budget: Budget | None = None,
+    output: Output | None = None,
+    arguments: Sequence[str] = (),
+) -> tuple[int, Profile]:
+    """Run `program` under a `ProfileRecorder` and return its exit code and profile."""
+
+    factory: Callable[..., ProfileRecorder] = functools.partial(ProfileRecorder, program)
+    recorder: ProfileRecorder = program.interpreter(inputs, budget=budget, output=output, arguments=arguments, factory=factory)
+
+    return recorder.call_main(), recorder.profile
+
+def apply(program: CompiledProgram, profile: Profile, registry: NativeRegistry | None = None) -> int:
+    """
+    Pre-specialize `program` from `profile` before it runs, returning the
+    number of nodes changed.
+
+    Operations that only ever saw one pair of operand types start out
+    quickened for it, and operations that saw several start on the generic
+    path instead of deoptimizing their way there. Call sites that always
+    reached the function their name refers to are pinned to it, provided
+    nothing in the program can shadow that name. Branch and loop counts
+    are only reported; the tree has no layout for them to change.
+    """
+
+    registry = registry or REGISTRY
+    sites: list[Site] = number(program.program)
+    bound: set[str] = bound_names(program.program)
+    changed: int = 0
+
+    for index, pairs in profile.operations.items():
+        operation: BinaryOperation = sites[index][0]
+
+        if len(pairs) > 1:
+            operation.quick, operation.deopts = None, DEOPT_LIMIT
+            changed += 1
+            continue
+
+        left, right = next(iter(pairs))
+        if left in OPERAND_TYPES and right in OPERAND_TYPES:
+            handler: Callable | None = SPECIALIZATIONS.get((operation.operator, OPERAND_TYPES[left], OPERAND_TYPES[right]))
+
+            if handler is not None:
+                operation.quick = (OPERAND_TYPES[left], OPERAND_TYPES[right], handler)
+                changed += 1
+
+    for index, targets in profile.calls.items():
+        call: FunctionCall = sites[index][0]
+        if len(targets) != 1 or call.name in bound:
+            continue
+
+        target: str = next(iter(targets))
+        callee: RuntimeFunction | None = None
+
+        if target == call.name:
+            callee = program.functions.get(call.name)
+        elif target == NATIVE_TARGET and call.name not in program.functions:
+            callee = registry.resolve(call.name)
+
+        if callee is not None and callee.arity() == len(call.arguments):
+            call.target = callee
+            changed += 1
+
+    return changed
+
+def report(program: CompiledProgram, profile: Profile, limit: int = 10) -> str:
+    """The most iterated loops, most evaluated branches and most made calls of `profile`, one per line."""
+
+    sites: list[Site] = number(program.program)
+    lines: list[str] = [repr(profile)]
+
+    def location(index: int) -> str:
+        node, line = sites[index]
+        return f"{type(node).__name__} at line {line if line is not None else '?'}"
+
+    for index, (entries, iterations) in sorted(profile.loops.items(), key=lambda item: -item[1][1])[:limit]:
+        lines.append(f"  loop    {location(index):<24} {iterations / max(entries, 1):>10.1f} trips x {entries}")
+
+    for index, (taken, skipped) in sorted(profile.branches.items(), key=lambda item: -sum(item[1]))[:limit]:
+        lines.append(f"  branch  {location(index):<24} {taken / (taken + skipped):>10.1%} taken of {taken + skipped}")
+
+    for index, targets in sorted(profile.calls.items(), key=lambda item: -sum(item[1].values()))[:limit]:
+        lines.append(f"  call    {location(index):<24} " + ", ".join(f"{name} {count}" for name, count in targets.items()))
+
+    return "\n".join(lines)
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog=args[0], description="Run a Wild script with a profile recorded by an earlier run.")
+    parser.add_argument("-r", "--record", action="store_true", help="record a new profile next to the script")
+    parser.add_argument("--report", action="store_true", help="print the hottest loops, branches and calls of the profile")
+    parser.add_argument("path", help="script to run")
+    parser.add_argument("arguments", nargs=argparse.REMAINDER, help="arguments passed to the script")
+
+    return parser.parse_args(args[1:])
+
+def main(args: list[str]) -> int:
+    options: argparse.Namespace = parse_args(args)
+    program: CompiledProgram = CompiledProgram.from_file(options.path)
+    path: str = profile_path(options.path)
+
+    if options.record:
+        exit_code, profile = record(program, arguments=options.arguments)
+        profile.save(path)
+    else:
+        profile: Profile | None = Profile.load(path, shape(number(program.program)))
+        if profile is not None:
+            apply(program, profile)
+
+        exit_code = program.run(arguments=options.arguments)
+
+    if options.report:
+        print(report(program, profile) if profile is not None else f"No profile for {options.path}", file=sys.stderr)
+
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
\ No newline at end of file
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from wild.budget import Budget
+from wild.interpreter import Interpreter
+from wild.natives.base import RuntimeFunction, UserFunction
+from wild.natives.registry import NativeRegistry
+from wild.nodes.base import ASTNode
+from wild.nodes.expression import Literal, Postfix
+from wild.nodes.statement import FunctionDefinition
+from wild.output import Output
+from wild.program import CompiledProgram
+from wild.type.base import RuntimeType
+from wild.type.strings import String
+from typing import Any, Iterable, Mapping, Sequence
+
+import argparse
+import functools
+import sys
+import weakref
+
+__all__ = (
+    "AllocationSite",
+    "MemoryProfiler",
+    "MemoryReport",
+    "profile",
+)
+
+GLOBAL_SCOPE: str = "<global>"
+
+Site = tuple[str, int | None]
+
+def shallow_size(value: RuntimeType) -> int:
+    """Bytes owned by a runtime value: the object, its attributes and its own Python payload."""
+
+    attributes: dict[str, Any] = vars(value)
+    size: int = sys.getsizeof(value) + sys.getsizeof(attributes)
+
+    # Views and ropes share their buffers, so only a flattened string counts its characters.
+    payload: Any = attributes["_flat"] if isinstance(value, String) else attributes.get("value")
+    if isinstance(payload, (int, float, str, bytes, dict)):
+        size += sys.getsizeof(payload)
+
+    return size
+
+class AllocationSite:
+    """Allocation counters for one Wild source line."""
+
+    def __init__(self, function: str, line: int | None) -> None:
+        self.function: str = function
+        self.line: int | None = line
+
+        self.allocations: int = 0
+        self.bytes: int = 0
+        self.frames: int = 0
+        self.frame_bytes: int = 0
+        self.types: dict[str, int] = {}
+
+    def __repr__(self) -> str: return f"<site {self.function}:{self.line} {self.allocations} allocations>"
+
+class MemoryReport:
+    """Per-line allocation totals and the live size high-water mark of one profiled run."""
+
+    def __init__(self, sites: dict[Site, AllocationSite], live_bytes: int, peak_bytes: int) -> None:
+        self.sites: dict[Site, AllocationSite] = sites
+        self.live_bytes: int = live_bytes
+        self.peak_bytes: int = peak_bytes
+
+    @property
+    def allocations(self) -> int: return sum(site.allocations + site.frames for site in self.sites.values())
+
+    def format(self, limit: int = 10) -> str:
+        lines: list[str] = [
+            f"{self.allocations} allocations, peak live {self.peak_bytes / 1024:.1f} KiB, "
+            f"{self.live_bytes / 1024:.1f} KiB live at exit",
+            f"{'site':<24} {'values':>10} {'KiB':>10} {'frames':>8}  types",
+        ]
+
+        for site in self.top(limit):
+            location: str = f"{site.function}:{site.line if site.line is not None else '?'}"
+            types: str = ", ".join(f"{name} {count}" for name, count in sorted(site.types.items(), key=lambda item: -item[1]))
+            lines.append(
+                f"{location:<24} {site.allocations:>10} {(site.bytes + site.frame_bytes) / 1024:>10.1f} "
+                f"{site.frames:>8}  {types}"
+            )
+
+        return "\n".join(lines)
+
+    def top(self, limit: int = 10) -> list[AllocationSite]:
+        return sorted(self.sites.values(), key=lambda site: site.bytes + site.frame_bytes, reverse=True)[:limit]
+
+class FrameStack(list):
+    """Environment stack that reports every frame pushed and popped to its profiler."""
+
+    def __init__(self, profiler: MemoryProfiler, frames: list[dict[str, Any]]) -> None:
+        super().__init__(frames)
+        self.profiler: MemoryProfiler = profiler
+
+    def append(self, frame: dict[str, Any]) -> None:
+        self.profiler.push_frame(frame)
+        super().append(frame)
+
+    def pop(self, index: int = -1) -> dict[str, Any]:
+        frame: dict[str, Any] = super().pop(index)
+        self.profiler.pop_frame(frame)
+
+        return frame
+
+class MemoryProfiler(Interpreter):
+    """
+    Interpreter that attributes runtime value and environment frame
+    allocations to the Wild function and line that made them.
+
+    A value is counted the first time an expression evaluates to it, or when
+    `++` or `--` stores it, and is released through a weak reference
+    callback. Values a native builds and drops before returning are never
+    seen. Sizes are shallow, so shared
+    string buffers are not counted twice. Nothing outside the profiler is
+    patched, so other interpreters keep running at full speed.
+    """
+
+    def __init__(
+        self,
+        budget: Budget | None = None,
+        natives: dict[str, RuntimeFunction] | None = None,
+        output: Output | None = None,
+        registry: NativeRegistry | None = None,
+    ) -> None:
+        super().__init__(budget, natives, output, registry)
+        self.env_stack = FrameStack(self, self.env_stack)
+
+        self.owners: dict[ASTNode, str] = {}
+        self.site: Site = (GLOBAL_SCOPE, None)
+        self.sites: dict[Site, AllocationSite] = {}
+
+        # Runtime values define __eq__ without __hash__, so their references are keyed by id.
+        self.live: dict[int, tuple[weakref.ref, int]] = {}
+        self.constants: set[int] = set()
+        self.live_bytes: int = 0
+        self.peak_bytes: int = 0
+        self.frame_sizes: list[int] = []
+
+    def _site(self) -> AllocationSite:
+        site: AllocationSite | None = self.sites.get(self.site)
+        if site is None:
+            site = self.sites[self.site] = AllocationSite(*self.site)
+
+        return site
+
+    def _grow(self, size: int) -> None:
+        self.live_bytes += size
+        if self.live_bytes > self.peak_bytes:
+            self.peak_bytes = self.live_bytes
+
+    def _release(self, key: int, _: weakref.ref) -> None:
+        self.live_bytes -= self.live.pop(key)[1]
+
+    def attribute(self, name: str, declaration: FunctionDefinition) -> None:
+        """Record that the statements in `declaration` belong to function `name`."""
+
+        pending: list[ASTNode] = [declaration.body]
+        while pending:
+            node: ASTNode = pending.pop()
+            if node.line is not None:
+                self.owners[node] = name
+
+            pending.extend(node.children())
+
+    def execute(self, statements: Iterable[ASTNode]) -> None:
+        # `CompiledProgram.interpreter` fills the globals before the top-level statements run, so its functions are
+        # attributed and its inputs charged to the global scope here.
+        for name, value in self.globals.items():
+            if isinstance(value, UserFunction):
+                self.attribute(name, value.declaration)
+            else:
+                self.track(value)
+
+        super().execute(statements)
+
+    def pop_frame(self, frame: dict[str, Any]) -> None:
+        self.live_bytes -= self.frame_sizes.pop()
+
+    def push_frame(self, frame: dict[str, Any]) -> None:
+        size: int = sys.getsizeof(frame)
+        site: AllocationSite = self._site()
+        site.frames += 1
+        site.frame_bytes += size
+
+        self.frame_sizes.append(size)
+        self._grow(size)
+
+    def record(self, value: RuntimeType) -> None:
+        size: int = shallow_size(value)
+        site: AllocationSite = self._site()
+        site.allocations += 1
+        site.bytes += size
+
+        name: str = type(value).__name__
+        site.types[name] = site.types.get(name, 0) + 1
+
+        key: int = id(value)
+        self.live[key] = (weakref.ref(value, functools.partial(self._release, key)), size)
+        self._grow(size)
+
+    def report(self) -> MemoryReport:
+        return MemoryReport(self.sites, self.live_bytes, self.peak_bytes)
+
+    def track(self, value: RuntimeType | None) -> RuntimeType | None:
+        """Record `value` if it has not been seen alive before."""
+
+        if isinstance(value, RuntimeType) and id(value) not in self.live and id(value) not in self.constants:
+            self.record(value)
+
+        return value
+
+    def visit(self, node: ASTNode) -> RuntimeType | None:
+        # Literals hand back the constant held by the tree, which was allocated by the parser.
+        if isinstance(node, Literal):
+            value: RuntimeType = super().visit(node)
+            self.constants.add(id(value))
+
+            return value
+
+        line: int | None = node.line
+        if line is None:
+            return self.track(super().visit(node))
+
+        site: Site = self.site
+        self.site = (self.owners.get(node, GLOBAL_SCOPE), line)
+
+        try:
+            return self.track(super().visit(node))
+        finally:
+            self.site = site
+
+    def visit_FunctionDefinition(self, node: FunctionDefinition) -> None:
+        self.attribute(node.name, node)
+        super().visit_FunctionDefinition(node)
+
+    def visit_Postfix(self, node: Postfix) -> RuntimeType:
+        # The old value is what the expression returns; the new one is only stored, so it is counted here.
+        old_value: RuntimeType = super().visit_Postfix(node)
+        self.track(self.lookup_variable(node.target.name))
+
+        return old_value
+
+def profile(
+    program: CompiledProgram,
+    inputs: Mapping[str, Any] | None = None,
+    budget: Budget | None = None,
+    output: Output | None = None,
+    arguments: Sequence[str] = (),
+) -> tuple[int, MemoryReport]:
+    """Run `program` under a `MemoryProfiler` and return its exit code and report."""
+
+    profiler: MemoryProfiler = program.interpreter(inputs, budget=budget, output=output, arguments=arguments, factory=MemoryProfiler)
+    exit_code: int = profiler.call_main()
+
+    return exit_code, profiler.report()
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog=args[0], description="Profile the memory use of a Wild script.")
+    parser.add_argument("path", help="script to run")
+    parser.add_argument("-n", "--top", type=int, default=10, help="number of sites to list (default: 10)")
+
+    return parser.parse_args(args[1:])
+
+def main(args: list[str]) -> int:
+    options: argparse.Namespace = parse_args(args)
+    exit_code, report = profile(CompiledProgram.from_file(options.path))
+
+    print(report.format(options.top), file=sys.stderr)
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
\ No newline at end of file
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+from wild.budget import Budget
+from wild.errors import ConversionError, InterpreterError
+from wild.interpreter import Interpreter
+from wild.lexer import Lexer
+from wild.natives.base import RuntimeFunction, UserFunction
+from wild.nodes.base import ASTNode
+from wild.nodes.statement import FunctionDefinition, Program
+from wild.optimizer import INLINE_THRESHOLD, inline_functions
+from wild.output import Output
+from wild.parser import Parser
+from wild.type.base import RuntimeType
+from wild.type.boolean import Boolean
+from wild.type.empty import Null
+from wild.type.numeric import Float, Integer
+from wild.type.strings import String
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple, Sequence
+
+__all__ = (
+    "CompiledProgram",
+    "to_runtime",
+)
+
+def to_runtime(value: Any) -> RuntimeType:
+    """Convert a Python value into the equivalent Wild runtime value."""
+
+    # A string handed to several runs must not be a rope whose tail each of them could claim.
+    if isinstance(value, String): return value.flatten()
+    if isinstance(value, RuntimeType): return value
+    if isinstance(value, bool): return Boolean(value)
+    if isinstance(value, int): return Integer(value)
+    if isinstance(value, float): return Float(value)
+    if isinstance(value, str): return String(value)
+    if value is None: return Null()
+
+    error: str = f"Cannot convert {type(value).__name__} to a Wild value"
+    raise ConversionError(error)
+
+class CompiledProgram(NamedTuple):
+    """
+    Parsed program that can be run any number of times, from any number of
+    threads at once.
+
+    Every run gets its own `Interpreter`, seeded with the prebuilt function
+    table, the injected natives and the inputs, so no state leaks between
+    runs. The tree itself is not frozen, though. Runs quicken its
+    `BinaryOperation` nodes, replacing each cached handler as one tuple that
+    is guarded by the operand types it was built for, so concurrent runs may
+    race to specialize a node but always execute a correct handler.
+    `wild.pgo.apply` also writes to the tree, and has to finish before the
+    program is shared.
+
+    Small functions are inlined into their call sites while compiling; an
+    `inline_threshold` of 0 turns that off.
+    """
+
+    program: Program
+    functions: Mapping[str, UserFunction]
+    statements: tuple[ASTNode, ...]
+
+    @classmethod
+    def from_file(cls, path: str, inline_threshold: int = INLINE_THRESHOLD) -> CompiledProgram:
+        with open(path) as file:
+            return cls.from_source(file.read(), inline_threshold)
+
+    @classmethod
+    def from_program(cls, program: Program, inline_threshold: int = INLINE_THRESHOLD) -> CompiledProgram:
+        program = inline_functions(program, inline_threshold)
+        functions: dict[str, UserFunction] = {}
+        statements: list[ASTNode] = []
+
+        for statement in program.statements:
+            if isinstance(statement, FunctionDefinition):
+                functions[statement.name] = UserFunction(statement)
+            else:
+                statements.append(statement)
+
+        if "main" not in functions:
+            error: str = "Entry function \"main\" must be defined"
+            raise InterpreterError(error)
+
+        return cls(program, MappingProxyType(functions), tuple(statements))
+
+    @classmethod
+    def from_source(cls, source: str, inline_threshold: int = INLINE_THRESHOLD) -> CompiledProgram:
+        parser: Parser = Parser(Lexer(source).tokenize())
+        return cls.from_program(parser.parse(), inline_threshold)
+
+    def interpreter(
+        self,
+        inputs: Mapping[str, Any] | None = None,
+        natives: Mapping[str, RuntimeFunction] | None = None,
+        budget: Budget | None = None,
+        output: Output | None = None,
+        arguments: Sequence[str] = (),
+        factory: Callable[..., Interpreter] = Interpreter,
+    ) -> Interpreter:
+        """
+        Build a fresh, initialized interpreter that is ready to call `main`.
+
+        `factory` is called with the budget, natives and output to create it,
+        so tools can run the program on an `Interpreter` subclass.
+        """
+
+        interpreter: Interpreter = factory(budget, dict(natives) if natives else None, output)
+        interpreter.arguments = tuple(arguments)
+        interpreter.globals.update(self.functions)
+
+        if inputs:
+            interpreter.globals.update({name: to_runtime(value) for name, value in inputs.items()})
+
+        interpreter.execute(self.statements)
+        return interpreter
+
+    def run(
+        self,
+        inputs: Mapping[str, Any] | None = None,
+        natives: Mapping[str, RuntimeFunction] | None = None,
+        budget: Budget | None = None,
+        output: Output | None = None,
+        arguments: Sequence[str] = (),
+    ) -> int:
+        return self.interpreter(inputs, natives, budget, output, arguments).call_main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+from wild.tokens import TokenType
+from wild.type.base import RuntimeType
+from wild.type.boolean import Boolean
+from wild.type.numeric import Float, Integer
+from wild.type.strings import String
+from typing import Callable
+
+__all__ = (
+    "DEOPT_LIMIT",
+    "QuickeningStats",
+    "SPECIALIZATIONS",
+)
+
+Handler = Callable[[RuntimeType, RuntimeType], RuntimeType]
+
+# A node whose operand types changed this many times stays on the generic path.
+DEOPT_LIMIT: int = 4
+
+def _arithmetic(result: type[Integer] | type[Float]) -> dict[TokenType, Handler]:
+    return {
+        TokenType.PLUS: lambda left, right: result(left.value + right.value),
+        TokenType.MINUS: lambda left, right: result(left.value - right.value),
+        TokenType.MULT: lambda left, right: result(left.value * right.value),
+        TokenType.DIV: lambda left, right: Float(left.value / right.value),
+        TokenType.MOD: lambda left, right: Integer(int(left.value % right.value)),
+    }
+
+COMPARISONS: dict[TokenType, Handler] = {
+    TokenType.EQUAL: lambda left, right: Boolean(left.value == right.value),
+    TokenType.NOT_EQ: lambda left, right: Boolean(left.value != right.value),
+    TokenType.LESS: lambda left, right: Boolean(left.value < right.value),
+    TokenType.GREATER: lambda left, right: Boolean(left.value > right.value),
+    TokenType.LESS_EQ: lambda left, right: Boolean(left.value <= right.value),
+    TokenType.GREATER_EQ: lambda left, right: Boolean(left.value >= right.value),
+}
+
+def _numeric() -> dict[tuple[TokenType, type[RuntimeType], type[RuntimeType]], Handler]:
+    specializations: dict[tuple[TokenType, type[RuntimeType], type[RuntimeType]], Handler] = {}
+
+    for left_type in (Integer, Float):
+        for right_type in (Integer, Float):
+            # Mirrors `Numeric._coerce`: only Int with Int stays integral.
+            handlers: dict[TokenType, Handler] = _arithmetic(Integer if left_type is right_type is Integer else Float) | COMPARISONS
+
+            for operator, handler in handlers.items():
+                specializations[operator, left_type, right_type] = handler
+
+    return specializations
+
+SPECIALIZATIONS: dict[tuple[TokenType, type[RuntimeType], type[RuntimeType]], Handler] = {
+    (TokenType.PLUS, String, String): String.__add__,
+    (TokenType.EQUAL, String, String): COMPARISONS[TokenType.EQUAL],
+    (TokenType.NOT_EQ, String, String): COMPARISONS[TokenType.NOT_EQ],
+    (TokenType.EQUAL, Boolean, Boolean): COMPARISONS[TokenType.EQUAL],
+    (TokenType.NOT_EQ, Boolean, Boolean): COMPARISONS[TokenType.NOT_EQ],
+    **_numeric(),
+}
+
+class QuickeningStats:
+    """
+    Counters for the specialized `BinaryOperation` handlers of one interpreter.
+
+    A hit ran a node's cached handler. A miss went through the generic
+    operator table, either to specialize the node or because no handler
+    exists for its operand types. A deopt replaced a handler whose type
+    guard failed.
+    """
+
+    def __init__(self) -> None:
+        self.hits: int = 0
+        self.misses: int = 0
+        self.specializations: int = 0
+        self.deopts: int = 0
+
+    def __repr__(self) -> str:
+        return f"<quickening {self.hit_rate:.1%} hits, {self.specializations} specializations, {self.deopts} deopts>"
+
+    @property
+    def hit_rate(self) -> float:
+        total: int = self.hits + self.misses
+        return self.hits / total if total else 0.0
\ No newline at end of file
@@ -0,0 +1,193 @@
+from __future__ import annotations
+
+from wild.budget import Budget
+from wild.client import DEFAULT_SOCKET, RUNTIME_DIRECTORY
+from wild.output import FlushPolicy, Output
+from wild.program import CompiledProgram
+from collections import OrderedDict
+from typing import Any, BinaryIO
+
+import argparse
+import hashlib
+import json
+import os
+import socketserver
+import stat
+import sys
+import threading
+
+__all__ = (
+    "DEFAULT_SOCKET",
+    "ProgramCache",
+    "WildServer",
+)
+
+class ProgramCache:
+    """
+    Bounded cache of compiled programs.
+
+    Files are keyed by path and revalidated against their modification time
+    and size on every lookup; inline sources are keyed by their hash.
+    Concurrent runs can share one entry, as `CompiledProgram` allows.
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.capacity: int = capacity
+        self.entries: OrderedDict[Any, tuple[Any, CompiledProgram]] = OrderedDict()
+        self.lock: threading.Lock = threading.Lock()
+
+    def _lookup(self, key: Any, version: Any) -> CompiledProgram | None:
+        with self.lock:
+            entry: tuple[Any, CompiledProgram] | None = self.entries.get(key)
+            if entry is None or entry[0] != version:
+                return None
+
+            self.entries.move_to_end(key)
+            return entry[1]
+
+    def _store(self, key: Any, version: Any, program: CompiledProgram) -> CompiledProgram:
+        with self.lock:
+            self.entries[key] = (version, program)
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.capacity:
+                self.entries.popitem(last=False)
+
+        return program
+
+    def from_file(self, path: str) -> CompiledProgram:
+        path = os.path.abspath(path)
+        status: os.stat_result = os.stat(path)
+        version: tuple[int, int] = (status.st_mtime_ns, status.st_size)
+
+        program: CompiledProgram | None = self._lookup(path, version)
+        if program is None:
+            program = self._store(path, version, CompiledProgram.from_file(path))
+
+        return program
+
+    def from_source(self, source: str) -> CompiledProgram:
+        key: bytes = hashlib.sha256(source.encode()).digest()
+
+        program: CompiledProgram | None = self._lookup(key, None)
+        if program is None:
+            program = self._store(key, None, CompiledProgram.from_source(source))
+
+        return program
+
+class FrameWriter:
+    """Text stream that sends every write to the client as a `stdout` frame."""
+
+    def __init__(self, file: BinaryIO) -> None:
+        self.file: BinaryIO = file
+
+    def flush(self) -> None: self.file.flush()
+    def write(self, text: str) -> None: send(self.file, {"stdout": text})
+
+def private_directory(path: str) -> None:
+    """Create `path` readable only by this user, or check that an existing one is."""
+
+    os.makedirs(path, 0o700, exist_ok=True)
+    status: os.stat_result = os.lstat(path)
+
+    if not stat.S_ISDIR(status.st_mode) or status.st_uid != os.getuid() or status.st_mode & 0o077:
+        error: str = f"Socket directory \"{path}\" must be a directory only its owner can access"
+        raise PermissionError(error)
+
+def send(file: BinaryIO, frame: dict[str, Any]) -> None:
+    file.write(json.dumps(frame).encode() + b"\n")
+
+class RunHandler(socketserver.StreamRequestHandler):
+    """
+    Serves one connection: a JSON request line, answered by `stdout` frames
+    followed by one `exit` or `error` frame.
+
+    A request holds either `path` or `source`, plus optional `arguments`.
+    """
+
+    server: WildServer
+
+    def handle(self) -> None:
+        line: bytes = self.rfile.readline()
+        if not line:
+            return
+
+        output: Output = Output(stream=FrameWriter(self.wfile), policy=FlushPolicy.SIZE)
+
+        try:
+            request: dict[str, Any] = json.loads(line)
+            program: CompiledProgram = self.server.compile(request)
+            exit_code: int = program.run(budget=self.server.budget, output=output, arguments=request.get("arguments", ()))
+        except Exception as exception:
+            output.flush()
+            send(self.wfile, {"error": f"{type(exception).__name__}: {exception}"})
+        else:
+            send(self.wfile, {"exit": exit_code})
+
+class WildServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Daemon that runs Wild scripts for `wild.client` over a Unix socket.
+
+    The interpreter is imported and warmed once, and compiled programs are
+    cached, so a run only pays for the script itself. Each connection is
+    served on its own thread with a fresh `Interpreter`.
+    """
+
+    daemon_threads: bool = True
+
+    def __init__(self, path: str = DEFAULT_SOCKET, budget: Budget | None = None, cache: ProgramCache | None = None) -> None:
+        if os.path.dirname(os.path.abspath(path)) == os.path.abspath(RUNTIME_DIRECTORY):
+            private_directory(RUNTIME_DIRECTORY)
+
+        # A socket left behind by a previous server would make bind fail; anything else is not ours to remove.
+        if os.path.exists(path) and stat.S_ISSOCK(os.lstat(path).st_mode):
+            os.unlink(path)
+
+        # Bind under a umask, so the socket is never reachable by other users, not even before a chmod.
+        # The path is only recorded once bound, so a failed bind never removes what was already there.
+        self.path: str | None = None
+        umask: int = os.umask(0o177)
+        try:
+            super().__init__(path, RunHandler)
+        finally:
+            os.umask(umask)
+
+        self.path = path
+        self.budget: Budget | None = budget
+        self.cache: ProgramCache = cache or ProgramCache()
+
+        CompiledProgram.from_source("Int main() { return 0; }")
+
+    def compile(self, request: dict[str, Any]) -> CompiledProgram:
+        if "source" in request:
+            return self.cache.from_source(request["source"])
+
+        return self.cache.from_file(request["path"])
+
+    def server_close(self) -> None:
+        super().server_close()
+
+        if self.path is not None and os.path.exists(self.path):
+            os.unlink(self.path)
+
+def parse_args(args: list[str]) -> argparse.Namespace:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(prog=args[0], description="Serve Wild script runs over a Unix socket.")
+    parser.add_argument("-s", "--socket", default=DEFAULT_SOCKET, help=f"socket path (default: {DEFAULT_SOCKET})")
+    parser.add_argument("--steps", type=int, default=None, help="step budget for each run")
+    parser.add_argument("--seconds", type=float, default=None, help="time budget for each run")
+
+    return parser.parse_args(args[1:])
+
+def main(args: list[str]) -> int:
+    options: argparse.Namespace = parse_args(args)
+    budget: Budget = Budget(steps=options.steps, seconds=options.seconds)
+
+    with WildServer(options.socket, budget) as server:
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt: ...
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
\ No newline at end of file
@@ -1,4 +1,3 @@
-from dataclasses import dataclass
 from wild.type.base import RuntimeType
 
 __all__ = (
@@ -10,6 +9,6 @@ __all__ = (
 class BreakSignal(Exception):...
 class ContinueSignal(Exception):...
 
-@dataclass
 class ReturnSignal(Exception):
-    value: RuntimeType
\ No newline at end of file
+    def __init__(self, value: RuntimeType) -> None:
+        self.value: RuntimeType = value
\ No newline at end of file
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from wild.budget import Budget
+from wild.errors import InterpreterError
+from wild.interpreter import Interpreter
+from wild.natives.base import NativeFunction
+from wild.nodes.statement import Program
+from wild.output import Output
+from wild.type.base import RuntimeType
+from wild.type.map import Map
+from wild.type.strings import String
+
+import pickle
+
+__all__ = ("Snapshot",)
+
+SNAPSHOT_VERSION: int = 1
+
+def share(value: RuntimeType) -> RuntimeType:
+    """Flatten every string reachable from `value`, so interpreters on other threads can use it."""
+
+    if isinstance(value, String):
+        value.flatten()
+    elif isinstance(value, Map):
+        for key, item in value.value.values():
+            share(key)
+            share(item)
+
+    return value
+
+class Snapshot:
+    """
+    Global state of a program after its top-level code has run.
+
+    Apart from maps, runtime values are never mutated in place, since
+    assignment always binds a new value. That makes a shallow copy of the
+    globals a copy-on-write clone: restored interpreters share every value
+    until they rebind a name, and only get their own copy of each map.
+    Captured strings are flattened, so a snapshot can be restored on any
+    number of threads at once.
+    """
+
+    def __init__(self, globals: dict[str, RuntimeType]) -> None:
+        self.globals: dict[str, RuntimeType] = globals
+
+    @classmethod
+    def capture(cls, interpreter: Interpreter) -> Snapshot:
+        return cls({name: share(value) for name, value in interpreter.globals.items()})
+
+    @classmethod
+    def initialize(cls, program: Program, budget: Budget | None = None, output: Output | None = None) -> Snapshot:
+        interpreter: Interpreter = Interpreter(budget, output=output)
+        interpreter.initialize(program)
+
+        return cls.capture(interpreter)
+
+    @classmethod
+    def load(cls, path: str) -> Snapshot:
+        with open(path, "rb") as file:
+            version, globals = pickle.load(file)
+
+        if version != SNAPSHOT_VERSION:
+            error: str = f"Snapshot \"{path}\" has version {version}, expected {SNAPSHOT_VERSION}"
+            raise InterpreterError(error)
+
+        return cls(globals)
+
+    def restore(self, budget: Budget | None = None, output: Output | None = None) -> Interpreter:
+        interpreter: Interpreter = Interpreter(budget, output=output)
+        interpreter.globals.update({
+            name: value.copy() if isinstance(value, Map) else value
+            for name, value in self.globals.items()
+        })
+
+        return interpreter
+
+    def run(self, budget: Budget | None = None, output: Output | None = None) -> int:
+        return self.restore(budget, output).call_main()
+
+    def save(self, path: str) -> None:
+        # Natives are supplied again by the interpreter that restores the snapshot.
+        globals: dict[str, RuntimeType] = {
+            name: value for name, value in self.globals.items()
+            if not isinstance(value, NativeFunction)
+        }
+
+        with open(path, "wb") as file:
+            pickle.dump((SNAPSHOT_VERSION, globals), file, protocol=pickle.HIGHEST_PROTOCOL)
\ No newline at end of file
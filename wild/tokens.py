@@ -8,22 +8,25 @@ class TokenType(StrEnum):
     NEWLINE      = r"\n"
     COMMENT      = r"//.*|/\*[\s\S]*?\*/"
     
-    BREAK    = "break"
-    CONTINUE = "continue"
-    ELSE     = "else"
-    FALSE    = "false"
-    FOR      = "for"
-    IF       = "if"
-    NULL     = "null"
-    RETURN   = "return"
-    TRUE     = "true"
-    VOID     = "void"
-    WHILE    = "while"
+    BREAK    = r"break\b"
+    CONTINUE = r"continue\b"
+    ELSE     = r"else\b"
+    FALSE    = r"false\b"
+    FOR      = r"for\b"
+    IF       = r"if\b"
+    NULL     = r"null\b"
+    PARALLEL = r"parallel\b"
+    RETURN   = r"return\b"
+    TRUE     = r"true\b"
+    VOID     = r"void\b"
+    WHILE    = r"while\b"
     
-    TYPE_FLOAT   = "Float"
-    TYPE_INT     = "Int"
-    TYPE_STRING  = "String"
-    TYPE_BOOLEAN = "Boolean"
+    TYPE_FLOAT   = r"Float\b"
+    TYPE_INT     = r"Int\b"
+    TYPE_STRING  = r"String\b"
+    TYPE_BOOLEAN = r"Boolean\b"
+    TYPE_STREAM  = r"Stream\b"
+    TYPE_MAP     = r"Map\b"
 
     FLOAT_LITERAL  = r"\d+\.\d+([eE][+-]?\d+)?"
     INT_LITERAL    = r"\d+"
@@ -38,12 +41,12 @@ class TokenType(StrEnum):
     MOD_EQ       = r"%="
     LESS_EQ      = "<="
     GREATER_EQ   = ">="
-    AND          = r"&&|and"
-    OR           = r"\|\||or"
+    AND          = r"&&|and\b"
+    OR           = r"\|\||or\b"
     PLUS_PLUS    = r"\+\+"
     MINUS_MINUS  = "--"
     
-    NOT          = r"!|not"
+    NOT          = r"!|not\b"
     PLUS         = r"\+"
     MINUS        = r"-"
     MULT         = r"\*"
@@ -1,5 +1,4 @@
 from wild.errors import *
-from dataclasses import dataclass
 from typing import Any
 
 __all__ = ("RuntimeType",)
@@ -7,7 +6,7 @@ __all__ = ("RuntimeType",)
 def validate_arguments(expected: int, types: list[type[RuntimeType]], arguments: list[RuntimeType]) -> None:
     arg_len: int = len(arguments)
     if arg_len != expected:
-        error: str = f"Expected {expected} argument{'s' if len(expected) > 1 else ''}, got {arg_len}"
+        error: str = f"Expected {expected} argument{'s' if expected != 1 else ''}, got {arg_len}"
         raise ArgumentCountError(error)
     
     for index, (arg_type, arg) in enumerate(zip(types, arguments)):
@@ -17,7 +16,7 @@ def validate_arguments(expected: int, types: list[type[RuntimeType]], arguments:
         error: str = f"Argument #{index + 1} must be {arg_type.__name__}, got {arg.__class__.__name__}"
         raise ArgumentTypeError(error)
 
-@dataclass
 class RuntimeType:
     value: Any
+    def __init__(self, value: Any) -> None: self.value = value
     def __repr__(self) -> str: return f"{self.value}"
\ No newline at end of file
@@ -1,14 +1,13 @@
 from wild.type.base import RuntimeType
-from dataclasses import dataclass
 
 __all__ = ("Boolean",)
 
-@dataclass
 class Boolean(RuntimeType):
     """State of `true`/`false`."""
     
     value: bool
     def __bool__(self) -> Boolean: return self.value
+    def __eq__(self, other: RuntimeType) -> Boolean: return Boolean(isinstance(other, Boolean) and self.value == other.value)
     def __and__(self, other: Boolean) -> Boolean: return Boolean(self.value and other.value)
     def __or__(self, other: Boolean) -> Boolean: return Boolean(self.value or other.value)
     def __invert__(self) -> Boolean: return Boolean(not self.value)
\ No newline at end of file
@@ -1,19 +1,21 @@
 from wild.type.base import RuntimeType
-from dataclasses import dataclass
+from wild.type.boolean import Boolean
 
 __all__ = (
     "Null",
     "Void",
 )
 
-@dataclass
 class Null(RuntimeType):
     """Represents a value that doesn't contain anything."""
 
-    value: None = None
+    value: None
+    def __init__(self, value: None = None) -> None: self.value = value
+    def __eq__(self, other: RuntimeType) -> Boolean: return Boolean(isinstance(other, Null))
 
-@dataclass
 class Void(RuntimeType):
     """No value exists."""
 
-    value: None = None
\ No newline at end of file
+    value: None
+    def __init__(self, value: None = None) -> None: self.value = value
+    def __eq__(self, other: RuntimeType) -> Boolean: return Boolean(isinstance(other, Void))
\ No newline at end of file
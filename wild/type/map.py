@@ -0,0 +1,152 @@
+from wild.type.base import validate_arguments, RuntimeType
+from wild.type.boolean import Boolean
+from wild.type.empty import Null, Void
+from wild.type.numeric import Float, Integer
+from wild.type.strings import String
+from wild.errors import ArgumentTypeError, SubscriptError
+from wild.natives.base import NativeMethod
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from interpreter import Interpreter
+
+__all__ = ("Map",)
+
+KEY_TYPES: tuple[type[RuntimeType], ...] = (Boolean, Float, Integer, String)
+
+def map_key(key: RuntimeType) -> tuple[type[RuntimeType], Any]:
+    """
+    Hashable identity of a key.
+
+    Runtime values compare through `Boolean`-returning `__eq__` and are not
+    hashable themselves, so the dict is keyed by `(type, value)` instead. The
+    type tag keeps `1`, `1.0` and `true` as distinct keys.
+    """
+
+    if not isinstance(key, KEY_TYPES):
+        error: str = f"Map keys must be Int, Float, String or Boolean, got {key.__class__.__name__}"
+        raise ArgumentTypeError(error)
+
+    return type(key), key.value
+
+class Map(RuntimeType):
+    """Hash map from `Int`, `Float`, `String` or `Boolean` keys to any value."""
+
+    value: dict[tuple[type[RuntimeType], Any], tuple[RuntimeType, RuntimeType]]
+
+    def __init__(self, value: dict[tuple[type[RuntimeType], Any], tuple[RuntimeType, RuntimeType]] | None = None) -> None:
+        self.value = value if value is not None else {}
+        self._entries: list[tuple[RuntimeType, RuntimeType]] | None = None
+
+    # Maps are mutable, so two maps are only equal when they are the same map.
+    def __eq__(self, other: RuntimeType) -> Boolean: return Boolean(self is other)
+    def __repr__(self) -> str: return "{" + ", ".join(f"{key!r}: {value!r}" for key, value in self.value.values()) + "}"
+
+    def copy(self) -> Map:
+        """Copy the map and every map nested inside it, sharing the immutable values."""
+
+        return Map({
+            key: (entry_key, value.copy() if isinstance(value, Map) else value)
+            for key, (entry_key, value) in self.value.items()
+        })
+
+    def _entry(self, index: RuntimeType) -> tuple[RuntimeType, RuntimeType]:
+        # Positional access reuses one snapshot of the entries until the map is next written.
+        if self._entries is None:
+            self._entries = list(self.value.values())
+
+        if not 0 <= index.value < len(self._entries):
+            error: str = f"Index {index.value} out of range for Map of size {len(self._entries)}"
+            raise SubscriptError(error)
+
+        return self._entries[index.value]
+
+    @staticmethod
+    def _clear(_: Interpreter, instance: Map, args: list[RuntimeType]) -> Void:
+        validate_arguments(0, [], args)
+        instance.value.clear()
+        instance._entries = None
+
+        return Void()
+
+    @staticmethod
+    def _contains(_: Interpreter, instance: Map, args: list[RuntimeType]) -> Boolean:
+        validate_arguments(1, [RuntimeType], args)
+        return Boolean(map_key(args[0]) in instance.value)
+
+    @staticmethod
+    def _get(_: Interpreter, instance: Map, args: list[RuntimeType]) -> RuntimeType:
+        validate_arguments(1, [RuntimeType], args)
+        entry: tuple[RuntimeType, RuntimeType] | None = instance.value.get(map_key(args[0]))
+
+        return entry[1] if entry is not None else Null()
+
+    @staticmethod
+    def _getOrDefault(_: Interpreter, instance: Map, args: list[RuntimeType]) -> RuntimeType:
+        validate_arguments(2, [RuntimeType, RuntimeType], args)
+        entry: tuple[RuntimeType, RuntimeType] | None = instance.value.get(map_key(args[0]))
+
+        return entry[1] if entry is not None else args[1]
+
+    @staticmethod
+    def _isEmpty(_: Interpreter, instance: Map, args: list[RuntimeType]) -> Boolean:
+        validate_arguments(0, [], args)
+        return Boolean(not instance.value)
+
+    @staticmethod
+    def _keyAt(_: Interpreter, instance: Map, args: list[RuntimeType]) -> RuntimeType:
+        validate_arguments(1, [Integer], args)
+        return instance._entry(args[0])[0]
+
+    @staticmethod
+    def _put(_: Interpreter, instance: Map, args: list[RuntimeType]) -> Void:
+        validate_arguments(2, [RuntimeType, RuntimeType], args)
+        instance.value[map_key(args[0])] = (args[0], args[1])
+        instance._entries = None
+
+        return Void()
+
+    @staticmethod
+    def _putAll(_: Interpreter, instance: Map, args: list[RuntimeType]) -> Void:
+        validate_arguments(1, [Map], args)
+        instance.value.update(args[0].value)
+        instance._entries = None
+
+        return Void()
+
+    @staticmethod
+    def _remove(_: Interpreter, instance: Map, args: list[RuntimeType]) -> Boolean:
+        validate_arguments(1, [RuntimeType], args)
+        entry: tuple[RuntimeType, RuntimeType] | None = instance.value.pop(map_key(args[0]), None)
+
+        if entry is None:
+            return Boolean(False)
+
+        instance._entries = None
+        return Boolean(True)
+
+    @staticmethod
+    def _size(_: Interpreter, instance: Map, args: list[RuntimeType]) -> Integer:
+        validate_arguments(0, [], args)
+        return Integer(len(instance.value))
+
+    @staticmethod
+    def _valueAt(_: Interpreter, instance: Map, args: list[RuntimeType]) -> RuntimeType:
+        validate_arguments(1, [Integer], args)
+        return instance._entry(args[0])[1]
+
+    def get_method(self, name: str) -> NativeMethod | None:
+        match name:
+            case "clear": return NativeMethod(self, 0, Map._clear)
+            case "contains": return NativeMethod(self, 1, Map._contains)
+            case "get": return NativeMethod(self, 1, Map._get)
+            case "getOrDefault": return NativeMethod(self, 2, Map._getOrDefault)
+            case "isEmpty": return NativeMethod(self, 0, Map._isEmpty)
+            case "keyAt": return NativeMethod(self, 1, Map._keyAt)
+            case "put": return NativeMethod(self, 2, Map._put)
+            case "putAll": return NativeMethod(self, 1, Map._putAll)
+            case "remove": return NativeMethod(self, 1, Map._remove)
+            case "size": return NativeMethod(self, 0, Map._size)
+            case "valueAt": return NativeMethod(self, 1, Map._valueAt)
+
+        return None
\ No newline at end of file
@@ -1,6 +1,5 @@
 from wild.type.base import RuntimeType
 from wild.type.boolean import Boolean
-from dataclasses import dataclass
 
 __all__ = (
     "Float",
@@ -22,13 +21,11 @@ class Numeric(RuntimeType):
     def __eq__(self, o): return Boolean(self.value == self._get_val(o))
     def __ne__(self, o): return Boolean(self.value != self._get_val(o))
 
-@dataclass
 class Float(Numeric):
     """64-bit floating decimal number."""
 
     value: float
 
-@dataclass
 class Integer(Numeric):
     """32-bit, signed integer."""
     
@@ -0,0 +1,118 @@
+from wild.type.base import validate_arguments, RuntimeType
+from wild.type.boolean import Boolean
+from wild.type.empty import Null, Void
+from wild.type.numeric import Integer
+from wild.type.strings import String
+from wild.errors import ArgumentTypeError, CallError
+from wild.natives.base import NativeMethod
+from typing import Any, TYPE_CHECKING
+
+import codecs
+
+if TYPE_CHECKING:
+    from interpreter import Interpreter
+
+__all__ = ("Stream",)
+
+class Stream(RuntimeType):
+    """
+    Lazily read source of text, such as a file or standard input.
+
+    `value` is any binary reader with `readline` and `read`, including an
+    `mmap`. Nothing is read ahead of the caller except one line for
+    `hasLine`, so memory stays constant however large the source is.
+    """
+
+    def __init__(self, value: Any, name: str, owned: tuple[Any, ...] = ()) -> None:
+        self.value: Any = value
+        self.name: str = name
+        self.closed: bool = False
+
+        self._owned: tuple[Any, ...] = owned
+        self._pending: bytes | None = None
+        self._decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+    def __eq__(self, other: RuntimeType) -> Boolean: return Boolean(self is other)
+    def __repr__(self) -> str: return f"<stream {self.name}>"
+
+    def _check_open(self) -> None:
+        if self.closed:
+            error: str = f"Stream {self.name} is closed"
+            raise CallError(error)
+
+    def _take_pending(self) -> bytes:
+        pending: bytes = self._pending or b""
+        self._pending = None
+
+        return pending
+
+    @staticmethod
+    def _close(_: Interpreter, instance: Stream, args: list[RuntimeType]) -> Void:
+        validate_arguments(0, [], args)
+
+        if not instance.closed:
+            instance.closed = True
+            for resource in (instance.value, *instance._owned):
+                resource.close()
+
+        return Void()
+
+    @staticmethod
+    def _hasLine(_: Interpreter, instance: Stream, args: list[RuntimeType]) -> Boolean:
+        validate_arguments(0, [], args)
+        instance._check_open()
+
+        if instance._pending is None:
+            instance._pending = instance.value.readline()
+
+        return Boolean(instance._pending != b"")
+
+    @staticmethod
+    def _read(_: Interpreter, instance: Stream, args: list[RuntimeType]) -> String:
+        validate_arguments(1, [Integer], args)
+        instance._check_open()
+
+        size: int = args[0].value
+        if size < 0:
+            error: str = f"Chunk size must not be negative, got {size}"
+            raise ArgumentTypeError(error)
+
+        data: bytes = instance._take_pending()
+        if len(data) > size:
+            data, instance._pending = data[:size], data[size:]
+        else:
+            data += instance.value.read(size - len(data))
+
+        # Only an empty read of a non-empty chunk is the end of the source; finalizing
+        # any earlier would drop a character split across two chunks.
+        return String(instance._decoder.decode(data, final=size > 0 and not data))
+
+    @staticmethod
+    def _readAll(_: Interpreter, instance: Stream, args: list[RuntimeType]) -> String:
+        validate_arguments(0, [], args)
+        instance._check_open()
+
+        data: bytes = instance._take_pending() + instance.value.read()
+        return String(instance._decoder.decode(data, final=True))
+
+    @staticmethod
+    def _readLine(_: Interpreter, instance: Stream, args: list[RuntimeType]) -> String | Null:
+        validate_arguments(0, [], args)
+        instance._check_open()
+
+        line: bytes = instance._take_pending() or instance.value.readline()
+        text: str = instance._decoder.decode(line, final=not line.endswith(b"\n"))
+        if not text:
+            return Null()
+
+        return String(text.rstrip("\r\n"))
+
+    def get_method(self, name: str) -> NativeMethod | None:
+        match name:
+            case "close": return NativeMethod(self, 0, Stream._close)
+            case "hasLine": return NativeMethod(self, 0, Stream._hasLine)
+            case "read": return NativeMethod(self, 1, Stream._read)
+            case "readAll": return NativeMethod(self, 0, Stream._readAll)
+            case "readLine": return NativeMethod(self, 0, Stream._readLine)
+
+        return None
\ No newline at end of file
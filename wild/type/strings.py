@@ -3,20 +3,146 @@ from wild.type.boolean import Boolean
 from wild.type.numeric import Float, Integer
 from wild.errors import ConversionError
 from wild.natives.base import NativeMethod
-from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import functools
+import re
+
 if TYPE_CHECKING:
     from interpreter import Interpreter
+    from wild.type.map import Map
+
+__all__ = (
+    "PATTERN_CACHE_SIZE",
+    "String",
+    "compile_pattern",
+)
+
+NON_WHITESPACE: re.Pattern[str] = re.compile(r"\S")
+
+# Distinct patterns kept compiled across all interpreters in the process.
+PATTERN_CACHE_SIZE: int = 256
 
-__all__ = ("String",)
+@functools.lru_cache(maxsize=PATTERN_CACHE_SIZE)
+def compile_pattern(pattern: str) -> re.Pattern[str]:
+    try:
+        return re.compile(pattern)
+    except re.error as exception:
+        error: str = f"Invalid pattern \"{pattern}\": {exception}"
+        raise ConversionError(error)
+
+def indexed(strings: list[String]) -> Map:
+    from wild.type.map import Map
+
+    return Map({(Integer, index): (Integer(index), string) for index, string in enumerate(strings)})
 
-@dataclass
 class String(RuntimeType):
-    """Character or string of characters."""
+    """
+    Character or string of characters.
+
+    Concatenation builds a rope: pieces are appended to a list that is shared
+    with the left operand, and the contiguous `value` is only joined when
+    something reads it. A string may extend the shared list in place only if
+    it owns the list's tail. Otherwise it forks a copy first, so strings stay
+    immutable while `s = s + piece` loops append in amortized O(1).
+
+    `substring` and `trim` return views: an offset and length into the
+    parent's buffer. `find`, `contains`, `startsWith` and `endsWith` search
+    that window in place, and a view is only copied out once its `value` is
+    read. The regex methods match over the same window when it starts the
+    buffer, and return the matched pieces as views of it.
+
+    Reading `value` is safe from any thread, but appending to a rope is not,
+    since it claims the shared list's tail. Strings that several threads can
+    reach are `flatten`ed first, after which every append forks a new list.
+    """
+
+    def __init__(self, value: str) -> None:
+        self._flat: str | None = value
+        self._parts: list[str] | None = None
+        self._count: int = 0
+        self._source: str | None = None
+        self._start: int = 0
+        self._length: int = len(value)
+
+    @classmethod
+    def _rope(cls, parts: list[str], length: int) -> String:
+        string: String = cls.__new__(cls)
+        string._flat = None
+        string._parts = parts
+        string._count = len(parts)
+        string._source = None
+        string._start = 0
+        string._length = length
+
+        return string
+
+    def _span(self) -> tuple[str, int, int]:
+        if self._source is not None:
+            return self._source, self._start, self._start + self._length
+        
+        return self.value, 0, self._length
+
+    def _subject(self) -> tuple[str, int, int]:
+        # `^` and lookbehinds would see the buffer before a view's start, so those views are matched on a copy.
+        source, start, end = self._span()
+        return (source, start, end) if start == 0 else (self.value, 0, self._length)
+
+    @classmethod
+    def _view(cls, source: str, start: int, end: int) -> String:
+        string: String = cls.__new__(cls)
+        string._flat = None
+        string._parts = None
+        string._count = 0
+        string._source = source
+        string._start = start
+        string._length = end - start
+
+        return string
+
+    @property
+    def value(self) -> str:
+        flat: str | None = self._flat
+        if flat is not None:
+            return flat
+
+        source: str | None = self._source
+        parts: list[str] | None = self._parts
+
+        # Another thread may have flattened the string between the reads; it publishes `_flat` before clearing the rest.
+        flat = self._flat
+        if flat is not None:
+            return flat
+
+        if source is not None:
+            flat = source[self._start:self._start + self._length]
+        else:
+            flat = "".join(parts if self._count == len(parts) else parts[:self._count])
+
+        self._flat = flat
+        self._source = None
+        self._parts = None
+
+        return flat
+
+    def flatten(self) -> String:
+        """Drop the rope or view in favour of a flat copy, so the string can be shared between threads."""
+
+        self.value
+        return self
+
+    def __add__(self, other: String) -> String:
+        piece: str = other.value
+        parts: list[str] | None = self._parts
+
+        if parts is None:
+            parts = [self.value]
+        elif self._count != len(parts):
+            parts = parts[:self._count]
+        
+        parts.append(piece)
+        return String._rope(parts, self._length + len(piece))
 
-    value: str
-    def __add__(self, other: String) -> String: return String(self.value + other.value)
     def __eq__(self, other: RuntimeType) -> Boolean: return Boolean(self.value == other.value)
     def __repr__(self) -> str: return f"\"{self.value}\""
 
@@ -28,44 +154,101 @@ class String(RuntimeType):
     @staticmethod
     def _contains(_: Interpreter, instance: String, args: list[RuntimeType]) -> Boolean:
         validate_arguments(1, [String], args)
-        return Boolean(args[0].value in instance.value)
+        source, start, end = instance._span()
+
+        return Boolean(source.find(args[0].value, start, end) != -1)
 
     @staticmethod
     def _endsWith(_: Interpreter, instance: String, args: list[RuntimeType]) -> Boolean:
         validate_arguments(1, [String], args)
-        return Boolean(instance.value.endswith(args[0].value))
+        source, start, end = instance._span()
+
+        return Boolean(source.endswith(args[0].value, start, end))
 
     @staticmethod
     def _find(_: Interpreter, instance: String, args: list[RuntimeType]) -> Integer:
         validate_arguments(1, [String], args)
-        return Integer(instance.value.find(args[0].value))
+        source, start, end = instance._span()
+        index: int = source.find(args[0].value, start, end)
+
+        return Integer(index - start if index != -1 else -1)
+
+    @staticmethod
+    def _findAll(_: Interpreter, instance: String, args: list[RuntimeType]) -> Map:
+        validate_arguments(1, [String], args)
+        source, start, end = instance._subject()
+        pattern: re.Pattern[str] = compile_pattern(args[0].value)
+
+        return indexed([String._view(source, *match.span()) for match in pattern.finditer(source, start, end)])
 
     @staticmethod
     def _isEmpty(_: Interpreter, instance: String, args: list[RuntimeType]) -> Boolean:
         validate_arguments(0, [], args)
-        return Boolean(len(instance.value) == 0)
+        return Boolean(instance._length == 0)
     
     @staticmethod
     def _length(_: Interpreter, instance: String, args: list[RuntimeType]) -> Integer:
         validate_arguments(0, [], args)
-        return Integer(len(instance.value))
+        return Integer(instance._length)
     
+    @staticmethod
+    def _matches(_: Interpreter, instance: String, args: list[RuntimeType]) -> Boolean:
+        validate_arguments(1, [String], args)
+        source, start, end = instance._subject()
+
+        return Boolean(compile_pattern(args[0].value).fullmatch(source, start, end) is not None)
+
     @staticmethod
     def _replace(_: Interpreter, instance: String, args: list[RuntimeType]) -> String:
         validate_arguments(2, [String, String], args)
         return String(instance.value.replace(args[0].value, args[1].value))
 
+    @staticmethod
+    def _replaceRegex(_: Interpreter, instance: String, args: list[RuntimeType]) -> String:
+        validate_arguments(2, [String, String], args)
+        pattern: re.Pattern[str] = compile_pattern(args[0].value)
+
+        try:
+            return String(pattern.sub(args[1].value, instance.value))
+        except re.error as exception:
+            error: str = f"Invalid replacement \"{args[1].value}\": {exception}"
+            raise ConversionError(error)
+
+    @staticmethod
+    def _search(_: Interpreter, instance: String, args: list[RuntimeType]) -> Integer:
+        validate_arguments(1, [String], args)
+        source, start, end = instance._subject()
+        match: re.Match[str] | None = compile_pattern(args[0].value).search(source, start, end)
+
+        return Integer(match.start() - start if match is not None else -1)
+
+    @staticmethod
+    def _splitRegex(_: Interpreter, instance: String, args: list[RuntimeType]) -> Map:
+        validate_arguments(1, [String], args)
+        source, start, end = instance._subject()
+        pieces: list[String] = []
+
+        for match in compile_pattern(args[0].value).finditer(source, start, end):
+            pieces.append(String._view(source, start, match.start()))
+            start = match.end()
+
+        pieces.append(String._view(source, start, end))
+        return indexed(pieces)
+
     @staticmethod
     def _substring(_: Interpreter, instance: String, args: list[RuntimeType]) -> String:
         validate_arguments(2, [Integer, Integer], args)
-        start: int = args[0].value
+        source, offset, end = instance._span()
 
-        return String(instance.value[start:start + args[1].value])
+        start, stop, _ = slice(args[0].value, args[0].value + args[1].value).indices(end - offset)
+        return String._view(source, offset + start, offset + max(start, stop))
     
     @staticmethod
     def _startsWith(_: Interpreter, instance: String, args: list[RuntimeType]) -> Boolean:
         validate_arguments(1, [String], args)
-        return Boolean(instance.value.startswith(args[0].value))
+        source, start, end = instance._span()
+
+        return Boolean(source.startswith(args[0].value, start, end))
     
     @staticmethod
     def _toFloat(_: Interpreter, instance: String, args: list[RuntimeType]) -> Float:
@@ -100,7 +283,17 @@ class String(RuntimeType):
     @staticmethod
     def _trim(_: Interpreter, instance: String, args: list[RuntimeType]) -> String:
         validate_arguments(0, [], args)
-        return String(instance.value.strip())
+        source, start, end = instance._span()
+
+        first: re.Match[str] | None = NON_WHITESPACE.search(source, start, end)
+        if first is None:
+            return String("")
+        
+        start = first.start()
+        while source[end - 1].isspace():
+            end -= 1
+        
+        return String._view(source, start, end)
 
     def get_method(self, name: str) -> NativeMethod | None:
         match name:
@@ -108,9 +301,14 @@ class String(RuntimeType):
             case "contains": return NativeMethod(self, 1, String._contains)
             case "endsWith": return NativeMethod(self, 1, String._endsWith)
             case "find": return NativeMethod(self, 1, String._find)
+            case "findAll": return NativeMethod(self, 1, String._findAll)
             case "isEmpty": return NativeMethod(self, 0, String._isEmpty)
             case "length": return NativeMethod(self, 0, String._length)
+            case "matches": return NativeMethod(self, 1, String._matches)
             case "replace": return NativeMethod(self, 2, String._replace)
+            case "replaceRegex": return NativeMethod(self, 2, String._replaceRegex)
+            case "search": return NativeMethod(self, 1, String._search)
+            case "splitRegex": return NativeMethod(self, 1, String._splitRegex)
             case "substring": return NativeMethod(self, 2, String._substring)
             case "startsWith": return NativeMethod(self, 1, String._startsWith)
             case "toFloat": return NativeMethod(self, 0, String._toFloat)